@@ -3,12 +3,241 @@ Utility functions.
 """
 
 
-from numpy import ndarray
+from time import perf_counter
 from pandas import DataFrame
+from sklearn.base import clone
+from typing import Any, Callable, Literal
+from numpy import ndarray, mean, std
+from joblib import Parallel, delayed
 from sklearn.model_selection import KFold
 from sklearn.metrics import root_mean_squared_error
 
 
+class CrossValidationResult:
+    """
+    Per-fold results of a model cross-validation.
+
+    :Attributes:
+        metrics_names (list[str]): Names of evaluated metrics.
+        fit_times (list[float]): Model fit time of every fold in seconds.
+        train_scores (dict[str, list[float]]): Metrics values on train folds
+                                               by metric name.
+        test_scores (dict[str, list[float]]): Metrics values on test folds by
+                                              metric name.
+    """
+
+    def __init__(
+        self,
+        metrics_names: list[str],
+        folds_results: list[dict[str, Any]]
+    ) -> None:
+        """
+        Initializes `CrossValidationResult` with folds results.
+
+        :Parameters:
+            metrics_names (list[str]): Names of evaluated metrics.
+            folds_results (list[dict[str, Any]]): Results of `evaluate_fold()`
+                                                  in order of folds.
+        """
+
+        self.metrics_names: list[str] = metrics_names
+        self.fit_times: list[float] = [
+            fold_results["fit_time"] for fold_results in folds_results
+        ]
+        self.train_scores: dict[str, list[float]] = {
+            metric_name: [
+                fold_results["train"][metric_name]
+                for fold_results in folds_results
+            ]
+            for metric_name in metrics_names
+        }
+        self.test_scores: dict[str, list[float]] = {
+            metric_name: [
+                fold_results["test"][metric_name]
+                for fold_results in folds_results
+            ]
+            for metric_name in metrics_names
+        }
+
+    def get_mean_score(
+        self,
+        metric_name: str,
+        subset: Literal["train", "test", ] = "test"
+    ) -> float:
+        """
+        Returns mean metric value over folds.
+
+        :Parameters:
+            metric_name (str): Name of the metric.
+            subset (Literal["train", "test", ]): Folds subset.
+                                                 Default: "test".
+
+        :Returns:
+            float: Mean metric value.
+        """
+
+        scores: dict[str, list[float]] = self.train_scores \
+            if subset == "train" else self.test_scores
+
+        return float(mean(scores[metric_name], ), )
+
+    def get_std_score(
+        self,
+        metric_name: str,
+        subset: Literal["train", "test", ] = "test"
+    ) -> float:
+        """
+        Returns standard deviation of metric values over folds.
+
+        :Parameters:
+            metric_name (str): Name of the metric.
+            subset (Literal["train", "test", ]): Folds subset.
+                                                 Default: "test".
+
+        :Returns:
+            float: Standard deviation of metric values.
+        """
+
+        scores: dict[str, list[float]] = self.train_scores \
+            if subset == "train" else self.test_scores
+
+        return float(std(scores[metric_name], ), )
+
+    def to_dataframe(self) -> DataFrame:
+        """
+        Returns folds results as a Pandas dataframe.
+
+        :Returns:
+            DataFrame: One row per fold with fit time and train/test metrics
+                       values.
+        """
+
+        return DataFrame({
+            "fit_time": self.fit_times,
+            **{
+                f"train_{metric_name}": self.train_scores[metric_name]
+                for metric_name in self.metrics_names
+            },
+            **{
+                f"test_{metric_name}": self.test_scores[metric_name]
+                for metric_name in self.metrics_names
+            },
+        }, )
+
+
+def evaluate_fold(
+    model: Any,
+    X: DataFrame,
+    y: ndarray,
+    train_idx: ndarray,
+    test_idx: ndarray,
+    metrics_funcs: dict[str, Callable[..., float]]
+) -> dict[str, Any]:
+    """
+    Fits a model copy on a train fold and evaluates metrics on both folds.
+
+    Every fold is predicted once and all metrics reuse the predictions.
+
+    :Parameters:
+        model (Any): A compatible unfitted model.
+        X (DataFrame): Feature matrix.
+        y (ndarray): Target values.
+        train_idx (ndarray): Train fold rows positions.
+        test_idx (ndarray): Test fold rows positions.
+        metrics_funcs (dict[str, Callable[..., float]]): Metrics functions
+                                                        `(y_true, y_pred)` by
+                                                        metric name.
+
+    :Returns:
+        dict[str, Any]: Fit time and train/test metrics values.
+    """
+
+    X_train, X_test = X.iloc[train_idx], X.iloc[test_idx]
+    y_train, y_test = y.iloc[train_idx], y.iloc[test_idx]
+    fold_model: Any = clone(model, )
+    start: float = perf_counter()
+
+    fold_model.fit(X_train, y_train, )
+
+    fit_time: float = perf_counter() - start
+    y_train_pred: ndarray = fold_model.predict(X_train, )
+    y_test_pred: ndarray = fold_model.predict(X_test, )
+
+    return {
+        "fit_time": fit_time,
+        "train": {
+            metric_name: float(metric_func(y_train, y_train_pred, ), )
+            for metric_name, metric_func in metrics_funcs.items()
+        },
+        "test": {
+            metric_name: float(metric_func(y_test, y_test_pred, ), )
+            for metric_name, metric_func in metrics_funcs.items()
+        },
+    }
+
+
+def cross_validate_model(
+    model: Any,
+    X: DataFrame,
+    y: ndarray,
+    metrics_funcs: dict[str, Callable[..., float]],
+    num_of_splits: int = 10,
+    n_jobs: int = -1
+) -> CrossValidationResult | None:
+    """
+    Evaluates a model with K-Fold cross-validation running folds in parallel.
+
+    :Parameters:
+        model (Any): A compatible model, it is not fitted in place.
+        X (DataFrame): Feature matrix.
+        y (ndarray): Target values.
+        metrics_funcs (dict[str, Callable[..., float]]): Metrics functions
+                                                        `(y_true, y_pred)` by
+                                                        metric name.
+        num_of_splits (int): Number of folds for K-Fold validation.
+                             Default: 10.
+        n_jobs (int): Number of parallel jobs.
+                      Default: -1 (all processors).
+
+    :Returns:
+        CrossValidationResult: Per-fold results.
+        None: If error occurs or no data is loaded.
+
+    :Exceptions:
+        ValueError: When used invalid data format.
+        TypeError: When used model does not implement required methods.
+        Exception: All other errors.
+    """
+
+    k_fold: KFold = KFold(
+        shuffle=True,
+        random_state=21,
+        n_splits=num_of_splits,
+    )
+
+    try:
+        return CrossValidationResult(
+            list(metrics_funcs, ),
+            Parallel(n_jobs=n_jobs, )(
+                delayed(evaluate_fold, )(
+                    model,
+                    X,
+                    y,
+                    train_idx,
+                    test_idx,
+                    metrics_funcs,
+                )
+                for train_idx, test_idx in k_fold.split(X, )
+            ),
+        )
+    except ValueError as val_err:
+        print("ValueError:", val_err, )
+    except TypeError as type_err:
+        print("TypeError:", type_err, )
+    except Exception as err:
+        print("Exception:", err, )
+
+
 def print_regression_model_cross_validation(
     X: DataFrame,
     y: ndarray,
@@ -27,55 +256,27 @@ def print_regression_model_cross_validation(
                         Default: 10.
     """
 
-    k_fold: KFold = KFold(
-        n_splits=n_splits,
-        random_state=21,
-        shuffle=True,
+    cv_result: CrossValidationResult | None = cross_validate_model(
+        reg_model,
+        X,
+        y,
+        {"rmse": root_mean_squared_error, },
+        n_splits,
     )
     rmses: list[float] = []
 
-    for train_idx, test_idx in k_fold.split(X, ):
-        X_train, X_test = X.iloc[train_idx], X.iloc[test_idx]
-        y_train, y_test = y.iloc[train_idx], y.iloc[test_idx]
-
-        reg_model.fit(X_train, y_train, )
-        rmses.append(
-            round(
-                root_mean_squared_error(
-                    reg_model.predict(X_test, ),
-                    y_test,
-                ),
-                3,
-            ),
-        )
-        rmses.append(
-            round(
-                root_mean_squared_error(
-                    reg_model.predict(X_train, ),
-                    y_train,
-                ),
-                3,
-            ),
-        )
+    if cv_result is None:
+        return
+
+    for train_rmse, test_rmse in zip(
+        cv_result.train_scores["rmse"],
+        cv_result.test_scores["rmse"],
+    ):
+        rmses.append(round(test_rmse, 3, ), )
+        rmses.append(round(train_rmse, 3, ), )
         print(
-            f"train RMSE - {
-                round(
-                    root_mean_squared_error(
-                        reg_model.predict(X_train, ),
-                        y_train,
-                    ),
-                    3,
-                )
-            } " +
-            f"| test RMSE - {
-                round(
-                    root_mean_squared_error(
-                        reg_model.predict(X_test, ),
-                        y_test,
-                    ),
-                    3,
-                )
-            }",
+            f"train RMSE - {round(train_rmse, 3, )} " +
+            f"| test RMSE - {round(test_rmse, 3, )}",
         )
 
     print(
@@ -3,44 +3,138 @@ A collection of components for building machine learning pipelines.
 """
 
 
-from typing import Any
-from joblib import dump
+import os
+
 from tqdm.notebook import tqdm
-from numpy import ndarray, prod
-from pandas import DataFrame, concat
+from numpy.random import default_rng
+from numpy import ndarray, concatenate, unique
+from typing import Any, Iterable, Iterator, Literal
+from pandas.arrays import SparseArray
+from pandas import (
+    Index,
+    Series,
+    DataFrame,
+    Categorical,
+    concat,
+    read_csv,
+)
+from joblib import dump, load, hash as joblib_hash
 from sklearn.metrics import accuracy_score
-from sklearn.preprocessing import OneHotEncoder
-from sklearn.base import BaseEstimator, TransformerMixin
-from sklearn.model_selection import GridSearchCV, train_test_split
+from sklearn.base import BaseEstimator, TransformerMixin, clone, is_classifier
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from sklearn.model_selection import (
+    GridSearchCV,
+    HalvingGridSearchCV,
+    train_test_split,
+)
+
+try:
+    from pyarrow.parquet import ParquetFile
+except ImportError:
+    ParquetFile = None
+
+
+def iterate_data_chunks(
+    file: str,
+    target_col_name: str,
+    chunk_size: int = 10000,
+    preprocessor: Any | None = None,
+    read_params: dict[str, Any] | None = None
+) -> Iterator[tuple[DataFrame, Series]]:
+    """
+    Streams features and targets from a `.csv` or `.parquet` file in chunks.
+
+    :Parameters:
+        file (str): Path to the `.csv` or `.parquet` file.
+        target_col_name (str): Name of the target column.
+        chunk_size (int): Number of rows in a chunk.
+                          Default: 10000.
+        preprocessor (Any | None): Fitted transformer applied to every chunk
+                                   before the target is separated.
+                                   Default: None.
+        read_params (dict[str, Any] | None): Extra `read_csv()` parameters.
+                                             Default: None.
+
+    :Returns:
+        Iterator[tuple[DataFrame, Series]]: Features and targets chunks.
+
+    :Exceptions:
+        ImportError: When `.parquet` file is read without `pyarrow` package.
+    """
+
+    if file.endswith(".parquet", ):
+        if ParquetFile is None:
+            raise ImportError("Reading `.parquet` files requires `pyarrow`.", )
+
+        chunks: Iterable[DataFrame] = (
+            batch.to_pandas()
+            for batch in ParquetFile(file, ).iter_batches(
+                batch_size=chunk_size,
+            )
+        )
+    else:
+        chunks = read_csv(file, chunksize=chunk_size, **(read_params or {}), )
+
+    for chunk in chunks:
+        if preprocessor is not None:
+            chunk = preprocessor.transform(chunk, )
+
+        yield chunk.drop(columns=[target_col_name, ], ), chunk[target_col_name]
+
+
+def fit_search(
+    search: GridSearchCV | HalvingGridSearchCV,
+    X: DataFrame,
+    y: ndarray
+) -> GridSearchCV | HalvingGridSearchCV:
+    """
+    Fits a search object, used by process pool workers.
+
+    :Parameters:
+        search (GridSearchCV | HalvingGridSearchCV): Search object to fit.
+        X (DataFrame): Training features.
+        y (ndarray): Training targets.
+
+    :Returns:
+        GridSearchCV | HalvingGridSearchCV: The fitted search object.
+    """
+
+    return search.fit(X, y, )
 
 
 class FeatureExtractor(BaseEstimator, TransformerMixin):
     """
     A feature engineering class for extracting features from Pandas dataframe.
 
+    The transformer is stateless: `transform()` builds a new Pandas dataframe
+    from its input and never mutates or stores it.
+
     :Attributes:
-        df (DataFrame | None): Pandas dataframe data.
-                               Default: None.
+        cols_names (list[str]): List of columns names to drop.
+                                Default: ["timestamp", ].
+        feature_names_in_ (ndarray): Columns names seen in `fit()`.
     """
 
     def __init__(
         self,
-        df: DataFrame | None = None
+        cols_names: list[str] = ["timestamp", ]
     ) -> None:
         """
-        Initializes `FeatureExtractor` with data.
+        Initializes `FeatureExtractor` with columns to drop.
 
         :Parameters:
-            df (DataFrame | None): Pandas dataframe data.
+            cols_names (list[str]): List of columns names to drop.
+                                    Default: ["timestamp", ].
         """
 
-        self.df: DataFrame | None = df
+        self.cols_names: list[str] = cols_names
 
     def fit(
         self,
         X: DataFrame,
         y: ndarray | None = None
-    ) -> None:
+    ) -> "FeatureExtractor":
         """
         Fits the transformer to the data.
 
@@ -50,75 +144,66 @@ class FeatureExtractor(BaseEstimator, TransformerMixin):
                                 Default: None.
         """
 
-        self.df = X
+        self.feature_names_in_: ndarray = X.columns.to_numpy(dtype=object, )
 
         return self
 
-    def exctract_hours_from_timestamps(self) -> None:
+    def exctract_hours_from_timestamps(self, X: DataFrame) -> Series:
         """
         Extracts `hour` component from `timestamp` column.
 
-        :Exceptions:
-            Exception: All other errors.
-        """
-
-        try:
-            self.df["hour"] = self.df["timestamp"].dt.hour
-        except Exception as err:
-            print(err, )
-
-    def exctract_weekdays_from_timestamps(self) -> None:
-        """
-        Extracts `weekday` component from `timestamp` column.
+        :Parameters:
+            X (DataFrame): Input features.
 
-        :Exceptions:
-            Exception: All other errors.
+        :Returns:
+            Series: Hours of timestamps.
         """
 
-        try:
-            self.df["weekday"] = self.df["timestamp"].dt.day_of_week
-        except Exception as err:
-            print(err, )
+        return X["timestamp"].dt.hour
 
-    def drop_columns(self, cols_names: list[str] = ["timestamp", ]) -> None:
+    def exctract_weekdays_from_timestamps(self, X: DataFrame) -> Series:
         """
-        Removes columns from the Pandas dataframe.
+        Extracts `weekday` component from `timestamp` column.
 
         :Parameters:
-            cols_names (list[str]): List of columns names to drop.
-                                    Default: ["timestamp", ].
+            X (DataFrame): Input features.
 
-        :Exceptions:
-            Exception: All other errors.
+        :Returns:
+            Series: Weekdays of timestamps.
         """
 
-        try:
-            self.df = self.df.drop(columns=cols_names, )
-        except Exception as err:
-            print(err, )
+        return X["timestamp"].dt.day_of_week
 
-    def process_dataframe(self) -> None:
+    def process_dataframe(self, X: DataFrame) -> DataFrame:
         """
         Executes full feature extraction pipeline.
 
-        :Exceptions:
-            Exception: All other errors.
-        """
+        :Parameters:
+            X (DataFrame): Input features.
 
-        try:
-            self.exctract_hours_from_timestamps()
-            self.exctract_weekdays_from_timestamps()
-            self.drop_columns()
-        except Exception as err:
-            print(err, )
+        :Returns:
+            DataFrame: New Pandas dataframe with extracted features.
+        """
 
-    def transform(self, X: DataFrame | None = None) -> DataFrame | None:
+        return DataFrame(
+            {
+                **{
+                    col: X[col]
+                    for col in X.columns
+                    if col not in self.cols_names
+                },
+                "hour": self.exctract_hours_from_timestamps(X, ),
+                "weekday": self.exctract_weekdays_from_timestamps(X, ),
+            },
+            index=X.index,
+        )
+
+    def transform(self, X: DataFrame) -> DataFrame | None:
         """
         Returns processed Pandas dataframe with extracted features.
 
         :Parameters:
-            X (DataFrame | None): Input features to fit on.
-                                  Default: None.
+            X (DataFrame): Input features to transform.
 
         :Returns:
             DataFrame: Processed Pandas dataframe with features.
@@ -129,9 +214,7 @@ class FeatureExtractor(BaseEstimator, TransformerMixin):
         """
 
         try:
-            self.process_dataframe()
-
-            return self.df
+            return self.process_dataframe(X, )
         except Exception as err:
             print(err, )
 
@@ -140,36 +223,45 @@ class MyOneHotEncoder(BaseEstimator, TransformerMixin):
     """
     A custom one-hot encoder for features in Pandas dataframe.
 
+    Categorical features and their categories are learned once in `fit()`,
+    `transform()` is stateless and encodes any batch with the learned
+    categories (unknown ones are encoded as all zeros or code -1).
+
     :Attributes:
         target_col_name (str): Name of the target column.
-        df (DataFrame | None): Pandas dataframe with features.
-                               Default: None.
+        output (Literal["dense", "sparse", "codes", ]): Output format.
+        categorical_features_names_ (list[str]): Learned categorical features.
+        categories_ (dict[str, Index]): Learned categories by feature.
+        encoded_features_names_ (list[str]): One-hot features names.
+        feature_names_in_ (ndarray): Columns names seen in `fit()`.
     """
 
     def __init__(
         self,
         target_col_name: str,
-        df: DataFrame | None = None
+        output: Literal["dense", "sparse", "codes", ] = "dense"
     ) -> None:
         """
-        Initializes `MyOneHotEncoder` with the data and target column name.
+        Initializes `MyOneHotEncoder` with the target column name.
 
         :Parameters:
             target_col_name (str): Name of the target column.
-            df (DataFrame | None): Pandas dataframe with features.
-                                   Default: None.
+            output (Literal["dense", "sparse", "codes", ]):
+                One-hot columns as dense or Pandas sparse ones, or categorical
+                codes instead of one-hot columns.
+                Default: "dense".
         """
 
-        self.df: DataFrame | None = df
         self.target_col_name: str = target_col_name
+        self.output: Literal["dense", "sparse", "codes", ] = output
 
     def fit(
         self,
         X: DataFrame,
         y: ndarray | None = None
-    ) -> None:
+    ) -> "MyOneHotEncoder":
         """
-        Fits the transformer to the data.
+        Learns categorical features and their categories.
 
         :Parameters:
             X (DataFrame): Input features to fit on.
@@ -177,103 +269,93 @@ class MyOneHotEncoder(BaseEstimator, TransformerMixin):
                                 Default: None.
         """
 
-        self.df = X
+        self.feature_names_in_: ndarray = X.columns.to_numpy(dtype=object, )
+        self.categorical_features_names_: list[str] = \
+            self.get_categorical_features_names(X, )
+        self.categories_: dict[str, Index] = {
+            col: X[col].astype("category", ).cat.categories
+            for col in self.categorical_features_names_
+        }
+        self.encoded_features_names_: list[str] = [
+            f"{col}_{category}"
+            for col, categories in self.categories_.items()
+            for category in categories
+        ]
 
         return self
 
-    def get_categorical_features_names(self) -> list[str] | None:
+    def get_categorical_features_names(self, X: DataFrame) -> list[str]:
         """
         Identifies categorical features in the Pandas dataframe.
 
+        :Parameters:
+            X (DataFrame): Input features.
+
         :Returns:
             list[str]: List of categorical column names.
-            None: If error occurs or no data is loaded.
-
-        :Exceptions:
-            Exception: All other errors.
         """
 
-        try:
-            df: DataFrame = self.df
-
-            if self.target_col_name in df.columns:
-                df = df.drop(self.target_col_name, )
-
-            return df.select_dtypes(
+        return [
+            col
+            for col in X.select_dtypes(
                 include=[
                     "object",
                     "string",
                     "category",
                 ],
-            ).columns.tolist()
-        except Exception as err:
-            print(err, )
+            ).columns
+            if col != self.target_col_name
+        ]
 
-    def transform_categorical_features(self) -> None:
+    def get_categorical_features_codes(self, X: DataFrame) -> dict[str, Any]:
         """
-        Applies one-hot encoding to categorical features.
+        Encodes categorical features by learned categories.
 
-        :Exceptions:
-            Exception: All other errors.
+        :Parameters:
+            X (DataFrame): Input features.
+
+        :Returns:
+            dict[str, Any]: Categories codes (-1 for unknown ones) by feature.
         """
 
-        try:
-            one_hot_encoder: OneHotEncoder = OneHotEncoder(
-                sparse_output=False,
-            )
-            encoded_df: DataFrame = DataFrame(
-                one_hot_encoder.fit_transform(
-                    self.df[self.get_categorical_features_names()],
-                ),
-                columns=one_hot_encoder.get_feature_names_out(
-                    input_features=self.get_categorical_features_names(),
-                ),
-                index=self.df.index,
-            )
-            self.df = concat([self.df, encoded_df, ], axis=1, )
-        except Exception as err:
-            print(err, )
+        return {
+            col: Categorical(X[col], categories=categories, ).codes
+            for col, categories in self.categories_.items()
+        }
 
-    def drop_columns(self, cols_names: list[str]) -> None:
+    def transform_categorical_features(self, X: DataFrame) -> dict[str, Any]:
         """
-        Removes columns from the Pandas dataframe.
+        Applies one-hot encoding to categorical features.
 
         :Parameters:
-            cols_names (list[str]): List of columns names to drop.
+            X (DataFrame): Input features.
 
-        :Exceptions:
-            Exception: All other errors.
+        :Returns:
+            dict[str, Any]: One-hot columns by name, dense or Pandas sparse
+                            ones.
         """
 
-        try:
-            self.df = self.df.drop(columns=cols_names, )
-        except Exception as err:
-            print(err, )
+        encoded_cols: dict[str, Any] = {}
 
-    def process_categorical_features(self) -> None:
-        """
-        Executes the complete feature processing pipeline.
+        for col, codes in self.get_categorical_features_codes(X, ).items():
+            for code, category in enumerate(self.categories_[col], ):
+                encoded_col: ndarray = (codes == code).astype("float64", )
+                encoded_cols[f"{col}_{category}"] = SparseArray(
+                    encoded_col,
+                    fill_value=0.0,
+                ) if self.output == "sparse" else encoded_col
 
-        :Exceptions:
-            Exception: All other errors.
-        """
-
-        try:
-            self.transform_categorical_features()
-            self.drop_columns(self.get_categorical_features_names(), )
-        except Exception as err:
-            print(err, )
+        return encoded_cols
 
-    def transform(
-        self,
-        X: DataFrame | None= None
-    ) -> DataFrame | None:
+    def transform(self, X: DataFrame) -> DataFrame | None:
         """
         Returns processed features.
 
+        Non-categorical columns keep their order and are followed by one-hot
+        columns, "codes" output replaces categorical columns in place.
+
         :Parameters:
-            X (DataFrame | None): Input features to fit on.
-                                  Default.
+            X (DataFrame): Input features to transform.
 
         :Returns:
             DataFrame: Features data.
@@ -284,9 +366,27 @@ class MyOneHotEncoder(BaseEstimator, TransformerMixin):
         """
 
         try:
-            self.process_categorical_features()
-
-            return self.df
+            if self.output == "codes":
+                codes: dict[str, Any] = self.get_categorical_features_codes(
+                    X,
+                )
+
+                return DataFrame(
+                    {col: codes.get(col, X[col], ) for col in X.columns},
+                    index=X.index,
+                )
+
+            return DataFrame(
+                {
+                    **{
+                        col: X[col]
+                        for col in X.columns
+                        if col not in self.categories_
+                    },
+                    **self.transform_categorical_features(X, ),
+                },
+                index=X.index,
+            )
         except Exception as err:
             print(err, )
 
@@ -349,20 +449,145 @@ class TrainValidationTest:
             print(err, )
 
 
+class ChunkedTrainValidationTest:
+    """
+    Utility class for streaming train, validation, test sets from a file.
+
+    Rows are assigned to sets by a seeded random generator restarted on every
+    pass, so every pass over the file yields the same split in proportions of
+    `TrainValidationTest` (70% train, 10% validation, 20% test).
+
+    :Attributes:
+        file (str): Path to the `.csv` or `.parquet` file.
+        target_col_name (str): Name of the target column.
+        chunk_size (int): Number of rows in a chunk.
+        preprocessor (Any | None): Fitted transformer applied to every chunk.
+        read_params (dict[str, Any] | None): Extra `read_csv()` parameters.
+        random_state (int): Seed of the split.
+    """
+
+    subsets_bounds: dict[str, tuple[float, float]] = {
+        "train": (0.0, 0.7, ),
+        "valid": (0.7, 0.8, ),
+        "test": (0.8, 1.0, ),
+    }
+
+    def __init__(
+        self,
+        file: str,
+        target_col_name: str,
+        chunk_size: int = 10000,
+        preprocessor: Any | None = None,
+        read_params: dict[str, Any] | None = None,
+        random_state: int = 21
+    ) -> None:
+        """
+        Initializes `ChunkedTrainValidationTest` with a data file.
+
+        :Parameters:
+            file (str): Path to the `.csv` or `.parquet` file.
+            target_col_name (str): Name of the target column.
+            chunk_size (int): Number of rows in a chunk.
+                              Default: 10000.
+            preprocessor (Any | None): Fitted transformer applied to every
+                                       chunk.
+                                       Default: None.
+            read_params (dict[str, Any] | None): Extra `read_csv()`
+                                                 parameters.
+                                                 Default: None.
+            random_state (int): Seed of the split.
+                                Default: 21.
+        """
+
+        self.file: str = file
+        self.target_col_name: str = target_col_name
+        self.chunk_size: int = chunk_size
+        self.preprocessor: Any | None = preprocessor
+        self.read_params: dict[str, Any] | None = read_params
+        self.random_state: int = random_state
+
+    def iterate_chunks(
+        self,
+        subset: Literal["train", "valid", "test", ]
+    ) -> Iterator[tuple[DataFrame, Series]]:
+        """
+        Streams features and targets chunks of a set.
+
+        :Parameters:
+            subset (Literal["train", "valid", "test", ]): Set to stream.
+
+        :Returns:
+            Iterator[tuple[DataFrame, Series]]: Features and targets chunks.
+        """
+
+        low, high = self.subsets_bounds[subset]
+        rng: Any = default_rng(self.random_state, )
+
+        for X, y in iterate_data_chunks(
+            self.file,
+            self.target_col_name,
+            self.chunk_size,
+            self.preprocessor,
+            self.read_params,
+        ):
+            draws: ndarray = rng.random(len(X, ), )
+            mask: ndarray = (draws >= low) & (draws < high)
+
+            if mask.any():
+                yield X[mask], y[mask]
+
+    def get_classes(self) -> ndarray | None:
+        """
+        Collects target classes over the whole file.
+
+        :Returns:
+            ndarray: Sorted unique target values.
+            None: If error occurs or no data is loaded.
+
+        :Exceptions:
+            Exception: All other errors.
+        """
+
+        try:
+            return unique(concatenate([
+                unique(y, )
+                for _, y in iterate_data_chunks(
+                    self.file,
+                    self.target_col_name,
+                    self.chunk_size,
+                    self.preprocessor,
+                    self.read_params,
+                )
+            ], ), )
+        except Exception as err:
+            print(err, )
+
+
 class ModelSelection:
     """
     Utility class for comparing and selecting the best classification model
     through grid search.
 
+    Grid searches are fitted concurrently in a process pool and memoized by
+    a hash of the training data, the search parameters and the strategy, so
+    repeated calls and identical searches do not refit them. Every search
+    in the pool gets an equal share of processors for its own jobs.
+
     :Attributes:
         grid_searches (list[GridSearchCV]): Stores the grid search objects.
         models_data (dict[int, str]): Models names dictionary.
+        strategy (Literal["grid", "halving", ]): Search strategy.
+        max_workers (int | None): Maximal number of worker processes.
+        fitted_searches (dict[str, GridSearchCV | HalvingGridSearchCV]):
+            Fitted search objects by hash.
     """
 
     def __init__(
         self,
         grid_searches: list[GridSearchCV],
-        models_data: dict[int, str]
+        models_data: dict[int, str],
+        strategy: Literal["grid", "halving", ] = "grid",
+        max_workers: int | None = None
     ) -> None:
         """
         Initializes `ModelSelection` with grid searches and model data.
@@ -370,10 +595,103 @@ class ModelSelection:
         :Parameters:
             grid_searches (list[GridSearchCV]): Stores the grid search objects.
             models_data (dict[int, str]): Models names dictionary.
+            strategy (Literal["grid", "halving", ]): Exhaustive grid search
+                                                     or successive halving
+                                                     over the same grids.
+                                                     Default: "grid".
+            max_workers (int | None): Maximal number of worker processes.
+                                      Default: None (one per search).
         """
 
         self.grid_searches: list[GridSearchCV] = grid_searches
         self.models_data: dict[int, str] = models_data
+        self.strategy: Literal["grid", "halving", ] = strategy
+        self.max_workers: int | None = max_workers
+        self.fitted_searches: dict[
+            str,
+            GridSearchCV | HalvingGridSearchCV,
+        ] = {}
+
+    def get_search(
+        self,
+        grid_search: GridSearchCV
+    ) -> GridSearchCV | HalvingGridSearchCV:
+        """
+        Returns an unfitted search object for the strategy.
+
+        :Parameters:
+            grid_search (GridSearchCV): Grid search object.
+
+        :Returns:
+            GridSearchCV | HalvingGridSearchCV: Unfitted search object.
+        """
+
+        if self.strategy == "halving":
+            return HalvingGridSearchCV(
+                cv=grid_search.cv,
+                refit=grid_search.refit,
+                n_jobs=grid_search.n_jobs,
+                scoring=grid_search.scoring,
+                estimator=grid_search.estimator,
+                param_grid=grid_search.param_grid,
+                random_state=21,
+            )
+
+        return clone(grid_search, )
+
+    def fit_grid_searches(
+        self,
+        X_train: DataFrame,
+        y_train: ndarray
+    ) -> list[GridSearchCV | HalvingGridSearchCV]:
+        """
+        Fits grid searches concurrently, reusing already fitted ones.
+
+        :Parameters:
+            X_train (DataFrame): Training features.
+            y_train (ndarray): Training targets.
+
+        :Returns:
+            list[GridSearchCV | HalvingGridSearchCV]: Fitted search objects in
+                                                      order of grid searches.
+        """
+
+        searches: list[GridSearchCV | HalvingGridSearchCV] = list(
+            map(self.get_search, self.grid_searches, ),
+        )
+        keys: list[str] = [
+            joblib_hash((self.strategy, search, X_train, y_train, ), )
+            for search in searches
+        ]
+        unfitted_searches: dict[str, GridSearchCV | HalvingGridSearchCV] = {
+            key: search
+            for key, search in zip(keys, searches, )
+            if key not in self.fitted_searches
+        }
+
+        if unfitted_searches:
+            max_workers: int = self.max_workers or len(unfitted_searches, )
+            n_jobs: int = max((os.cpu_count() or 1) // max_workers, 1, )
+
+            with ProcessPoolExecutor(max_workers=max_workers, ) as executor:
+                futures: dict[Any, str] = {
+                    executor.submit(
+                        fit_search,
+                        search.set_params(n_jobs=n_jobs, ),
+                        X_train,
+                        y_train,
+                    ): key
+                    for key, search in unfitted_searches.items()
+                }
+
+                for future in tqdm(
+                    as_completed(futures, ),
+                    unit="search",
+                    total=len(futures, ),
+                ):
+                    self.fitted_searches[futures[future]] = future.result()
+
+        return [self.fitted_searches[key] for key in keys]
 
     def get_best_classification_model_name(
         self,
@@ -404,44 +722,36 @@ class ModelSelection:
         best_classification_model_score: float = 0.0
 
         try:
-            for idx, grid_search in enumerate(self.grid_searches, ):
+            for idx, grid_search in enumerate(
+                self.fit_grid_searches(X_train, y_train, ),
+            ):
                 print(f"\nEstimator is {self.models_data[idx]}:", )
 
-                fits_cnt: int = prod([
-                    len(params, )
-                    for params
-                    in grid_search.param_grid.values()
-                    ], ) * 2
-
-                with tqdm(
-                    ncols=1000,
-                    unit="s",
-                    total=fits_cnt,
-                    desc=f"{self.models_data[idx]}",
-                ) as progress_bar:
-                    grid_search.fit(X_train, y_train, )
-
-                    loc_score: float = grid_search.score(X_valid, y_valid, )
-
-                    if loc_score > best_classification_model_score:
-                        best_classification_model_score = loc_score
-                        best_classification_model_name = self.models_data[idx]
-
-                    progress_bar.update(fits_cnt, )
-
-                    print(
-                        "Best classification model parameters are " +
-                        f"{grid_search.best_params_}.",
-                    )
-                    print(
-                        f"Classification model training accuracy metric is {
-                            grid_search.best_score_:.3f
-                        }.",
-                    )
-                    print(
-                        "Classification model validation accuracy metric " +
-                        f"is {loc_score:.3f}.",
-                    )
+                loc_score: float = grid_search.score(X_valid, y_valid, )
+
+                if loc_score > best_classification_model_score:
+                    best_classification_model_score = loc_score
+                    best_classification_model_name = self.models_data[idx]
+
+                print(
+                    "Best classification model parameters are " +
+                    f"{grid_search.best_params_}.",
+                )
+                print(
+                    "Best classification model parameters mean fit time is " +
+                    f"{grid_search.cv_results_["mean_fit_time"][
+                        grid_search.best_index_
+                    ]:.3f}s.",
+                )
+                print(
+                    f"Classification model training accuracy metric is {
+                        grid_search.best_score_:.3f
+                    }.",
+                )
+                print(
+                    "Classification model validation accuracy metric " +
+                    f"is {loc_score:.3f}.",
+                )
 
             print(
                 "\nClassification model with best validation accuracy " +
@@ -481,11 +791,10 @@ class ModelSelection:
         models_scores: list[float] = []
 
         try:
-            for idx, grid_search in enumerate(self.grid_searches, ):
-                loc_model_name: str = self.models_data[idx]
-
-                grid_search.fit(X_train, y_train, )
-                models_names.append(loc_model_name, )
+            for idx, grid_search in enumerate(
+                self.fit_grid_searches(X_train, y_train, ),
+            ):
+                models_names.append(self.models_data[idx], )
                 models_params.append(grid_search.best_params_, )
                 models_scores.append(grid_search.score(X_valid, y_valid, ), )
 
@@ -497,6 +806,56 @@ class ModelSelection:
         except Exception as err:
             print(err, )
 
+    def get_classification_models_fit_times(
+        self,
+        X_train: DataFrame,
+        y_train: ndarray
+    ) -> DataFrame | None:
+        """
+        Generates Pandas dataframe of every searched candidate fit time.
+
+        :Parameters:
+            X_train (DataFrame): Training features.
+            y_train (ndarray): Training targets.
+
+        :Returns:
+            DataFrame: Candidates parameters, fit and score times, mean
+                       cross-validation scores (and halving iterations with
+                       their resources for "halving" strategy).
+            None: If error occurs or no data is loaded.
+
+        :Exceptions:
+            Exception: All other errors.
+        """
+
+        try:
+            return concat(
+                [
+                    DataFrame({
+                        "model": self.models_data[idx],
+                        "parameters": grid_search.cv_results_["params"],
+                        **{
+                            col: grid_search.cv_results_[col]
+                            for col in (
+                                "iter",
+                                "n_resources",
+                                "mean_fit_time",
+                                "std_fit_time",
+                                "mean_score_time",
+                                "mean_test_score",
+                            )
+                            if col in grid_search.cv_results_
+                        },
+                    }, )
+                    for idx, grid_search in enumerate(
+                        self.fit_grid_searches(X_train, y_train, ),
+                    )
+                ],
+                ignore_index=True,
+            )
+        except Exception as err:
+            print(err, )
+
 
 class Finalize:
     """
@@ -544,28 +903,141 @@ class Finalize:
         try:
             self.classification_model.fit(X_train, y_train, )
 
+            score: float = accuracy_score(
+                y_test,
+                self.classification_model.predict(X_test, ),
+            )
+
             print(
-                f"Accuracy metric of the classification model is {
-                    accuracy_score(
-                        self.classification_model.predict(X_test, ),
-                        y_test,
-                    ):.3f
-                }.",
+                f"Accuracy metric of the classification model is {score:.3f}.",
+            )
+
+            return round(score, 3, )
+        except Exception as err:
+            print(err, )
+
+    def fit_chunks(
+        self,
+        chunks: Iterable[tuple[DataFrame, ndarray]],
+        classes: ndarray | None = None
+    ) -> None:
+        """
+        Trains the classification model on streamed chunks.
+
+        Models implementing `partial_fit()` are trained chunk by chunk, other
+        ones are fitted once on concatenated chunks. Classifiers trained
+        chunk by chunk need all target classes before the first chunk: they
+        are collected from chunks when these can be iterated twice (e.g. a
+        list), one-pass iterators require `classes`.
+
+        :Parameters:
+            chunks (Iterable[tuple[DataFrame, ndarray]]): Features and
+                                                          targets chunks.
+            classes (ndarray | None): All target classes, e.g.
+                                      `ChunkedTrainValidationTest
+                                      .get_classes()`.
+                                      Default: None.
+
+        :Exceptions:
+            ValueError: When classes are missing for one-pass chunks.
+        """
+
+        if hasattr(self.classification_model, "partial_fit", ):
+            if classes is None and is_classifier(self.classification_model, ):
+                if iter(chunks, ) is chunks:
+                    raise ValueError(
+                        "classes are required to train a classifier with "
+                        "`partial_fit()` on one-pass chunks, pass "
+                        "`ChunkedTrainValidationTest.get_classes()`",
+                    )
+
+                classes = unique(concatenate([
+                    unique(y_chunk, ) for _, y_chunk in chunks
+                ], ), )
+
+            for X_chunk, y_chunk in chunks:
+                self.classification_model.partial_fit(
+                    X_chunk,
+                    y_chunk,
+                    classes=classes,
+                )
+        else:
+            X_chunks, y_chunks = zip(*chunks, )
+
+            self.classification_model.fit(
+                concat(X_chunks, ),
+                concat(y_chunks, ),
             )
 
-            return round(
-                accuracy_score(
-                    self.classification_model.predict(X_test, ),
-                    y_test,
-                ),
-                3,
+    def get_streaming_score(
+        self,
+        chunks: Iterable[tuple[DataFrame, ndarray]]
+    ) -> float:
+        """
+        Computes accuracy metric over streamed chunks.
+
+        :Parameters:
+            chunks (Iterable[tuple[DataFrame, ndarray]]): Features and
+                                                          targets chunks.
+
+        :Returns:
+            float: Accuracy metric score.
+        """
+
+        correct_cnt: int = 0
+        total_cnt: int = 0
+
+        for X_chunk, y_chunk in chunks:
+            correct_cnt += int(
+                (self.classification_model.predict(X_chunk, ) == y_chunk).sum(),
+            )
+            total_cnt += len(y_chunk, )
+
+        return correct_cnt / total_cnt
+
+    def get_final_chunked_score(
+        self,
+        train_chunks: Iterable[tuple[DataFrame, ndarray]],
+        test_chunks: Iterable[tuple[DataFrame, ndarray]],
+        classes: ndarray | None = None
+    ) -> float | None:
+        """
+        Trains the classification model and evaluates its accuracy metric on
+        streamed chunks without loading whole sets into memory.
+
+        :Parameters:
+            train_chunks (Iterable[tuple[DataFrame, ndarray]]): Training
+                                                                chunks.
+            test_chunks (Iterable[tuple[DataFrame, ndarray]]): Test chunks.
+            classes (ndarray | None): All target classes, see
+                                      `fit_chunks()`.
+                                      Default: None.
+
+        :Returns:
+            float: Accuracy metric score.
+            None: If error occurs or no data is loaded.
+
+        :Exceptions:
+            Exception: All other errors.
+        """
+
+        try:
+            self.fit_chunks(train_chunks, classes, )
+
+            score: float = self.get_streaming_score(test_chunks, )
+
+            print(
+                f"Accuracy metric of the classification model is {score:.3f}.",
             )
+
+            return round(score, 3, )
         except Exception as err:
             print(err, )
 
     def save_classification_model(
         self,
-        classification_model_path: str = "../../models/"
+        classification_model_path: str = "../../models/",
+        compress: int = 3
     ) -> None:
         """
         Serializes and saves the classification model.
@@ -574,6 +1046,10 @@ class Finalize:
             classification_model_path (str): Destination path for model
                                              serialization.
                                              Default: "../../models/".
+            compress (int): Compression level from 0 to 9, 0 stores arrays
+                            uncompressed so they can be memory-mapped by
+                            `load_classification_model()`.
+                            Default: 3.
 
         :Exceptions:
             Exception: All other errors.
@@ -583,6 +1059,7 @@ class Finalize:
             dump(
                 self.classification_model,
                 classification_model_path,
+                compress=compress,
             )
             print(
                 "Classification model was successfuly saved:" +
@@ -590,3 +1067,33 @@ class Finalize:
             )
         except Exception as err:
             print(err, )
+
+    @staticmethod
+    def load_classification_model(
+        classification_model_path: str,
+        mmap_mode: Literal["r", "r+", "c", ] | None = None
+    ) -> Any | None:
+        """
+        Loads a saved classification model.
+
+        With `mmap_mode` large arrays of uncompressed dumps (`compress=0`) are
+        memory-mapped and read lazily, compressed dumps are always loaded into
+        memory.
+
+        :Parameters:
+            classification_model_path (str): Path to the saved model.
+            mmap_mode (Literal["r", "r+", "c", ] | None): Memory mapping mode.
+                                                          Default: None.
+
+        :Returns:
+            Any: The loaded classification model.
+            None: If error occurs or no data is loaded.
+
+        :Exceptions:
+            Exception: All other errors.
+        """
+
+        try:
+            return load(classification_model_path, mmap_mode=mmap_mode, )
+        except Exception as err:
+            print(err, )
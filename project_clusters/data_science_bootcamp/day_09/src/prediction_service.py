@@ -0,0 +1,697 @@
+"""
+A local micro-batching prediction service for saved classification models.
+
+Examples of usage:
+    >>> python prediction_service.py serve ../models/ex_04_best_model.sav \
+    >>>     --preprocessor ../models/ex_04_preprocessing_pipe.sav \
+    >>>     --parse-dates timestamp --port 8000
+    >>> python prediction_service.py load http://127.0.0.1:8000 \
+    >>>     ../data/datasets/checker_submits.csv --concurrency 32
+"""
+
+
+import argparse
+
+from queue import Empty, Queue
+from json import dumps, loads
+from collections import deque
+from time import perf_counter
+from typing import Any
+from numpy import ndarray, percentile
+from urllib.request import Request, urlopen
+from pandas import DataFrame, read_csv, to_datetime
+from threading import Event, Lock, Thread
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pipelines_blocks import Finalize
+
+
+class PredictionService:
+    """
+    A prediction service merging concurrent requests into batches.
+
+    A background thread collects queued requests until `max_batch_size` rows
+    are gathered or `max_wait` seconds pass, then preprocesses all their
+    records as one Pandas dataframe and calls `predict()` once. Records
+    missing required columns are rejected before queueing, and when a batch
+    fails its requests are retried separately so that only the bad ones get
+    the error.
+
+    :Attributes:
+        classification_model (Any): The loaded classification model.
+        preprocessor (Any | None): The loaded fitted preprocessing pipeline.
+        parse_dates (list[str]): Columns parsed as timestamps.
+        required_cols (list[str]): Columns every record must contain.
+        max_batch_size (int): Maximal number of rows in a batch.
+        max_wait (float): Maximal time to wait for a batch in seconds.
+    """
+
+    def __init__(
+        self,
+        classification_model_path: str,
+        preprocessor_path: str | None = None,
+        parse_dates: list[str] | None = None,
+        max_batch_size: int = 256,
+        max_wait: float = 0.005,
+        latencies_window: int = 10000
+    ) -> None:
+        """
+        Initializes `PredictionService` and loads the saved models once.
+
+        :Parameters:
+            classification_model_path (str): Path to the saved model.
+            preprocessor_path (str | None): Path to the saved fitted
+                                            preprocessing pipeline
+                                            (`FeatureExtractor`,
+                                            `MyOneHotEncoder`).
+                                            Default: None.
+            parse_dates (list[str] | None): Columns parsed as timestamps.
+                                            Default: None.
+            max_batch_size (int): Maximal number of rows in a batch.
+                                  Default: 256.
+            max_wait (float): Maximal time to wait for a batch in seconds.
+                              Default: 0.005.
+            latencies_window (int): Number of last requests latencies kept
+                                    for percentiles.
+                                    Default: 10000.
+
+        :Exceptions:
+            ValueError: When a model can not be loaded.
+        """
+
+        self.classification_model: Any = Finalize.load_classification_model(
+            classification_model_path,
+        )
+
+        if self.classification_model is None:
+            raise ValueError(
+                f"can not load classification model: "
+                f"{classification_model_path}",
+            )
+
+        self.preprocessor: Any | None = None
+
+        if preprocessor_path is not None:
+            self.preprocessor = Finalize.load_classification_model(
+                preprocessor_path,
+            )
+
+            if self.preprocessor is None:
+                raise ValueError(
+                    f"can not load preprocessor: {preprocessor_path}",
+                )
+
+        self.parse_dates: list[str] = parse_dates or []
+        self.required_cols: list[str] = self.get_required_cols()
+        self.max_batch_size: int = max_batch_size
+        self.max_wait: float = max_wait
+        self.requests: Queue = Queue()
+        self.stopped: Event = Event()
+        self.lock: Lock = Lock()
+        self.latencies: deque[float] = deque(maxlen=latencies_window, )
+        self.requests_cnt: int = 0
+        self.rows_cnt: int = 0
+        self.batches_cnt: int = 0
+        self.started_at: float = perf_counter()
+        self.worker: Thread = Thread(target=self.process_batches, daemon=True, )
+
+    def get_required_cols(self) -> list[str]:
+        """
+        Returns columns every record must contain: timestamps columns and
+        columns the preprocessor (or the model without one) was fitted on,
+        except target columns of preprocessing steps.
+
+        :Returns:
+            list[str]: Required columns names.
+        """
+
+        fitted: Any = self.classification_model if self.preprocessor is None \
+            else self.preprocessor
+        target_cols: set[str | None] = {
+            getattr(step, "target_col_name", None, )
+            for _, step in getattr(fitted, "steps", [(None, fitted, ), ], )
+        }
+
+        return list(dict.fromkeys([
+            *self.parse_dates,
+            *(
+                col
+                for col in getattr(fitted, "feature_names_in_", [], )
+                if col not in target_cols
+            ),
+        ], ), )
+
+    def start(self) -> "PredictionService":
+        """
+        Starts the batching thread.
+        """
+
+        self.started_at = perf_counter()
+
+        self.worker.start()
+
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops the batching thread.
+        """
+
+        self.stopped.set()
+        self.worker.join()
+
+    def __enter__(self) -> "PredictionService":
+        """
+        Starts the batching thread.
+        """
+
+        return self.start()
+
+    def __exit__(self, *args: object) -> None:
+        """
+        Stops the batching thread.
+        """
+
+        self.stop()
+
+    def predict(self, records: list[dict[str, Any]]) -> list[Any]:
+        """
+        Predicts records, blocking until their batch is processed.
+
+        :Parameters:
+            records (list[dict[str, Any]]): Raw features records.
+
+        :Returns:
+            list[Any]: Predictions in order of records.
+
+        :Exceptions:
+            TypeError: When records are not JSON objects.
+            KeyError: When records miss required columns.
+        """
+
+        for record in records:
+            if not isinstance(record, dict, ):
+                raise TypeError(f"record is not an object: {record!r}", )
+
+            missing_cols: list[str] = [
+                col for col in self.required_cols if col not in record
+            ]
+
+            if missing_cols:
+                raise KeyError(f"record misses columns: {missing_cols}", )
+
+        future: Future = Future()
+
+        self.requests.put((records, future, perf_counter(), ), )
+
+        return future.result()
+
+    def collect_batch(self) -> list[tuple[list, Future, float]]:
+        """
+        Collects queued requests into a batch.
+
+        :Returns:
+            list[tuple[list, Future, float]]: Requests records, futures and
+                                              arrival times.
+        """
+
+        try:
+            batch: list[tuple[list, Future, float]] = [
+                self.requests.get(timeout=0.1, ),
+            ]
+        except Empty:
+            return []
+
+        rows_cnt: int = len(batch[0][0], )
+        deadline: float = perf_counter() + self.max_wait
+
+        while rows_cnt < self.max_batch_size:
+            try:
+                batch.append(self.requests.get(
+                    timeout=max(deadline - perf_counter(), 0.0, ),
+                ), )
+            except Empty:
+                break
+
+            rows_cnt += len(batch[-1][0], )
+
+        return batch
+
+    def predict_batch(self, records: list[dict[str, Any]]) -> ndarray:
+        """
+        Preprocesses and predicts records in one vectorized call.
+
+        :Parameters:
+            records (list[dict[str, Any]]): Raw features records.
+
+        :Returns:
+            ndarray: Predictions.
+
+        :Exceptions:
+            ValueError: When the preprocessor fails on records.
+        """
+
+        X: DataFrame = DataFrame.from_records(records, )
+
+        for col in self.parse_dates:
+            X[col] = to_datetime(X[col], )
+
+        if self.preprocessor is not None:
+            X = self.preprocessor.transform(X, )
+
+            if X is None:
+                raise ValueError("records preprocessing failed", )
+
+        features_names: ndarray | None = getattr(
+            self.classification_model,
+            "feature_names_in_",
+            None,
+        )
+
+        if features_names is not None:
+            X = X[features_names]
+
+        return self.classification_model.predict(X, )
+
+    def process_batches(self) -> None:
+        """
+        Processes batches of requests until the service is stopped.
+        """
+
+        while not self.stopped.is_set():
+            batch: list[tuple[list, Future, float]] = self.collect_batch()
+
+            if not batch:
+                continue
+
+            results: list[list[Any] | Exception] = self.predict_requests(
+                [records for records, _, _ in batch],
+            )
+            finished_at: float = perf_counter()
+            done: list[tuple[list, Future, float]] = []
+
+            for request, result in zip(batch, results, ):
+                if isinstance(result, Exception, ):
+                    request[1].set_exception(result, )
+                else:
+                    request[1].set_result(result, )
+                    done.append(request, )
+
+            with self.lock:
+                self.requests_cnt += len(done, )
+                self.rows_cnt += sum(len(records, ) for records, _, _ in done)
+                self.batches_cnt += 1
+                self.latencies.extend(
+                    finished_at - arrived_at for _, _, arrived_at in done
+                )
+
+    def predict_requests(
+        self,
+        requests_records: list[list[dict[str, Any]]]
+    ) -> list[list[Any] | Exception]:
+        """
+        Predicts records of batched requests in one call, retrying requests
+        separately when the batch fails.
+
+        :Parameters:
+            requests_records (list[list[dict[str, Any]]]): Records of every
+                                                            request.
+
+        :Returns:
+            list[list[Any] | Exception]: Predictions or the error of every
+                                         request.
+        """
+
+        try:
+            predictions: list[Any] = self.predict_batch([
+                record for records in requests_records for record in records
+            ], ).tolist()
+        except Exception as err:
+            if len(requests_records, ) == 1:
+                return [err, ]
+
+            return [
+                self.predict_requests([records, ], )[0]
+                for records in requests_records
+            ]
+
+        results: list[list[Any] | Exception] = []
+        start: int = 0
+
+        for records in requests_records:
+            results.append(predictions[start: start + len(records, )], )
+
+            start += len(records, )
+
+        return results
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Returns latency and throughput counters.
+
+        :Returns:
+            dict[str, float]: Processed requests, rows and batches counts, mean
+                              batch size, rows throughput per second and
+                              latencies percentiles in milliseconds.
+        """
+
+        with self.lock:
+            latencies: list[float] = list(self.latencies, )
+            uptime: float = perf_counter() - self.started_at
+
+            return {
+                "requests": self.requests_cnt,
+                "rows": self.rows_cnt,
+                "batches": self.batches_cnt,
+                "mean_batch_rows": round(
+                    self.rows_cnt / max(self.batches_cnt, 1, ),
+                    2,
+                ),
+                "rows_per_second": round(self.rows_cnt / uptime, 2, ),
+                **{
+                    f"p{int(q)}_latency_ms": round(
+                        float(percentile(latencies, q, ), ) * 1000,
+                        3,
+                    ) if latencies else 0.0
+                    for q in (50, 95, 99, )
+                },
+            }
+
+
+class PredictionHandler(BaseHTTPRequestHandler):
+    """
+    Handler of prediction service requests.
+
+    `POST /predict` accepts a JSON list of records (or a single record) and
+    responds with predictions, `GET /stats` responds with service counters.
+    """
+
+    protocol_version: str = "HTTP/1.1"
+
+    def send_json(self, status: int, data: Any) -> None:
+        """
+        Sends a JSON response.
+
+        :Parameters:
+            status (int): Response status code.
+            data (Any): JSON serializable response data.
+        """
+
+        body: bytes = dumps(data, ).encode("utf-8", )
+
+        self.send_response(status, )
+        self.send_header("Content-Type", "application/json", )
+        self.send_header("Content-Length", str(len(body, ), ), )
+        self.end_headers()
+        self.wfile.write(body, )
+
+    def do_GET(self) -> None:
+        """
+        Responds with service counters.
+        """
+
+        if self.path != "/stats":
+            self.send_json(404, {"error": "Not found.", }, )
+
+            return
+
+        self.send_json(200, self.server.service.get_stats(), )
+
+    def do_POST(self) -> None:
+        """
+        Responds with predictions of posted records.
+        """
+
+        if self.path != "/predict":
+            self.send_json(404, {"error": "Not found.", }, )
+
+            return
+
+        try:
+            records: Any = loads(self.rfile.read(
+                int(self.headers.get("Content-Length", 0, ), ),
+            ), )
+
+            if isinstance(records, dict, ):
+                records = [records, ]
+
+            self.send_json(
+                200,
+                {"predictions": self.server.service.predict(records, ), },
+            )
+        except Exception as err:
+            self.send_json(400, {"error": str(err, ), }, )
+
+    def log_message(self, *args: object) -> None:
+        """
+        Silences requests logging.
+        """
+
+
+class PredictionHTTPServer(ThreadingHTTPServer):
+    """
+    A threading HTTP server with a listen backlog for concurrent clients.
+    """
+
+    daemon_threads: bool = True
+    request_queue_size: int = 128
+
+
+class PredictionServer:
+    """
+    A local HTTP prediction server running in a background thread.
+
+    :Attributes:
+        service (PredictionService): The prediction service.
+        server (PredictionHTTPServer): The HTTP server.
+        url (str): Base URL of the server.
+    """
+
+    def __init__(
+        self,
+        service: PredictionService,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ) -> None:
+        """
+        Initializes the server.
+
+        :Parameters:
+            service (PredictionService): The prediction service.
+            host (str): Host to listen on.
+                        Default: "127.0.0.1".
+            port (int): Port to listen on.
+                        Default: 0 (a free port).
+        """
+
+        self.service: PredictionService = service
+        self.server: PredictionHTTPServer = PredictionHTTPServer(
+            (host, port, ),
+            PredictionHandler,
+        )
+        self.server.service = service
+        self.url: str = f"http://{host}:{self.server.server_address[1]}"
+        self.thread: Thread = Thread(
+            target=self.server.serve_forever,
+            daemon=True,
+        )
+
+    def __enter__(self) -> "PredictionServer":
+        """
+        Starts the service and the server.
+        """
+
+        self.service.start()
+        self.thread.start()
+
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """
+        Stops the server and the service.
+        """
+
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.service.stop()
+
+
+def run_load_test(
+    url: str,
+    records: list[dict[str, Any]],
+    requests_cnt: int = 1000,
+    concurrency: int = 16,
+    request_rows: int = 1
+) -> dict[str, float] | None:
+    """
+    Sends concurrent prediction requests and measures client-side latency.
+
+    :Parameters:
+        url (str): Base URL of the prediction server.
+        records (list[dict[str, Any]]): Records to send, cycled.
+        requests_cnt (int): Number of requests.
+                            Default: 1000.
+        concurrency (int): Number of concurrent clients.
+                           Default: 16.
+        request_rows (int): Number of records in a request.
+                            Default: 1.
+
+    :Returns:
+        dict[str, float]: Requests per second, rows per second and latencies
+                          percentiles in milliseconds.
+        None: If error occurs or no data is loaded.
+
+    :Exceptions:
+        ConnectionError: When can not connect to server.
+        Exception: All other errors.
+    """
+
+    def send_request(payload: bytes) -> float:
+        request: Request = Request(
+            url + "/predict",
+            data=payload,
+            headers={"Content-Type": "application/json", },
+            method="POST",
+        )
+        sent_at: float = perf_counter()
+
+        with urlopen(request, ) as resp:
+            resp.read()
+
+        return perf_counter() - sent_at
+
+    try:
+        payloads: list[bytes] = [
+            dumps(
+                [
+                    records[(idx * request_rows + offset) % len(records, )]
+                    for offset in range(request_rows, )
+                ],
+                default=str,
+            ).encode("utf-8", )
+            for idx in range(requests_cnt, )
+        ]
+        started_at: float = perf_counter()
+
+        with ThreadPoolExecutor(max_workers=concurrency, ) as executor:
+            latencies: list[float] = list(executor.map(
+                send_request,
+                payloads,
+            ), )
+
+        elapsed: float = perf_counter() - started_at
+
+        return {
+            "requests_per_second": round(requests_cnt / elapsed, 2, ),
+            "rows_per_second": round(
+                requests_cnt * request_rows / elapsed,
+                2,
+            ),
+            **{
+                f"p{int(q)}_latency_ms": round(
+                    float(percentile(latencies, q, ), ) * 1000,
+                    3,
+                )
+                for q in (50, 95, 99, )
+            },
+        }
+    except ConnectionError as conn_err:
+        print("ConnectionError:", conn_err, )
+    except Exception as err:
+        print("Exception:", err, )
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Serve a saved classification model or load test it.",
+    )
+    subparsers: argparse._SubParsersAction = parser.add_subparsers(
+        dest="command",
+        required=True,
+    )
+    serve_parser: argparse.ArgumentParser = subparsers.add_parser(
+        "serve",
+        help="serve a saved classification model",
+    )
+    load_parser: argparse.ArgumentParser = subparsers.add_parser(
+        "load",
+        help="load test a running prediction server",
+    )
+
+    serve_parser.add_argument("model_file", help="saved model file", )
+    serve_parser.add_argument(
+        "--preprocessor",
+        default=None,
+        help="saved fitted preprocessing pipeline file",
+    )
+    serve_parser.add_argument(
+        "--parse-dates",
+        nargs="*",
+        default=[],
+        help="columns parsed as timestamps",
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1", help="host", )
+    serve_parser.add_argument("--port", type=int, default=8000, help="port", )
+    serve_parser.add_argument(
+        "--max-batch-size",
+        type=int,
+        default=256,
+        help="maximal number of rows in a batch",
+    )
+    serve_parser.add_argument(
+        "--max-wait",
+        type=float,
+        default=0.005,
+        help="maximal time to wait for a batch in seconds",
+    )
+    load_parser.add_argument("url", help="prediction server base URL", )
+    load_parser.add_argument("data_file", help="`.csv` file with records", )
+    load_parser.add_argument(
+        "--requests",
+        type=int,
+        default=1000,
+        help="number of requests",
+    )
+    load_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="number of concurrent clients",
+    )
+    load_parser.add_argument(
+        "--request-rows",
+        type=int,
+        default=1,
+        help="number of records in a request",
+    )
+
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.command == "serve":
+        with PredictionServer(
+            PredictionService(
+                args.model_file,
+                args.preprocessor,
+                args.parse_dates,
+                args.max_batch_size,
+                args.max_wait,
+            ),
+            args.host,
+            args.port,
+        ) as prediction_server:
+            print(f"Serving on {prediction_server.url}.", )
+
+            try:
+                prediction_server.thread.join()
+            except KeyboardInterrupt:
+                print(prediction_server.service.get_stats(), )
+    else:
+        print(run_load_test(
+            args.url,
+            read_csv(args.data_file, ).to_dict("records", ),
+            args.requests,
+            args.concurrency,
+            args.request_rows,
+        ), )
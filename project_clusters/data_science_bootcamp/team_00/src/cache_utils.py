@@ -0,0 +1,176 @@
+"""
+Module of web data cache utils.
+
+Examples of usage:
+    >>> cache: MoviesDataCache = MoviesDataCache(
+    >>>     file="data/cache/imdb.sqlite",
+    >>>     ttl=7 * 24 * 60 * 60,
+    >>>     max_size=10000,
+    >>> )
+
+    >>> cache.set_many(
+    >>>     movies_data=[["0113041", "Father of the Bride Part II", ], ],
+    >>>     fields=["title", ],
+    >>> )
+    >>> print(cache.get_many(movies_ids=["0113041", ], fields=["title", ], ), )
+
+    >>> cache.close()
+"""
+
+
+import os
+import sqlite3
+
+from time import time
+from json import dumps, loads
+
+
+class MoviesDataCache:
+    """
+    A disk-backed SQLite cache of movies webpages fields.
+
+    Entries are keyed by movie ID and the ordered set of extracted fields,
+    expire after `ttl` seconds and the least recently used entries are
+    evicted when the cache holds more than `max_size` entries.
+
+    :Attributes:
+        file (str): Path to the SQLite database file.
+        ttl (float | None): Entries time to live in seconds.
+                            Default: None (entries never expire).
+        max_size (int): Maximal number of entries.
+                        Default: 10000.
+        conn (sqlite3.Connection): Database connection.
+    """
+
+    def __init__(
+        self,
+        file: str,
+        ttl: float | None = None,
+        max_size: int = 10000
+    ) -> None:
+        """
+        Initializes the cache and creates the database if needed.
+
+        :Parameters:
+            file (str): Path to the SQLite database file.
+            ttl (float | None): Entries time to live in seconds.
+                                Default: None (entries never expire).
+            max_size (int): Maximal number of entries.
+                            Default: 10000.
+        """
+
+        self.file: str = file
+        self.ttl: float | None = ttl
+        self.max_size: int = max_size
+
+        if os.path.dirname(file, ):
+            os.makedirs(os.path.dirname(file, ), exist_ok=True, )
+
+        self.conn: sqlite3.Connection = sqlite3.connect(file, )
+
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS movies_data ("
+                "movie_id TEXT NOT NULL, "
+                "fields TEXT NOT NULL, "
+                "data TEXT NOT NULL, "
+                "created_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL, "
+                "PRIMARY KEY (movie_id, fields))",
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS movies_data_accessed_at "
+                "ON movies_data (accessed_at)",
+            )
+
+    def get_many(
+        self,
+        movies_ids: list[str],
+        fields: list[str]
+    ) -> dict[str, list[str | None]]:
+        """
+        Retrieves cached fields of movies and marks them as recently used.
+
+        :Parameters:
+            movies_ids (list[str]): Movies IDs.
+            fields (list[str]): Extracted fields names.
+
+        :Returns:
+            dict[str, list[str | None]]:
+                Keys (str): Cached movies IDs.
+                Values (list[str | None]): Movies fields values starting with
+                                           the movie ID.
+        """
+
+        fields_key: str = dumps(fields, )
+        now: float = time()
+        movies_data: dict[str, list[str | None]] = {}
+
+        with self.conn:
+            if self.ttl is not None:
+                self.conn.execute(
+                    "DELETE FROM movies_data WHERE created_at < ?",
+                    (now - self.ttl, ),
+                )
+
+            for movie_id in dict.fromkeys(movies_ids, ):
+                row: tuple[str] | None = self.conn.execute(
+                    "SELECT data FROM movies_data "
+                    "WHERE movie_id = ? AND fields = ?",
+                    (movie_id, fields_key, ),
+                ).fetchone()
+
+                if row is not None:
+                    movies_data[movie_id] = loads(row[0], )
+
+            self.conn.executemany(
+                "UPDATE movies_data SET accessed_at = ? "
+                "WHERE movie_id = ? AND fields = ?",
+                [
+                    (now, movie_id, fields_key, )
+                    for movie_id in movies_data
+                ],
+            )
+
+        return movies_data
+
+    def set_many(
+        self,
+        movies_data: list[list[str | None]],
+        fields: list[str]
+    ) -> None:
+        """
+        Stores fields of movies and evicts the least recently used entries.
+
+        :Parameters:
+            movies_data (list[list[str | None]]): Movies fields values
+                                                  starting with the movie ID.
+            fields (list[str]): Extracted fields names.
+        """
+
+        fields_key: str = dumps(fields, )
+        now: float = time()
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO movies_data "
+                "(movie_id, fields, data, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (movie_data[0], fields_key, dumps(movie_data, ), now, now, )
+                    for movie_data in movies_data
+                ],
+            )
+            self.conn.execute(
+                "DELETE FROM movies_data WHERE rowid NOT IN ("
+                "SELECT rowid FROM movies_data "
+                "ORDER BY accessed_at DESC LIMIT ?)",
+                (self.max_size, ),
+            )
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+
+        self.conn.close()
@@ -0,0 +1,390 @@
+"""
+Module of dataset load utils.
+
+Examples of usage:
+    >>> print(load_csv_columns(
+    >>>     file="data/datasets/ratings.csv",
+    >>>     columns_types={
+    >>>         "userId": "int32",
+    >>>         "movieId": "int32",
+    >>>         "rating": "float32",
+    >>>         "timestamp": "int64",
+    >>>     },
+    >>>     size=1000,
+    >>> ), )
+
+    >>> print(load_csv_columns(
+    >>>     file="data/datasets/movies.csv",
+    >>>     columns_types={
+    >>>         "movieId": "int32",
+    >>>         "title": "str",
+    >>>         "genres": "str",
+    >>>     },
+    >>>     cache_path="data/cache/",
+    >>> ), )
+
+    >>> for chunk in iter_csv_columns(
+    >>>     file="data/datasets/tags.csv",
+    >>>     columns_types={
+    >>>         "userId": "int32",
+    >>>         "movieId": "int32",
+    >>>         "tag": "str",
+    >>>         "timestamp": "int64",
+    >>>     },
+    >>>     chunk_size=100000,
+    >>> ):
+    >>>     print(len(chunk["tag"], ), )
+"""
+
+
+import os
+import numpy as np
+
+from array import array
+from csv import Error, reader
+from hashlib import sha256
+from itertools import islice
+from json import JSONDecodeError, dump, load
+from typing import Any, Iterator, Literal
+
+
+ARRAY_TYPECODES: dict[str, str] = {
+    "int32": 'i',
+    "int64": 'q',
+    "float32": 'f',
+    "float64": 'd',
+}
+
+
+def iter_csv_columns(
+    file: str,
+    columns_types: dict[str, Literal["int32", "int64", "float32", "float64",
+                                     "str",
+    ]],
+    size: int | None = None,
+    chunk_size: int = 65536
+) -> Iterator[dict[str, np.ndarray | list[str]]]:
+    """
+    Yield columns of a `.csv` file chunk by chunk.
+
+    Only one chunk of rows is kept in memory at a time, numeric columns are
+    converted to NumPy arrays, text columns are kept as lists of strings.
+
+    :Parameters:
+        file (str): Path to the `.csv` file.
+        columns_types (dict[str, Literal["int32", "int64", "float32",
+                                         "float64", "str",
+        ]]): Columns names in file order with their data types.
+        size (int | None): Number of data rows to read (excluding header).
+                           Default: None (whole file).
+        chunk_size (int): Number of rows in every chunk.
+                          Default: 65536.
+
+    :Yields:
+        dict[str, np.ndarray | list[str]]:
+            Keys (str): Columns names.
+            Values (np.ndarray | list[str]): Chunk columns values.
+
+    :Exceptions:
+        FileNotFoundError: When file does not exist.
+        IOError: When file can not be read.
+        IndexError: When lines do not contain expected columns.
+        ValueError: When values can not be converted to columns types.
+        Error: When file is not a valid `.csv` file.
+    """
+
+    cols_cnt: int = len(columns_types, )
+    convs: list[Any] = [
+        int if col_type.startswith("int", ) else
+        float if col_type.startswith("float", ) else
+        None
+        for col_type in columns_types.values()
+    ]
+
+    with open(
+        file=file,
+        mode='r',
+        encoding="utf-8",
+        newline='',
+    ) as csv_file:
+        csv_reader: Any = reader(csv_file, )
+
+        next(csv_reader, )  # Skip header
+
+        if size is not None:
+            csv_reader = islice(csv_reader, size, )
+
+        while rows := list(islice(csv_reader, chunk_size, ), ):
+            if any(len(row, ) != cols_cnt for row in rows):
+                raise IndexError("line does not contain expected columns", )
+
+            yield {
+                col_name: list(vals, ) if conv is None else np.fromiter(
+                    map(conv, vals, ),
+                    dtype=col_type,
+                    count=len(vals, ),
+                )
+                for (col_name, col_type), conv, vals
+                in zip(columns_types.items(), convs, zip(*rows, ), )
+            }
+
+def get_columns_cache_files(
+    file: str,
+    columns_types: dict[str, str],
+    cache_path: str
+) -> dict[str, str]:
+    """
+    Get paths of the binary cache files of a `.csv` file.
+
+    Files are named by the `.csv` file name and a hash of its absolute path,
+    so files with the same name in different directories do not share a
+    cache.
+
+    :Parameters:
+        file (str): Path to the `.csv` file.
+        columns_types (dict[str, str]): Columns names with their data types.
+        cache_path (str): Path to the cache directory.
+
+    :Returns:
+        dict[str, str]:
+            Keys (str): Columns names and "meta" for the metadata file.
+            Values (str): Cache files paths.
+    """
+
+    file_name: str = os.path.basename(file, ) + "." + sha256(
+        os.path.abspath(file, ).encode("utf-8", ),
+    ).hexdigest()[: 16]
+
+    return {
+        "meta": os.path.join(cache_path, f"{file_name}.meta.json", ),
+    } | {
+        col_name: os.path.join(cache_path, f"{file_name}.{col_name}.npy", )
+        for col_name in columns_types
+    }
+
+def load_columns_cache(
+    file: str,
+    columns_types: dict[str, str],
+    cache_path: str
+) -> dict[str, np.ndarray | list[str]] | None:
+    """
+    Load columns of a `.csv` file from the binary cache.
+
+    Numeric columns are memory-mapped without copying. The cache is valid
+    only while the `.csv` file modification time and size stay the same.
+
+    :Parameters:
+        file (str): Path to the `.csv` file.
+        columns_types (dict[str, str]): Columns names with their data types.
+        cache_path (str): Path to the cache directory.
+
+    :Returns:
+        dict[str, np.ndarray | list[str]]:
+            Keys (str): Columns names.
+            Values (np.ndarray | list[str]): Columns values of the whole file.
+        None: If cache is missing, stale or can not be read.
+    """
+
+    try:
+        cache_files: dict[str, str] = get_columns_cache_files(
+            file=file,
+            columns_types=columns_types,
+            cache_path=cache_path,
+        )
+        file_stat: os.stat_result = os.stat(file, )
+
+        with open(
+            file=cache_files["meta"],
+            mode='r',
+            encoding="utf-8",
+        ) as meta_file:
+            meta: dict[str, Any] = load(meta_file, )
+
+        if meta != {
+            "mtime_ns": file_stat.st_mtime_ns,
+            "size": file_stat.st_size,
+            "columns_types": columns_types,
+        }:
+            return None
+
+        return {
+            col_name: np.load(cache_files[col_name], mmap_mode='r', )
+            if col_type in ARRAY_TYPECODES else
+            np.load(cache_files[col_name], ).tolist()
+            for col_name, col_type in columns_types.items()
+        }
+    except (OSError, ValueError, JSONDecodeError, ):
+        return None
+
+def save_columns_cache(
+    file: str,
+    columns_types: dict[str, str],
+    columns: dict[str, np.ndarray | list[str]],
+    cache_path: str
+) -> None:
+    """
+    Save columns of a whole `.csv` file to the binary cache.
+
+    Every column is written to its own `.npy` file, the metadata file with
+    the `.csv` file modification time and size is written last.
+
+    :Parameters:
+        file (str): Path to the `.csv` file.
+        columns_types (dict[str, str]): Columns names with their data types.
+        columns (dict[str, np.ndarray | list[str]]): Columns values.
+        cache_path (str): Path to the cache directory.
+
+    :Exceptions:
+        OSError: When cache files can not be written.
+        Exception: All other errors.
+    """
+
+    try:
+        cache_files: dict[str, str] = get_columns_cache_files(
+            file=file,
+            columns_types=columns_types,
+            cache_path=cache_path,
+        )
+        file_stat: os.stat_result = os.stat(file, )
+
+        os.makedirs(cache_path, exist_ok=True, )
+
+        if os.path.exists(cache_files["meta"], ):
+            os.remove(cache_files["meta"], )  # Invalidate old cache first
+
+        for col_name, col in columns.items():
+            with open(
+                file=cache_files[col_name] + ".tmp",
+                mode="wb",
+            ) as cache_file:
+                np.save(cache_file, np.asarray(col, dtype=(
+                    columns_types[col_name]
+                    if columns_types[col_name] in ARRAY_TYPECODES else str
+                ), ), )
+
+            os.replace(cache_files[col_name] + ".tmp", cache_files[col_name], )
+
+        with open(
+            file=cache_files["meta"],
+            mode='w',
+            encoding="utf-8",
+        ) as meta_file:
+            dump({
+                "mtime_ns": file_stat.st_mtime_ns,
+                "size": file_stat.st_size,
+                "columns_types": columns_types,
+            }, meta_file, )
+    except OSError as os_err:
+        print("OSError:", os_err, )
+    except Exception as err:
+        print("Exception:", err, )
+
+def load_csv_columns(
+    file: str,
+    columns_types: dict[str, Literal["int32", "int64", "float32", "float64",
+                                     "str",
+    ]],
+    size: int | None = None,
+    chunk_size: int = 65536,
+    cache_path: str | None = None
+) -> dict[str, np.ndarray | list[str]] | None:
+    """
+    Load all columns of a `.csv` file in a single pass.
+
+    Numeric columns are accumulated in typed buffers and exposed as NumPy
+    arrays without copying, text columns are kept as lists of strings.
+    With `cache_path` set, the whole file is parsed once and saved to a
+    binary cache, later loads memory-map it until the file changes.
+
+    :Parameters:
+        file (str): Path to the `.csv` file.
+        columns_types (dict[str, Literal["int32", "int64", "float32",
+                                         "float64", "str",
+        ]]): Columns names in file order with their data types.
+        size (int | None): Number of data rows to load (excluding header).
+                           Default: None (whole file).
+        chunk_size (int): Number of rows converted at once.
+                          Default: 65536.
+        cache_path (str | None): Path to the binary cache directory.
+                                 Default: None (no cache).
+
+    :Returns:
+        dict[str, np.ndarray | list[str]]:
+            Keys (str): Columns names.
+            Values (np.ndarray | list[str]): Columns values.
+        None: If error occurs or no data is loaded.
+
+    :Exceptions:
+        FileNotFoundError: When file does not exist.
+        IOError: When file can not be read.
+        IndexError: When lines do not contain expected columns.
+        ValueError: When values can not be converted to columns types.
+        Error: When file is not a valid `.csv` file.
+        Exception: All other errors.
+    """
+
+    try:
+        if cache_path is not None:
+            cached_cols: dict[str, Any] | None = load_columns_cache(
+                file=file,
+                columns_types=columns_types,
+                cache_path=cache_path,
+            )
+
+            if cached_cols is None:
+                cached_cols = load_csv_columns(
+                    file=file,
+                    columns_types=columns_types,
+                    chunk_size=chunk_size,
+                )
+
+                if cached_cols is None:
+                    return None
+
+                save_columns_cache(
+                    file=file,
+                    columns_types=columns_types,
+                    columns=cached_cols,
+                    cache_path=cache_path,
+                )
+
+            return {
+                col_name: col[: size]
+                for col_name, col in cached_cols.items()
+            }
+
+        cols: dict[str, Any] = {
+            col_name: array(ARRAY_TYPECODES[col_type], )
+            if col_type in ARRAY_TYPECODES else []
+            for col_name, col_type in columns_types.items()
+        }
+
+        for chunk in iter_csv_columns(
+            file=file,
+            columns_types=columns_types,
+            size=size,
+            chunk_size=chunk_size,
+        ):
+            for col_name, col in cols.items():
+                if isinstance(col, array, ):
+                    col.frombytes(chunk[col_name].tobytes(), )
+                else:
+                    col.extend(chunk[col_name], )
+
+        return {
+            col_name: np.frombuffer(col, dtype=columns_types[col_name], )
+            if isinstance(col, array, ) else col
+            for col_name, col in cols.items()
+        }
+    except FileNotFoundError as file_not_found_err:
+        print("FileNotFoundError:", file_not_found_err, )
+    except IOError as io_err:
+        print("IOError:", io_err, )
+    except IndexError as idx_err:
+        print("IndexError:", idx_err, )
+    except ValueError as val_err:
+        print("ValueError:", val_err, )
+    except Error as csv_err:
+        print("Error:", csv_err, )
+    except Exception as err:
+        print("Exception:", err, )
@@ -5,6 +5,7 @@ Examples of usage:
     >>> inst: Link = Link(file_path="data/datasets/", )
 
     >>> inst.load_data()
+    >>> inst.load_columns()
     >>> inst.load_movies_ids()
     >>> inst.load_imdb_ids()
     >>> inst.load_tmdb_ids()
@@ -48,11 +49,20 @@ sys.path.append(
     ),
 )
 
+import numpy as np
+
 from typing import Literal
 from collections import defaultdict
 
+from src.load_utils import load_csv_columns
+from src.cache_utils import MoviesDataCache
 from src.parse_utils import fetch_movies_webpage_text_fields
-from src.utils import extract_price_from_string, extract_minutes_from_string
+from src.utils import (
+    select_top_indices,
+    extract_price_from_string,
+    extract_minutes_from_string,
+    extract_currency_from_string,
+)
 
 
 class Link:
@@ -63,11 +73,20 @@ class Link:
         file_path (str): Path to the directory containing the `.csv` file.
         file (str): `.csv` file containing links data.
                     Default: "links.csv".
+        cache_path (str | None): Path to the binary columns cache directory.
+                                 Default: None (no cache).
+        web_cache (MoviesDataCache | None): Cache of scraped movies data.
+                                            Default: None (no cache).
 
         data (list): Raw links data.
                      Default: None.
-        movies_ids (list): Movies IDs.
-                           Default: None.
+        columns (dict[str, np.ndarray | list[str]]): Typed columns loaded in
+                                                     one pass.
+                                                     Default: None.
+        columns_size (int): Number of rows requested for `columns`.
+                            Default: 0.
+        movies_ids (np.ndarray): Movies IDs (int32).
+                                 Default: None.
         imdb_ids (list): IMDB IDs.
                          Default: None.
         tmdb_ids (list): TMDB IDs.
@@ -77,12 +96,20 @@ class Link:
                             Default: None.
         movies_data (list): Movies data.
                             Default: None.
+        movies_columns (dict[str, np.ndarray | list]): Movies data
+                                                       normalized to typed
+                                                       columns.
+                                                       Default: None.
     """
 
     def __init__(
         self,
         file_path: str,
-        file: str = "links.csv"
+        file: str = "links.csv",
+        cache_path: str | None = None,
+        web_cache_file: str | None = None,
+        web_cache_ttl: float | None = None,
+        web_cache_size: int = 10000
     ) -> None:
         """
         Initializes the `Link` analyzer.
@@ -91,18 +118,39 @@ class Link:
             file_path (str): Path to the directory containing the `.csv` file.
             file (str): `.csv` file containing links data.
                         Default: "links.csv".
+            cache_path (str | None): Path to the binary columns cache
+                                     directory.
+                                     Default: None (no cache).
+            web_cache_file (str | None): Path to the SQLite cache of scraped
+                                         movies data.
+                                         Default: None (no cache).
+            web_cache_ttl (float | None): Scraped movies data time to live in
+                                          seconds.
+                                          Default: None (never expire).
+            web_cache_size (int): Maximal number of cached movies entries.
+                                  Default: 10000.
         """
 
         self.file_path: str = file_path
         self.file: str = file
+        self.cache_path: str | None = cache_path
+        self.web_cache: MoviesDataCache | None = None if web_cache_file is \
+            None else MoviesDataCache(
+                file=web_cache_file,
+                ttl=web_cache_ttl,
+                max_size=web_cache_size,
+            )
 
         self.data: list | None = None
-        self.movies_ids: list | None = None
+        self.columns: dict[str, np.ndarray | list[str]] | None = None
+        self.columns_size: int = 0
+        self.movies_ids: np.ndarray | None = None
         self.imdb_ids: list | None = None
         self.tmdb_ids: list | None = None
 
         self.extr_fields: list | None = None
         self.movies_data: list | None = None
+        self.movies_columns: dict[str, np.ndarray | list] | None = None
 
     def load_data(self, size: int = 1000) -> None:
         """
@@ -138,6 +186,38 @@ class Link:
         except Exception as err:
             print("Exception:", err, )
 
+    def load_columns(self, size: int = 1000) -> None:
+        """
+        Loads all columns from the `.csv` file in a single pass.
+
+        Already loaded columns are reused while they cover `size` rows.
+
+        :Parameters:
+            size (int): Number of data rows to load (excluding header).
+                        Default: 1000.
+
+        :Exceptions:
+            Exception: All errors.
+        """
+
+        try:
+            if self.columns is not None and self.columns_size >= size:
+                return
+
+            self.columns = load_csv_columns(
+                file=self.file_path + self.file,
+                columns_types={
+                    "movieId": "int32",
+                    "imdbId": "str",
+                    "tmdbId": "str",
+                },
+                size=size,
+                cache_path=self.cache_path,
+            )
+            self.columns_size = size if self.columns is not None else 0
+        except Exception as err:
+            print("Exception:", err, )
+
     def load_movies_ids(self, size: int = 1000) -> None:
         """
         Loads movies IDs from a `.csv` file and save them.
@@ -147,31 +227,19 @@ class Link:
                         Default: 1000.
 
         :Exceptions:
-            FileNotFoundError: When file does not exist.
-            IOError: When file can not be read.
-            IndexError: When lines do not contain expected columns.
+            TypeError: When columns can not be loaded.
+            KeyError: When file does not contain expected columns.
             Exception: All other errors.
         """
 
         try:
-            with open(
-                file=self.file_path + self.file,
-                mode='r',
-                encoding="utf-8",
-            ) as file:
-                next(file, )  # Skip header
+            self.load_columns(size=size, )
 
-                self.movies_ids = [
-                    line.rstrip().split(',', )[0]
-                    for line, _
-                    in zip(file, range(size, ), )
-                ]
-        except FileNotFoundError as file_not_found_err:
-            print("FileNotFoundError:", file_not_found_err, )
-        except IOError as io_err:
-            print("IOError:", io_err, )
-        except IndexError as idx_err:
-            print("IndexError:", idx_err, )
+            self.movies_ids = self.columns["movieId"][: size]
+        except TypeError as type_err:
+            print("TypeError:", type_err, )
+        except KeyError as key_err:
+            print("KeyError:", key_err, )
         except Exception as err:
             print("Exception:", err, )
 
@@ -184,31 +252,19 @@ class Link:
                         Default: 1000.
 
         :Exceptions:
-            FileNotFoundError: When file does not exist.
-            IOError: When file can not be read.
-            IndexError: When lines do not contain expected columns.
+            TypeError: When columns can not be loaded.
+            KeyError: When file does not contain expected columns.
             Exception: All other errors.
         """
 
         try:
-            with open(
-                file=self.file_path + self.file,
-                mode='r',
-                encoding="utf-8",
-            ) as file:
-                next(file, )  # Skip header
+            self.load_columns(size=size, )
 
-                self.imdb_ids = [
-                    line.rstrip().split(',', )[1]
-                    for line, _
-                    in zip(file, range(size, ), )
-                ]
-        except FileNotFoundError as file_not_found_err:
-            print("FileNotFoundError:", file_not_found_err, )
-        except IOError as io_err:
-            print("IOError:", io_err, )
-        except IndexError as idx_err:
-            print("IndexError:", idx_err, )
+            self.imdb_ids = self.columns["imdbId"][: size]
+        except TypeError as type_err:
+            print("TypeError:", type_err, )
+        except KeyError as key_err:
+            print("KeyError:", key_err, )
         except Exception as err:
             print("Exception:", err, )
 
@@ -221,31 +277,19 @@ class Link:
                         Default: 1000.
 
         :Exceptions:
-            FileNotFoundError: When file does not exist.
-            IOError: When file can not be read.
-            IndexError: When lines do not contain expected columns.
+            TypeError: When columns can not be loaded.
+            KeyError: When file does not contain expected columns.
             Exception: All other errors.
         """
 
         try:
-            with open(
-                file=self.file_path + self.file,
-                mode='r',
-                encoding="utf-8",
-            ) as file:
-                next(file, )  # Skip header
+            self.load_columns(size=size, )
 
-                self.tmdb_ids = [
-                    line.rstrip().split(',', )[2]
-                    for line, _
-                    in zip(file, range(size, ), )
-                ]
-        except FileNotFoundError as file_not_found_err:
-            print("FileNotFoundError:", file_not_found_err, )
-        except IOError as io_err:
-            print("IOError:", io_err, )
-        except IndexError as idx_err:
-            print("IndexError:", idx_err, )
+            self.tmdb_ids = self.columns["tmdbId"][: size]
+        except TypeError as type_err:
+            print("TypeError:", type_err, )
+        except KeyError as key_err:
+            print("KeyError:", key_err, )
         except Exception as err:
             print("Exception:", err, )
 
@@ -266,7 +310,9 @@ class Link:
             "country",
             "director",
             "language",
-        ]
+        ],
+        max_workers: int = 8,
+        rate_limit: float | None = None
     ) -> None:
         """
         Loads movies data from IMDB website.
@@ -281,6 +327,10 @@ class Link:
                            "runtime", "release", "country", "director",
                            "language",
                           ].
+            max_workers (int): Maximal number of concurrent requests.
+                               Default: 8.
+            rate_limit (float | None): Maximal number of requests per second.
+                                       Default: None (no limit).
 
         :Exceptions:
             ValueError: When used incorrect data types.
@@ -293,12 +343,121 @@ class Link:
                 movies_ids=movies_ids,
                 fields=fields,
                 req_config_path=self.file_path.split("dataset", )[0],
+                max_workers=max_workers,
+                rate_limit=rate_limit,
+                cache=self.web_cache,
             )
+            self.movies_columns = None
         except ValueError as val_err:
             print("ValueError:", val_err, )
         except Exception as err:
             print("Exception:", err, )
 
+    def load_movies_columns(self) -> None:
+        """
+        Normalizes movies data once into typed columns.
+
+        Budgets and gross are parsed to numbers with their currencies,
+        runtimes to minutes, costs per minute are rounded to 2 decimals.
+        Missing or unparsable values are stored as NaN.
+
+        :Exceptions:
+            TypeError: When movies data are not loaded.
+            Exception: All other errors.
+        """
+
+        try:
+            if self.movies_columns is not None:
+                return
+
+            self.movies_columns = {
+                "titles": [
+                    movie_data[self.fields.index("title", ) + 1]
+                    for movie_data in self.movies_data
+                ] if "title" in self.fields else None,
+            }
+
+            for field, extract in (
+                ("budget", extract_price_from_string, ),
+                ("gross", extract_price_from_string, ),
+                ("runtime", extract_minutes_from_string, ),
+            ):
+                if field not in self.fields:
+                    continue
+
+                raw_vals: list[str | None] = [
+                    movie_data[self.fields.index(field, ) + 1]
+                    for movie_data in self.movies_data
+                ]
+
+                self.movies_columns[f"{field}_raw"] = raw_vals
+                self.movies_columns[field] = np.array([
+                    np.nan if val is None or (num := extract(val, )) is None
+                    else num
+                    for val in raw_vals
+                ], dtype=np.float64, )
+
+                if field != "runtime":
+                    self.movies_columns[f"{field}_currency"] = [
+                        extract_currency_from_string(price=val, )
+                        for val in raw_vals
+                    ]
+
+            if "budget" in self.movies_columns and \
+               "runtime" in self.movies_columns:
+                self.movies_columns["cost_per_minute"] = np.array([
+                    round(budget / runtime, 2, ) if runtime > 0 else np.nan
+                    for budget, runtime in zip(
+                        self.movies_columns["budget"].tolist(),
+                        self.movies_columns["runtime"].tolist(),
+                    )
+                ], dtype=np.float64, )
+        except TypeError as type_err:
+            print("TypeError:", type_err, )
+        except Exception as err:
+            print("Exception:", err, )
+
+    def get_top_movies(
+        self,
+        mask: np.ndarray,
+        vals: np.ndarray,
+        cnt: int
+    ) -> list[tuple[str, int]]:
+        """
+        Retrieves the movies with the largest values.
+
+        Rows are deduplicated by title like a dictionary built over them:
+        a title keeps the position of its first row and the value of its
+        last row.
+
+        :Parameters:
+            mask (np.ndarray): Rows to rank.
+            vals (np.ndarray): Values of all rows.
+            cnt (int): Number of movies to return.
+
+        :Returns:
+            list[tuple[str, int]]: Titles with their rows indices sorted by
+                                   values.
+        """
+
+        titles: list[str] = self.movies_columns["titles"]
+        titles_rows: dict[str, int] = {
+            titles[row_idx]: row_idx
+            for row_idx in np.flatnonzero(mask, ).tolist()
+        }
+        rows_idxs: np.ndarray = np.fromiter(
+            titles_rows.values(),
+            dtype=np.int64,
+            count=len(titles_rows, ),
+        )
+
+        return [
+            (titles[row_idx], row_idx, )
+            for row_idx in rows_idxs[
+                select_top_indices(vals=vals[rows_idxs], cnt=cnt, )
+            ].tolist()
+        ]
+
     def print_data(self) -> None:
         """
         Prints the stored data.
@@ -478,18 +637,24 @@ class Link:
         """
 
         try:
-            titles_idx: int = self.fields.index("title", ) + 1
-            budgets_idx: int = self.fields.index("budget", ) + 1
-            movies_with_budget: dict[str, str] = {
-                movie_data[titles_idx]: movie_data[budgets_idx]
-                for movie_data in self.movies_data
-                if movie_data[budgets_idx]
+            self.fields.index("title", )
+            self.fields.index("budget", )
+            self.load_movies_columns()
+
+            budgets_raw: list[str | None] = self.movies_columns["budget_raw"]
+            budgets: np.ndarray = self.movies_columns["budget"]
+
+            return {
+                title: budgets_raw[row_idx]
+                for title, row_idx in self.get_top_movies(
+                    mask=~np.isnan(budgets, ) & np.array(
+                        [bool(budget, ) for budget in budgets_raw],
+                        dtype=bool,
+                    ),
+                    vals=budgets,
+                    cnt=cnt,
+                )
             }
-
-            return dict(sorted(
-                movies_with_budget.items(),
-                key=lambda movie: -extract_price_from_string(movie[1], ),
-            )[: cnt], )
         except AttributeError as attr_err:
             print("AttributeError:", attr_err, )
         except ValueError as val_err:
@@ -524,22 +689,22 @@ class Link:
         """
 
         try:
-            gross_idx: int = self.fields.index("gross", ) + 1
-            titles_idx: int = self.fields.index("title", ) + 1
-            budgets_idx: int = self.fields.index("budget", ) + 1
-            movies_with_diffs: dict[str, int] = {
-                movie_data[titles_idx]:
-                    extract_price_from_string(movie_data[gross_idx], ) -
-                    extract_price_from_string(movie_data[budgets_idx], )
-                for movie_data in self.movies_data
-                if movie_data[gross_idx] is not None and
-                   movie_data[budgets_idx] is not None
+            self.fields.index("gross", )
+            self.fields.index("title", )
+            self.fields.index("budget", )
+            self.load_movies_columns()
+
+            diffs: np.ndarray = self.movies_columns["gross"] - \
+                self.movies_columns["budget"]
+
+            return {
+                title: int(diffs[row_idx], )
+                for title, row_idx in self.get_top_movies(
+                    mask=~np.isnan(diffs, ),
+                    vals=diffs,
+                    cnt=cnt,
+                )
             }
-
-            return dict(sorted(
-                movies_with_diffs.items(),
-                key=lambda movie_with_diff: -movie_with_diff[1],
-            )[: cnt], )
         except AttributeError as attr_err:
             print("AttributeError:", attr_err, )
         except ValueError as val_err:
@@ -571,20 +736,20 @@ class Link:
         """
 
         try:
-            titles_idx: int = self.fields.index("title", ) + 1
-            runtimes_idx: int = self.fields.index("runtime", ) + 1
-            movies_with_runtimes: dict[str, str] = {
-                movie_data[titles_idx]: movie_data[runtimes_idx]
-                for movie_data in self.movies_data
-                if movie_data[runtimes_idx] is not None
+            self.fields.index("title", )
+            self.fields.index("runtime", )
+            self.load_movies_columns()
+
+            runtimes: np.ndarray = self.movies_columns["runtime"]
+
+            return {
+                title: self.movies_columns["runtime_raw"][row_idx]
+                for title, row_idx in self.get_top_movies(
+                    mask=~np.isnan(runtimes, ),
+                    vals=runtimes,
+                    cnt=cnt,
+                )
             }
-
-            return dict(sorted(
-                movies_with_runtimes.items(),
-                key=lambda movie_data: -extract_minutes_from_string(
-                    movie_data[1],
-                ),
-            )[: cnt], )
         except AttributeError as attr_err:
             print("AttributeError:", attr_err, )
         except ValueError as val_err:
@@ -619,27 +784,21 @@ class Link:
         """
 
         try:
-            titles_idx: int = self.fields.index("title", ) + 1
-            budgets_idx: int = self.fields.index("budget", ) + 1
-            runtimes_idx: int = self.fields.index("runtime", ) + 1
-            movies_min_costs: dict[str, float] = {}
-
-            for movie_data in self.movies_data:
-                title: str = movie_data[titles_idx]
-                budget: float = extract_price_from_string(
-                    movie_data[budgets_idx],
+            self.fields.index("title", )
+            self.fields.index("budget", )
+            self.fields.index("runtime", )
+            self.load_movies_columns()
+
+            min_costs: np.ndarray = self.movies_columns["cost_per_minute"]
+
+            return {
+                title: min_costs[row_idx].item()
+                for title, row_idx in self.get_top_movies(
+                    mask=~np.isnan(min_costs, ),
+                    vals=min_costs,
+                    cnt=cnt,
                 )
-                runtime: float = extract_minutes_from_string(
-                    movie_data[runtimes_idx],
-                )
-
-                if None not in (budget, runtime, ):
-                    movies_min_costs[title] = round(budget / runtime, 2, )
-
-            return dict(sorted(
-                movies_min_costs.items(),
-                key=lambda movie_data: -movie_data[1],
-            )[: cnt], )
+            }
         except AttributeError as attr_err:
             print("AttributeError:", attr_err, )
         except ValueError as val_err:
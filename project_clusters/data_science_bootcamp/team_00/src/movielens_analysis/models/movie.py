@@ -5,6 +5,7 @@ Examples of usage:
     >>> inst: Movie = Movie(file_path="data/datasets/", )
 
     >>> inst.load_data()
+    >>> inst.load_columns()
     >>> inst.load_movies_ids()
     >>> inst.load_titles()
     >>> inst.load_genres()
@@ -38,6 +39,9 @@ sys.path.append(
     ),
 )
 
+import numpy as np
+
+from heapq import nlargest
 from re import error, compile
 from typing import Any, Literal
 from collections import (
@@ -46,7 +50,7 @@ from collections import (
     defaultdict,
 )
 
-from src.utils import calculate_metric
+from src.load_utils import load_csv_columns
 from src.movielens_analysis.models.rating import Rating
 
 
@@ -58,21 +62,34 @@ class Movie:
         file_path (str): Path to the directory containing the `.csv` file.
         file (str): `.csv` file containing movies data.
                     Default: "movies.csv".
+        chunk_size (int | None): Rows per chunk to stream the whole ratings
+                                 file in metric methods.
+                                 Default: None (use loaded columns).
+        cache_path (str | None): Path to the binary columns cache directory.
+                                 Default: None (no cache).
 
         data (list): Movies data rows.
                      Default: None.
-        movies_ids (list): Movies IDs.
-                           Default: None.
+        columns (dict[str, np.ndarray | list[str]]): Typed columns loaded in
+                                                     one pass.
+                                                     Default: None.
+        columns_size (int): Number of rows requested for `columns`.
+                            Default: 0.
+        movies_ids (np.ndarray): Movies IDs (int32).
+                                 Default: None.
         titles (list): Titles.
                        Default: None.
         genres (list[list]]): Genres.
                               Default: None.
+        rating (Rating): Ratings data analyzer shared between calls.
     """
 
     def __init__(
         self,
         file_path: str,
-        file: str = "movies.csv"
+        file: str = "movies.csv",
+        chunk_size: int | None = None,
+        cache_path: str | None = None
     ) -> None:
         """
         Initializes the `Movie` analyzer.
@@ -81,15 +98,29 @@ class Movie:
             file_path (str): Path to the directory containing the `.csv` file.
             file (str): `.csv` file containing movies data.
                         Default: "movies.csv".
+            chunk_size (int | None): Rows per chunk to stream the whole
+                                     ratings file in metric methods.
+                                     Default: None (use loaded columns).
+            cache_path (str | None): Path to the binary columns cache
+                                     directory.
+                                     Default: None (no cache).
         """
 
         self.file_path: str = file_path
         self.file: str = file
+        self.cache_path: str | None = cache_path
 
         self.data: list | None = None
-        self.movies_ids: list | None = None
+        self.columns: dict[str, np.ndarray | list[str]] | None = None
+        self.columns_size: int = 0
+        self.movies_ids: np.ndarray | None = None
         self.titles: list | None = None
         self.genres: list[list] | None = None
+        self.rating: Rating = Rating(
+            file_path=file_path,
+            chunk_size=chunk_size,
+            cache_path=cache_path,
+        )
 
     def load_data(self, size: int = 1000) -> None:
         """
@@ -124,6 +155,38 @@ class Movie:
         except Exception as err:
             print("Exception:", err, )
 
+    def load_columns(self, size: int = 1000) -> None:
+        """
+        Loads all columns from the `.csv` file in a single pass.
+
+        Already loaded columns are reused while they cover `size` rows.
+
+        :Parameters:
+            size (int): Number of data rows to load (excluding header).
+                        Default: 1000.
+
+        :Exceptions:
+            Exception: All errors.
+        """
+
+        try:
+            if self.columns is not None and self.columns_size >= size:
+                return
+
+            self.columns = load_csv_columns(
+                file=self.file_path + self.file,
+                columns_types={
+                    "movieId": "int32",
+                    "title": "str",
+                    "genres": "str",
+                },
+                size=size,
+                cache_path=self.cache_path,
+            )
+            self.columns_size = size if self.columns is not None else 0
+        except Exception as err:
+            print("Exception:", err, )
+
     def load_movies_ids(self, size: int = 1000) -> None:
         """
         Loads movies IDs from a `.csv` file.
@@ -133,35 +196,23 @@ class Movie:
                         Default: 1000.
 
         :Exceptions:
-            FileNotFoundError: When file does not exist.
-            IOError: When file can not be read.
-            IndexError: When lines do not contain expected columns.
+            TypeError: When columns can not be loaded.
+            KeyError: When file does not contain expected columns.
             Exception: All other errors.
         """
 
         try:
-            with open(
-                file=self.file_path + self.file,
-                mode='r',
-                encoding="utf-8",
-            ) as file:
-                next(file, )  # Skip header
+            self.load_columns(size=size, )
 
-                self.movies_ids = [
-                    line.rstrip().split(',', )[0]
-                    for line, _
-                    in zip(file, range(size, ), )
-                ]
-        except FileNotFoundError as file_not_found_err:
-            print("FileNotFoundError:", file_not_found_err, )
-        except IOError as io_err:
-            print("IOError:", io_err, )
-        except IndexError as idx_err:
-            print("IndexError:", idx_err, )
+            self.movies_ids = self.columns["movieId"][: size]
+        except TypeError as type_err:
+            print("TypeError:", type_err, )
+        except KeyError as key_err:
+            print("KeyError:", key_err, )
         except Exception as err:
             print("Exception:", err, )
 
-    def load_titles(self,  size: int = 1000) -> None:
+    def load_titles(self, size: int = 1000) -> None:
         """
         Loads movies titles from a `.csv` file.
 
@@ -170,44 +221,19 @@ class Movie:
                         Default: 1000.
 
         :Exceptions:
-            FileNotFoundError: When file does not exist.
-            IOError: When file can not be read.
-            IndexError: When lines do not contain expected columns.
+            TypeError: When columns can not be loaded.
+            KeyError: When file does not contain expected columns.
             Exception: All other errors.
         """
 
         try:
-            self.titles = []
-            title_regex: Any = compile(r'(?:^|,)(?:"([^"]+)"|([^",]+))', )
-
-            with open(
-                file=self.file_path + self.file,
-                mode='r',
-                encoding="utf-8",
-            ) as file:
-                next(file, )  # Skip header
+            self.load_columns(size=size, )
 
-                for idx, title in enumerate(file, ):
-                    if idx >= size:
-                        break
-
-                    title_matches: list | None = title_regex.findall(
-                        title.strip(),
-                    )
-                    title: list[str] = [
-                        match[0] or match[1]
-                        for match in title_matches
-                        if match[0] or match[1]
-                    ]
-
-                    if len(title, ) > 1:
-                        self.titles.append(title[1], )
-        except FileNotFoundError as file_not_found_err:
-            print("FileNotFoundError:", file_not_found_err, )
-        except IOError as io_err:
-            print("IOError:", io_err, )
-        except IndexError as idx_err:
-            print("IndexError:", idx_err, )
+            self.titles = self.columns["title"][: size]
+        except TypeError as type_err:
+            print("TypeError:", type_err, )
+        except KeyError as key_err:
+            print("KeyError:", key_err, )
         except Exception as err:
             print("Exception:", err, )
 
@@ -220,31 +246,22 @@ class Movie:
                         Default: 1000.
 
         :Exceptions:
-            FileNotFoundError: When file does not exist.
-            IOError: When file can not be read.
-            IndexError: When lines do not contain expected columns.
+            TypeError: When columns can not be loaded.
+            KeyError: When file does not contain expected columns.
             Exception: All other errors.
         """
 
         try:
-            with open(
-                file=self.file_path + self.file,
-                mode='r',
-                encoding="utf-8",
-            ) as file:
-                next(file, )  # Skip header
+            self.load_columns(size=size, )
 
-                self.genres = [
-                    line.rstrip().split(',', )[-1].split('|', )
-                    for line, _
-                    in zip(file, range(size, ), )
-                ]
-        except FileNotFoundError as file_not_found_err:
-            print("FileNotFoundError:", file_not_found_err, )
-        except IOError as io_err:
-            print("IOError:", io_err, )
-        except IndexError as idx_err:
-            print("IndexError:", idx_err, )
+            self.genres = [
+                genres.split('|', )
+                for genres in self.columns["genres"][: size]
+            ]
+        except TypeError as type_err:
+            print("TypeError:", type_err, )
+        except KeyError as key_err:
+            print("KeyError:", key_err, )
         except Exception as err:
             print("Exception:", err, )
 
@@ -453,22 +470,23 @@ class Movie:
         """
 
         try:
-            inst: Rating = Rating(file_path=self.file_path, )
-
-            inst.load_movies_ids()
-
+            movies_cnts: dict[int, int] = self.rating.get_ids_counts(
+                column="movieId",
+            )
             movies_with_ids: dict[str, int] = dict(zip(
                 self.titles,
-                self.movies_ids,
+                self.movies_ids.tolist(),
             ), )
 
-            return dict(sorted({
-                    title: inst.movies_ids.count(ratings_cnt, )
-                    for title, ratings_cnt
+            return dict(nlargest(
+                cnt,
+                [
+                    (title, movies_cnts.get(movie_id, 0, ), )
+                    for title, movie_id
                     in movies_with_ids.items()
-                }.items(),
-                key=lambda ratings_cnt: -ratings_cnt[1],
-            )[: cnt], )
+                ],
+                key=lambda ratings_cnt: ratings_cnt[1],
+            ), )
         except ValueError as val_err:
             print("ValueError:", val_err, )
         except TypeError as type_err:
@@ -516,52 +534,20 @@ class Movie:
 
         try:
             res: dict[str, float] = {}
-            inst: Rating = Rating(file_path=self.file_path, )
-
-            inst.load_ratings()
+            feats_metrics: dict[int, float] = self.rating.get_ratings_metric(
+                column=target_feat,
+                metric=metric,
+            )
 
             if target_feat == "movieId":
-                inst.load_movies_ids()
-
-                movies_data: dict[str, str] = dict(zip(
-                    self.movies_ids,
-                    self.titles,
-                ), )
-                movies_ratings: dict[str, str] = list(zip(
-                    inst.movies_ids,
-                    inst.ratings,
-                ), )
-
-                for movie_id in movies_data.keys():
-                    movie_ratings: list[float] = []
-
-                    for rating in movies_ratings:
-                        if rating[0] == movie_id:
-                            movie_ratings.append(float(rating[1], ), )
-
-                    res[movie_id] = calculate_metric(
-                        vals=movie_ratings,
-                        metric=metric,
-                    )
+                for movie_id in dict.fromkeys(self.movies_ids.tolist(), ):
+                    res[str(movie_id, )] = feats_metrics.get(movie_id, )
             elif target_feat == "userId":
-                inst.load_users_ids()
-
-                users_with_ratings: dict[str, str] = list(zip(
-                    inst.users_ids,
-                    inst.ratings,
-                ), )
-
-                for user_id in inst.users_ids:
-                    user_ratings: list[float] = []
-
-                    for user_with_rating in users_with_ratings:
-                        if user_with_rating[0] == user_id:
-                            user_ratings.append(float(user_with_rating[1], ), )
-
-                    res[user_id] = calculate_metric(
-                        vals=user_ratings,
-                        metric=metric,
-                    )
+                res = {
+                    str(user_id, ): metric_val
+                    for user_id, metric_val
+                    in feats_metrics.items()
+                }
 
             clean_res: dict[str, float] = {
                 title: metric_val
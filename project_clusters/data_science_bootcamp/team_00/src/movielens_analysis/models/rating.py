@@ -3,8 +3,17 @@
 
 Examples of usage:
     >>> inst: Rating = Rating(file_path="data/datasets/", )
+    >>> stream_inst: Rating = Rating(
+    >>>     file_path="data/datasets/",
+    >>>     chunk_size=100000,
+    >>> )
+    >>> cached_inst: Rating = Rating(
+    >>>     file_path="data/datasets/",
+    >>>     cache_path="data/cache/",
+    >>> )
 
     >>> inst.load_data()
+    >>> inst.load_columns()
     >>> inst.load_users_ids()
     >>> inst.load_movies_ids()
     >>> inst.load_ratings()
@@ -16,12 +25,43 @@ Examples of usage:
     >>> inst.print_ratings()
     >>> inst.print_timestamps()
 
+    >>> print(inst.get_ids_counts(column="movieId", ), )
     >>> print(inst.get_top_release_years(), )
     >>> print(inst.get_top_ratings(), )
+    >>> print(inst.get_ratings_metric(column="userId", metric="std", ), )
+
+    >>> print(stream_inst.get_top_release_years(), )
+    >>> print(stream_inst.get_top_ratings(), )
+    >>> print(stream_inst.get_ratings_metric(column="movieId", ), )
+
+    >>> cached_inst.load_columns(size=100000, )
 """
 
 
-from datetime import datetime
+import os
+import sys
+
+sys.path.append(
+    os.path.normpath(
+        os.path.join(
+            os.path.dirname(
+                os.path.abspath(__file__, ),
+            ),
+            '..',
+            '..',
+            '..',
+        ),
+    ),
+)
+
+import numpy as np
+
+from typing import Iterator, Literal
+from collections import Counter
+
+from src.stream_utils import GroupsRunningStats
+from src.utils import calculate_groups_metric, calculate_years_counts
+from src.load_utils import iter_csv_columns, load_csv_columns
 
 
 class Rating:
@@ -32,23 +72,38 @@ class Rating:
         file_path (str): Path to the directory containing the `.csv` file.
         file (str): `.csv` file containing ratings data.
                     Default: "ratings.csv".
+        chunk_size (int | None): Rows per chunk to stream the whole file in
+                                 analytics methods.
+                                 Default: None (use loaded columns).
+        cache_path (str | None): Path to the binary columns cache directory.
+                                 Default: None (no cache).
 
         data (list): Raw ratings data rows.
                      Default: None.
-        users_ids (list): Users IDs.
+        columns (dict[str, np.ndarray]): Typed columns loaded in one pass.
+                                         Default: None.
+        columns_size (int): Number of rows requested for `columns`.
+                            Default: 0.
+        users_ids (np.ndarray): Users IDs (int32).
+                                Default: None.
+        movies_ids (np.ndarray): Movies IDs (int32).
+                                 Default: None.
+        ratings (np.ndarray): Ratings values (float32).
+                              Default: None.
+        tss (np.ndarray): Timestamps values (int64).
                           Default: None.
-        movies_ids (list): Movies IDs.
-                           Default: None.
-        ratings (list): Ratings values.
-                        Default: None.
-        tss (list): Timestamps values.
-                    Default: None.
+        ids_cnts (dict[tuple[str, int], dict[int, int]]): Cached IDs counts
+                                                          by column and rows
+                                                          number.
+                                                          Default: {}.
     """
 
     def __init__(
         self,
         file_path: str,
-        file: str = "ratings.csv"
+        file: str = "ratings.csv",
+        chunk_size: int | None = None,
+        cache_path: str | None = None
     ) -> None:
         """
         Initializes the `Rating` analyzer.
@@ -57,16 +112,27 @@ class Rating:
             file_path (str): Path to the directory containing the `.csv` file.
             file (str): `.csv` file containing ratings data.
                         Default: "ratings.csv".
+            chunk_size (int | None): Rows per chunk to stream the whole file
+                                     in analytics methods.
+                                     Default: None (use loaded columns).
+            cache_path (str | None): Path to the binary columns cache
+                                     directory.
+                                     Default: None (no cache).
         """
 
         self.file_path: str = file_path
         self.file: str = file
+        self.chunk_size: int | None = chunk_size
+        self.cache_path: str | None = cache_path
 
         self.data: list | None = None
-        self.users_ids: list | None = None
-        self.movies_ids: list | None = None
-        self.ratings: list | None = None
-        self.tss: list | None = None
+        self.columns: dict[str, np.ndarray] | None = None
+        self.columns_size: int = 0
+        self.users_ids: np.ndarray | None = None
+        self.movies_ids: np.ndarray | None = None
+        self.ratings: np.ndarray | None = None
+        self.tss: np.ndarray | None = None
+        self.ids_cnts: dict[tuple[str, int], dict[int, int]] = {}
 
     def load_data(self, size: int = 1000) -> None:
         """
@@ -101,6 +167,70 @@ class Rating:
         except Exception as err:
             print("Exception:", err, )
 
+    def load_columns(self, size: int = 1000) -> None:
+        """
+        Loads all columns from the `.csv` file in a single pass.
+
+        Already loaded columns are reused while they cover `size` rows.
+
+        :Parameters:
+            size (int): Number of data rows to load (excluding header).
+                        Default: 1000.
+
+        :Exceptions:
+            Exception: All errors.
+        """
+
+        try:
+            if self.columns is not None and self.columns_size >= size:
+                return
+
+            self.columns = load_csv_columns(
+                file=self.file_path + self.file,
+                columns_types={
+                    "userId": "int32",
+                    "movieId": "int32",
+                    "rating": "float32",
+                    "timestamp": "int64",
+                },
+                size=size,
+                cache_path=self.cache_path,
+            )
+            self.columns_size = size if self.columns is not None else 0
+        except Exception as err:
+            print("Exception:", err, )
+
+    def iter_columns_chunks(self) -> Iterator[dict[str, np.ndarray]]:
+        """
+        Yields typed columns of the whole `.csv` file chunk by chunk.
+
+        Errors are not handled here: they reach the calling method, which
+        returns None as in-memory mode does.
+
+        :Yields:
+            dict[str, np.ndarray]:
+                Keys (str): Columns names.
+                Values (np.ndarray): Chunk columns values.
+
+        :Exceptions:
+            FileNotFoundError: When file does not exist.
+            IOError: When file can not be read.
+            IndexError: When lines do not contain expected columns.
+            ValueError: When values can not be converted to columns types.
+            Exception: All other errors.
+        """
+
+        yield from iter_csv_columns(
+            file=self.file_path + self.file,
+            columns_types={
+                "userId": "int32",
+                "movieId": "int32",
+                "rating": "float32",
+                "timestamp": "int64",
+            },
+            chunk_size=self.chunk_size or 65536,
+        )
+
     def load_users_ids(self, size: int = 1000) -> None:
         """
         Loads users IDs from a `.csv` file.
@@ -110,31 +240,19 @@ class Rating:
                         Default: 1000.
 
         :Exceptions:
-            FileNotFoundError: When file does not exist.
-            IOError: When file cannot be read.
-            IndexError: When lines do not contain expected columns.
+            TypeError: When columns can not be loaded.
+            KeyError: When file does not contain expected columns.
             Exception: All other errors.
         """
 
         try:
-            with open(
-                file=self.file_path + self.file,
-                mode='r',
-                encoding="utf-8",
-            ) as file:
-                next(file, )  # Skip header
+            self.load_columns(size=size, )
 
-                self.users_ids = [
-                    line.rstrip().split(',', )[0]
-                    for line, _
-                    in zip(file, range(size, ), )
-                ]
-        except FileNotFoundError as file_not_found_err:
-            print("FileNotFoundError:", file_not_found_err, )
-        except IOError as io_err:
-            print("IOError:", io_err, )
-        except IndexError as idx_err:
-            print("IndexError:", idx_err, )
+            self.users_ids = self.columns["userId"][: size]
+        except TypeError as type_err:
+            print("TypeError:", type_err, )
+        except KeyError as key_err:
+            print("KeyError:", key_err, )
         except Exception as err:
             print("Exception:", err, )
 
@@ -147,31 +265,19 @@ class Rating:
                         Default: 1000.
 
         :Exceptions:
-            FileNotFoundError: When file does not exist.
-            IOError: When file can not be read.
-            IndexError: When lines do not contain expected columns.
+            TypeError: When columns can not be loaded.
+            KeyError: When file does not contain expected columns.
             Exception: All other errors.
         """
 
         try:
-            with open(
-                file=self.file_path + self.file,
-                mode='r',
-                encoding="utf-8",
-            ) as file:
-                next(file, )  # Skip header
+            self.load_columns(size=size, )
 
-                self.movies_ids = [
-                    line.rstrip().split(',', )[1]
-                    for line, _
-                    in zip(file, range(size, ), )
-                ]
-        except FileNotFoundError as file_not_found_err:
-            print("FileNotFoundError:", file_not_found_err, )
-        except IOError as io_err:
-            print("IOError:", io_err, )
-        except IndexError as idx_err:
-            print("IndexError:", idx_err, )
+            self.movies_ids = self.columns["movieId"][: size]
+        except TypeError as type_err:
+            print("TypeError:", type_err, )
+        except KeyError as key_err:
+            print("KeyError:", key_err, )
         except Exception as err:
             print("Exception:", err, )
 
@@ -184,31 +290,19 @@ class Rating:
                         Default: 1000.
 
         :Exceptions:
-            FileNotFoundError: When file does not exist.
-            IOError: When file can not be read.
-            IndexError: When lines do not contain expected columns.
+            TypeError: When columns can not be loaded.
+            KeyError: When file does not contain expected columns.
             Exception: All other errors.
         """
 
         try:
-            with open(
-                file=self.file_path + self.file,
-                mode='r',
-                encoding="utf-8",
-            ) as file:
-                next(file, )  # Skip header
+            self.load_columns(size=size, )
 
-                self.ratings = [
-                    line.rstrip().split(',', )[2]
-                    for line, _
-                    in zip(file, range(size, ), )
-                ]
-        except FileNotFoundError as file_not_found_err:
-            print("FileNotFoundError:", file_not_found_err, )
-        except IOError as io_err:
-            print("IOError:", io_err, )
-        except IndexError as idx_err:
-            print("IndexError:", idx_err, )
+            self.ratings = self.columns["rating"][: size]
+        except TypeError as type_err:
+            print("TypeError:", type_err, )
+        except KeyError as key_err:
+            print("KeyError:", key_err, )
         except Exception as err:
             print("Exception:", err, )
 
@@ -221,31 +315,19 @@ class Rating:
                         Default: 1000.
 
         :Exceptions:
-            FileNotFoundError: When file does not exist.
-            IOError: When file can not be read.
-            IndexError: When lines do not contain expected columns.
+            TypeError: When columns can not be loaded.
+            KeyError: When file does not contain expected columns.
             Exception: All other errors.
         """
 
         try:
-            with open(
-                file=self.file_path + self.file,
-                mode='r',
-                encoding="utf-8",
-            ) as file:
-                next(file, )  # Skip header
+            self.load_columns(size=size, )
 
-                self.tss = [
-                    line.rstrip().split(',', )[3]
-                    for line, _
-                    in zip(file, range(size, ), )
-                ]
-        except FileNotFoundError as file_not_found_err:
-            print("FileNotFoundError:", file_not_found_err, )
-        except IOError as io_err:
-            print("IOError:", io_err, )
-        except IndexError as idx_err:
-            print("IndexError:", idx_err, )
+            self.tss = self.columns["timestamp"][: size]
+        except TypeError as type_err:
+            print("TypeError:", type_err, )
+        except KeyError as key_err:
+            print("KeyError:", key_err, )
         except Exception as err:
             print("Exception:", err, )
 
@@ -349,10 +431,64 @@ class Rating:
         except Exception as err:
             print("Exception:", err, )
 
+    def get_ids_counts(
+        self,
+        column: Literal["userId", "movieId", ] = "movieId",
+        size: int = 1000
+    ) -> dict[int, int] | None:
+        """
+        Retrieves occurrences counts of every ID in the column.
+
+        Counts are built in a single pass and cached on the instance, so
+        repeated calls do not rescan the column.
+
+        :Parameters:
+            column (Literal["userId", "movieId", ]): Column with IDs.
+                                                     Default: "movieId".
+            size (int): Number of data rows to count.
+                        Default: 1000.
+
+        :Returns:
+            dict[int, int]:
+                Keys (int): IDs in ascending order.
+                Values (int): Count of occurrences.
+            None: If error occurs or no data is loaded.
+
+        :Exceptions:
+            ValueError: When IDs are negative.
+            TypeError: When columns can not be loaded.
+            KeyError: When file does not contain expected columns.
+            Exception: All other errors.
+        """
+
+        try:
+            if (column, size, ) not in self.ids_cnts:
+                self.load_columns(size=size, )
+
+                cnts: np.ndarray = np.bincount(self.columns[column][: size], )
+                ids: np.ndarray = np.flatnonzero(cnts, )
+
+                self.ids_cnts[(column, size, )] = dict(zip(
+                    ids.tolist(),
+                    cnts[ids].tolist(),
+                ), )
+
+            return self.ids_cnts[(column, size, )]
+        except ValueError as val_err:
+            print("ValueError:", val_err, )
+        except TypeError as type_err:
+            print("TypeError:", type_err, )
+        except KeyError as key_err:
+            print("KeyError:", key_err, )
+        except Exception as err:
+            print("Exception:", err, )
+
     def get_top_release_years(self) -> dict[str, int] | None:
         """
         Retrives movie release years from timestamps sorted chronologically.
 
+        With `chunk_size` set, the whole file is streamed chunk by chunk.
+
         :Returns:
             dict[str, int]:
                 Keys (str): Release years.
@@ -366,16 +502,26 @@ class Rating:
         """
 
         try:
-            years: list[str] = [
-                datetime.fromtimestamp(int(ts, ), ).year
-                for ts
-                in self.tss
-            ]
+            years_cnts: Counter = Counter()
+
+            if self.chunk_size is None:
+                if self.tss is None:
+                    raise AttributeError("timestamps are not loaded", )
+
+                tss_chunks: Iterator[np.ndarray] = iter([self.tss, ], )
+            else:
+                tss_chunks = (
+                    chunk["timestamp"]
+                    for chunk in self.iter_columns_chunks()
+                )
+
+            for tss in tss_chunks:
+                years_cnts.update(calculate_years_counts(tss=tss, ), )
 
             return dict(sorted([
-                (str(year, ), years.count(year, ), )
-                for year
-                in set(years, )
+                (str(year, ), year_cnt, )
+                for year, year_cnt
+                in years_cnts.items()
             ], ), )
         except AttributeError as attr_err:
             print("AttributeError:", attr_err, )
@@ -388,6 +534,8 @@ class Rating:
         """
         Retrieves the most popular ratings sorted by values.
 
+        With `chunk_size` set, the whole file is streamed chunk by chunk.
+
         :Returns:
             dict[str, int]:
                 Keys (str): Ratings values.
@@ -401,10 +549,29 @@ class Rating:
         """
 
         try:
-            ratings_freqs: dict[str, int] = {}
-
-            for rating in self.ratings:
-                ratings_freqs[rating] = ratings_freqs.get(rating, 0, ) + 1
+            ratings_freqs: Counter = Counter()
+
+            if self.chunk_size is None:
+                if self.ratings is None:
+                    raise AttributeError("ratings are not loaded", )
+
+                ratings_chunks: Iterator[np.ndarray] = iter([self.ratings, ], )
+            else:
+                ratings_chunks = (
+                    chunk["rating"]
+                    for chunk in self.iter_columns_chunks()
+                )
+
+            for ratings in ratings_chunks:
+                ratings_vals, ratings_cnts = np.unique(
+                    ratings,
+                    return_counts=True,
+                )
+
+                ratings_freqs.update(dict(zip(
+                    map(str, ratings_vals.tolist(), ),
+                    ratings_cnts.tolist(),
+                ), ), )
 
             return dict(sorted(ratings_freqs.items(), ), )
         except AttributeError as attr_err:
@@ -413,3 +580,72 @@ class Rating:
             print("TypeError:", type_err, )
         except Exception as err:
             print("Exception:", err, )
+
+    def get_ratings_metric(
+        self,
+        column: Literal["userId", "movieId", ] = "movieId",
+        metric: Literal[
+            "min",
+            "max",
+            "mean",
+            "median",
+            "var",
+            "std",
+        ] = "mean",
+        size: int = 1000
+    ) -> dict[int, float] | None:
+        """
+        Retrieves ratings metric for every ID in the column.
+
+        With `chunk_size` set, the whole file is streamed chunk by chunk and
+        merged into running statistics, otherwise `size` rows are used.
+
+        :Parameters:
+            column (Literal["userId", "movieId", ]): Column with IDs.
+                                                     Default: "movieId".
+            metric (Literal["min", "max", "mean", "median", "var", "std", ]):
+                Statistical metric to calculate.
+                Default: "mean".
+            size (int): Number of data rows to use.
+                        Default: 1000.
+
+        :Returns:
+            dict[int, float]:
+                Keys (int): IDs in order of first appearance.
+                Values (float): Metric values.
+            None: If error occurs or no data is loaded.
+
+        :Exceptions:
+            TypeError: When columns can not be loaded.
+            KeyError: When file does not contain expected columns.
+            Exception: All other errors.
+        """
+
+        try:
+            if self.chunk_size is None:
+                self.load_columns(size=size, )
+
+                return calculate_groups_metric(
+                    keys=self.columns[column][: size],
+                    vals=self.columns["rating"][: size],
+                    metric=metric,
+                )
+
+            stats: GroupsRunningStats = GroupsRunningStats()
+            offset: int = 0
+
+            for chunk in self.iter_columns_chunks():
+                stats.update(
+                    keys=chunk[column],
+                    vals=chunk["rating"],
+                    offset=offset,
+                )
+                offset += len(chunk[column], )
+
+            return stats.get_metric(metric=metric, )
+        except TypeError as type_err:
+            print("TypeError:", type_err, )
+        except KeyError as key_err:
+            print("KeyError:", key_err, )
+        except Exception as err:
+            print("Exception:", err, )
@@ -3,8 +3,10 @@
 
 Examples of usage:
     >>> inst: Tag = Tag(file_path="data/datasets/", )
+    >>> stream_inst: Tag = Tag(file_path="data/datasets/", chunk_size=100000, )
 
     >>> inst.load_data()
+    >>> inst.load_columns()
     >>> inst.load_users_ids()
     >>> inst.load_movies_ids()
     >>> inst.load_tags()
@@ -21,9 +23,35 @@ Examples of usage:
     >>> print(inst.get_most_words_and_longest_tags(), )
     >>> print(inst.get_popular_tags(), )
     >>> print(inst.get_unique_with_word_tags(word=" in ", ), )
+
+    >>> print(stream_inst.get_popular_tags(), )
 """
 
 
+import os
+import sys
+
+sys.path.append(
+    os.path.normpath(
+        os.path.join(
+            os.path.dirname(
+                os.path.abspath(__file__, ),
+            ),
+            '..',
+            '..',
+            '..',
+        ),
+    ),
+)
+
+import numpy as np
+
+from typing import Iterator
+from collections import Counter
+
+from src.load_utils import iter_csv_columns, load_csv_columns
+
+
 class Tag:
     """
     A class for analyzing and processing tags data from `.csv` file.
@@ -32,23 +60,35 @@ class Tag:
         file_path (str): Path to the directory containing the `.csv` file.
         file (str): `.csv` file containing tags data.
                     Default: "tags.csv".
+        chunk_size (int | None): Rows per chunk to stream the whole file in
+                                 analytics methods.
+                                 Default: None (use loaded columns).
+        cache_path (str | None): Path to the binary columns cache directory.
+                                 Default: None (no cache).
 
         data (list): Tags data rows.
                      Default: None.
-        users_ids (list): Users IDs.
-                          Default: None.
-        movies_ids (list): Movies IDs.
-                           Default: None.
+        columns (dict[str, np.ndarray | list[str]]): Typed columns loaded in
+                                                     one pass.
+                                                     Default: None.
+        columns_size (int): Number of rows requested for `columns`.
+                            Default: 0.
+        users_ids (np.ndarray): Users IDs (int32).
+                                Default: None.
+        movies_ids (np.ndarray): Movies IDs (int32).
+                                 Default: None.
         tags (list): Tags values.
                      Default: None.
-        tss (list): Timestamps values.
-                    Default: None.
+        tss (np.ndarray): Timestamps values (int64).
+                          Default: None.
     """
 
     def __init__(
         self,
         file_path: str,
-        file: str = "tags.csv"
+        file: str = "tags.csv",
+        chunk_size: int | None = None,
+        cache_path: str | None = None
     ) -> None:
         """
         Initializes the `Tag` analyzer.
@@ -57,16 +97,26 @@ class Tag:
             file_path (str): Path to the directory containing the `.csv` file.
             file (str): `.csv` file containing tags data.
                         Default: "tags.csv".
+            chunk_size (int | None): Rows per chunk to stream the whole file
+                                     in analytics methods.
+                                     Default: None (use loaded columns).
+            cache_path (str | None): Path to the binary columns cache
+                                     directory.
+                                     Default: None (no cache).
         """
 
         self.file_path: str = file_path
         self.file: str = file
+        self.chunk_size: int | None = chunk_size
+        self.cache_path: str | None = cache_path
 
         self.data: list | None = None
-        self.users_ids: list | None = None
-        self.movies_ids: list | None = None
+        self.columns: dict[str, np.ndarray | list[str]] | None = None
+        self.columns_size: int = 0
+        self.users_ids: np.ndarray | None = None
+        self.movies_ids: np.ndarray | None = None
         self.tags: list | None = None
-        self.tss: list | None = None
+        self.tss: np.ndarray | None = None
 
     def load_data(self, size: int = 1000) -> None:
         """
@@ -102,40 +152,92 @@ class Tag:
         except Exception as err:
             print("Exception:", err, )
 
-    def load_users_ids(self, size: int = 1000) -> None:
+    def load_columns(self, size: int = 1000) -> None:
         """
-        Loads users IDs from a `.csv` file.
+        Loads all columns from the `.csv` file in a single pass.
+
+        Already loaded columns are reused while they cover `size` rows.
 
         :Parameters:
-            size (int): Number of users IDs to load.
+            size (int): Number of data rows to load (excluding header).
                         Default: 1000.
 
+        :Exceptions:
+            Exception: All errors.
+        """
+
+        try:
+            if self.columns is not None and self.columns_size >= size:
+                return
+
+            self.columns = load_csv_columns(
+                file=self.file_path + self.file,
+                columns_types={
+                    "userId": "int32",
+                    "movieId": "int32",
+                    "tag": "str",
+                    "timestamp": "int64",
+                },
+                size=size,
+                cache_path=self.cache_path,
+            )
+            self.columns_size = size if self.columns is not None else 0
+        except Exception as err:
+            print("Exception:", err, )
+
+    def iter_columns_chunks(self) -> Iterator[dict[str, np.ndarray | list]]:
+        """
+        Yields typed columns of the whole `.csv` file chunk by chunk.
+
+        Errors are not handled here: they reach the calling method, which
+        returns None as in-memory mode does.
+
+        :Yields:
+            dict[str, np.ndarray | list]:
+                Keys (str): Columns names.
+                Values (np.ndarray | list): Chunk columns values.
+
         :Exceptions:
             FileNotFoundError: When file does not exist.
             IOError: When file can not be read.
             IndexError: When lines do not contain expected columns.
+            ValueError: When values can not be converted to columns types.
+            Exception: All other errors.
+        """
+
+        yield from iter_csv_columns(
+            file=self.file_path + self.file,
+            columns_types={
+                "userId": "int32",
+                "movieId": "int32",
+                "tag": "str",
+                "timestamp": "int64",
+            },
+            chunk_size=self.chunk_size or 65536,
+        )
+
+    def load_users_ids(self, size: int = 1000) -> None:
+        """
+        Loads users IDs from a `.csv` file.
+
+        :Parameters:
+            size (int): Number of users IDs to load.
+                        Default: 1000.
+
+        :Exceptions:
+            TypeError: When columns can not be loaded.
+            KeyError: When file does not contain expected columns.
             Exception: All other errors.
         """
 
         try:
-            with open(
-                file=self.file_path + self.file,
-                mode='r',
-                encoding="utf-8",
-            ) as file:
-                next(file, )  # Skip header
+            self.load_columns(size=size, )
 
-                self.users_ids = [
-                    line.rstrip().split(',', )[0]
-                    for line, _
-                    in zip(file, range(size, ), )
-                ]
-        except FileNotFoundError as file_not_found_err:
-            print("FileNotFoundError:", file_not_found_err, )
-        except IOError as io_err:
-            print("IOError:", io_err, )
-        except IndexError as idx_err:
-            print("IndexError:", idx_err, )
+            self.users_ids = self.columns["userId"][: size]
+        except TypeError as type_err:
+            print("TypeError:", type_err, )
+        except KeyError as key_err:
+            print("KeyError:", key_err, )
         except Exception as err:
             print("Exception:", err, )
 
@@ -148,31 +250,19 @@ class Tag:
                         Default: 1000.
 
         :Exceptions:
-            FileNotFoundError: When file does not exist.
-            IOError: When file can not be read.
-            IndexError: When lines do not contain expected columns.
+            TypeError: When columns can not be loaded.
+            KeyError: When file does not contain expected columns.
             Exception: All other errors.
         """
 
         try:
-            with open(
-                file=self.file_path + self.file,
-                mode='r',
-                encoding="utf-8",
-            ) as file:
-                next(file, )  # Skip header
+            self.load_columns(size=size, )
 
-                self.movies_ids = [
-                    line.rstrip().split(',', )[1]
-                    for line, _
-                    in zip(file, range(size, ), )
-                ]
-        except FileNotFoundError as file_not_found_err:
-            print("FileNotFoundError:", file_not_found_err, )
-        except IOError as io_err:
-            print("IOError:", io_err, )
-        except IndexError as idx_err:
-            print("IndexError:", idx_err, )
+            self.movies_ids = self.columns["movieId"][: size]
+        except TypeError as type_err:
+            print("TypeError:", type_err, )
+        except KeyError as key_err:
+            print("KeyError:", key_err, )
         except Exception as err:
             print("Exception:", err, )
 
@@ -185,31 +275,19 @@ class Tag:
                         Default: 1000.
 
         :Exceptions:
-            FileNotFoundError: When file does not exist.
-            IOError: When file can not be read.
-            IndexError: When lines do not contain expected columns.
+            TypeError: When columns can not be loaded.
+            KeyError: When file does not contain expected columns.
             Exception: All other errors.
         """
 
         try:
-            with open(
-                file=self.file_path + self.file,
-                mode='r',
-                encoding="utf-8",
-            ) as file:
-                next(file, )  # Skip header
+            self.load_columns(size=size, )
 
-                self.tags = [
-                    line.rstrip().split(',', )[2]
-                    for line, _
-                    in zip(file, range(size, ), )
-                ]
-        except FileNotFoundError as file_not_found_err:
-            print("FileNotFoundError:", file_not_found_err, )
-        except IOError as io_err:
-            print("IOError:", io_err, )
-        except IndexError as idx_err:
-            print("IndexError:", idx_err, )
+            self.tags = self.columns["tag"][: size]
+        except TypeError as type_err:
+            print("TypeError:", type_err, )
+        except KeyError as key_err:
+            print("KeyError:", key_err, )
         except Exception as err:
             print("Exception:", err, )
 
@@ -222,31 +300,19 @@ class Tag:
                         Default: 1000.
 
         :Exceptions:
-            FileNotFoundError: When file does not exist.
-            IOError: When file can not be read.
-            IndexError: When lines do not contain expected columns.
+            TypeError: When columns can not be loaded.
+            KeyError: When file does not contain expected columns.
             Exception: All other errors.
         """
 
         try:
-            with open(
-                file=self.file_path + self.file,
-                mode='r',
-                encoding="utf-8",
-            ) as file:
-                next(file, )  # Skip header
+            self.load_columns(size=size, )
 
-                self.tss = [
-                    line.rstrip().split(',', )[3]
-                    for line, _
-                    in zip(file, range(size, ), )
-                ]
-        except FileNotFoundError as file_not_found_err:
-            print("FileNotFoundError:", file_not_found_err, )
-        except IOError as io_err:
-            print("IOError:", io_err, )
-        except IndexError as idx_err:
-            print("IndexError:", idx_err, )
+            self.tss = self.columns["timestamp"][: size]
+        except TypeError as type_err:
+            print("TypeError:", type_err, )
+        except KeyError as key_err:
+            print("KeyError:", key_err, )
         except Exception as err:
             print("Exception:", err, )
 
@@ -466,6 +532,8 @@ class Tag:
         """
         Retrieves the most popular tags sorted.
 
+        With `chunk_size` set, the whole file is streamed chunk by chunk.
+
         :Parameters:
             cnt (int): Number of tags to return.
                        Default: 10.
@@ -484,10 +552,16 @@ class Tag:
         """
 
         try:
-            tags_freqs: dict[str | int] = {}
+            tags_freqs: Counter = Counter()
+
+            if self.chunk_size is None:
+                if self.tags is None:
+                    raise AttributeError("tags are not loaded", )
 
-            for tag in self.tags:
-                tags_freqs[tag] = tags_freqs.get(tag, 0, ) + 1
+                tags_freqs.update(self.tags, )
+            else:
+                for chunk in self.iter_columns_chunks():
+                    tags_freqs.update(chunk["tag"], )
 
             return dict(sorted(
                 tags_freqs.items(),
@@ -28,7 +28,6 @@ sys.path.append(
 from typing import Literal
 
 from src.movielens_analysis.models.movie import Movie
-from src.movielens_analysis.models.rating import Rating
 
 
 class User(Movie):
@@ -53,13 +52,10 @@ class User(Movie):
         """
 
         try:
-            inst: Rating = Rating(file_path=self.file_path, )
-
-            inst.load_users_ids()
-
             users_rating_cnts: dict[str, int] = {
-                user_id: inst.users_ids.count(user_id, )
-                for user_id in set(inst.users_ids, )
+                str(user_id, ): rating_cnt
+                for user_id, rating_cnt
+                in self.rating.get_ids_counts(column="userId", ).items()
             }
 
             return dict(sorted(
@@ -56,6 +56,13 @@ Examples of usage:
     >>>     field="title",
     >>> ), )
 
+    >>> print(benchmark_movie_webpage_fields_extraction(
+    >>>     movie_webpage_text=fetch_webpage_text(
+    >>>         url="https://www.imdb.com/title/tt0113041",
+    >>>         headers={},
+    >>>     ),
+    >>> ), )
+
     >>> print(fetch_movies_webpage_text_fields(movies_ids=[
     >>>     "0112302",
     >>>     "0113497",
@@ -63,28 +70,161 @@ Examples of usage:
     >>>     "0113501",
     >>>     "0113627",
     >>> ], ), )
+
+    >>> print(fetch_movies_webpage_text_fields(
+    >>>     movies_ids=["0112302", "0113497", "0114709", ],
+    >>>     cache=MoviesDataCache(file="data/cache/imdb.sqlite", ),
+    >>>     max_workers=16,
+    >>>     rate_limit=5.0,
+    >>>     retries=5,
+    >>>     backoff=1.0,
+    >>> ), )
 """
 
 
+from timeit import timeit
 from typing import Literal
-from bs4 import BeautifulSoup
-from requests import Response, get
+from threading import Lock
+from bs4 import BeautifulSoup, Tag
+from time import monotonic, sleep
+from urllib.parse import urlsplit
+from urllib3.util.retry import Retry
+from requests.adapters import HTTPAdapter
 from json import JSONDecodeError, load
+from requests import Response, Session, get
 from bs4.builder import ParserRejectedMarkup
+from concurrent.futures import ThreadPoolExecutor
+from src.cache_utils import MoviesDataCache
 from requests.exceptions import (
     Timeout,
     HTTPError,
+    ConnectionError,
     RequestException,
 )
 
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER: str = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+INDEXED_CLASSES: dict[str, tuple[str, ...]] = {
+    'a': ("ipc-metadata-list-item__list-content-item", ),
+    "div": ("ipc-metadata-list-item__content-container", ),
+}
+
+RETRY_STATUSES: tuple[int, ...] = (429, 500, 502, 503, 504, )
+
+
+class HostRateLimiter:
+    """
+    A thread-safe limiter of requests rate to every host.
+
+    :Attributes:
+        interval (float): Minimal interval between requests to a host in
+                          seconds.
+        next_times (dict[str, float]): Next allowed request time by host.
+        lock (Lock): Lock guarding `next_times`.
+    """
+
+    def __init__(self, rate: float) -> None:
+        """
+        Initializes the limiter.
+
+        :Parameters:
+            rate (float): Maximal number of requests per second to a host.
+        """
+
+        self.interval: float = 1 / rate
+        self.next_times: dict[str, float] = {}
+        self.lock: Lock = Lock()
 
-def fetch_webpage_text(url: str, headers: dict[str, str]) -> str | None:
+    def wait(self, url: str) -> None:
+        """
+        Blocks until a request to the URL host is allowed.
+
+        :Parameters:
+            url (str): The URL to request.
+        """
+
+        host: str = urlsplit(url, ).netloc
+
+        with self.lock:
+            now: float = monotonic()
+            start: float = max(now, self.next_times.get(host, now, ), )
+            self.next_times[host] = start + self.interval
+
+        sleep(max(0.0, start - now, ), )
+
+def create_session(
+    pool_size: int = 8,
+    retries: int = 3,
+    backoff: float = 0.5
+) -> Session:
+    """
+    Create HTTP session with pooled connections and retries.
+
+    Requests failed with connection errors or 429/5xx statuses are retried
+    with exponential backoff, `Retry-After` headers are respected.
+
+    :Parameters:
+        pool_size (int): Maximal number of kept connections per host.
+                         Default: 8.
+        retries (int): Maximal number of retries of a request.
+                       Default: 3.
+        backoff (float): Backoff factor in seconds between retries.
+                         Default: 0.5.
+
+    :Returns:
+        Session: Configured HTTP session.
+    """
+
+    session: Session = Session()
+    adapter: HTTPAdapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=("GET", ),
+            raise_on_status=False,
+        ),
+    )
+
+    session.mount("http://", adapter, )
+    session.mount("https://", adapter, )
+
+    return session
+
+def fetch_webpage_text(
+    url: str,
+    headers: dict[str, str],
+    session: Session | None = None,
+    rate_limiter: HostRateLimiter | None = None,
+    retries: int = 0,
+    backoff: float = 0.5
+) -> str | None:
     """
     Fetch and return the text of a webpage.
 
+    Requests failed with connection errors or 429/5xx statuses are retried
+    here rather than by the session, so every attempt waits for the rate
+    limiter. Use it with a session created with `retries=0`.
+
     :Parameters:
         url (str): The URL to fetch.
         headers (dict[str, str]): HTTP headers.
+        session (Session | None): HTTP session with pooled connections.
+                                  Default: None (new connection).
+        rate_limiter (HostRateLimiter | None): Limiter of requests rate.
+                                               Default: None (no limit).
+        retries (int): Maximal number of retries of a failed request.
+                       Default: 0.
+        backoff (float): Backoff factor in seconds between retries,
+                         `Retry-After` headers are respected.
+                         Default: 0.5.
 
     :Returns:
         str: Webpage text.
@@ -98,11 +238,33 @@ def fetch_webpage_text(url: str, headers: dict[str, str]) -> str | None:
     """
 
     try:
-        res: Response = get(
-            url=url,
-            headers=headers,
-            timeout=10,
-        )
+        for attempt in range(retries + 1, ):
+            if rate_limiter is not None:
+                rate_limiter.wait(url=url, )
+
+            try:
+                res: Response = (get if session is None else session.get)(
+                    url=url,
+                    headers=headers,
+                    timeout=10,
+                )
+            except (ConnectionError, Timeout, ):
+                if attempt == retries:
+                    raise
+
+                sleep(backoff * 2 ** attempt, )
+
+                continue
+
+            if res.status_code not in RETRY_STATUSES or attempt == retries:
+                break
+
+            retry_after: str = res.headers.get("Retry-After", "", )
+
+            sleep(
+                float(retry_after, ) if retry_after.isdigit() else
+                backoff * 2 ** attempt,
+            )
 
         return res.text if res.status_code == 200 else None
     except Timeout as timeout_err:
@@ -144,6 +306,9 @@ def fetch_movie_webpage_text_fields(
     """
     Fetch movie fields from webpage text.
 
+    The webpage is parsed once and its nodes are indexed in a single tree
+    walk, all fields are resolved from the index.
+
     :Parameters:
         movie_id (str): Movie ID.
         movie_webpage_text (str): Movie webpage text.
@@ -166,12 +331,14 @@ def fetch_movie_webpage_text_fields(
 
     try:
         fields_vals: list[str] = [movie_id, ]
-        soup: BeautifulSoup = BeautifulSoup(movie_webpage_text, "html.parser", )
+        nodes: dict[str, Tag] = index_webpage_nodes(
+            soup=BeautifulSoup(movie_webpage_text, HTML_PARSER, ),
+        )
 
         for field in fields:
-            fields_vals.append(fetch_movie_webpage_text_field(
+            fields_vals.append(fetch_movie_webpage_indexed_field(
                 field=field,
-                soup=soup,
+                nodes=nodes,
             ), )
 
         return fields_vals
@@ -305,6 +472,229 @@ def fetch_movie_webpage_text_field(
     except Exception as err:
         print("Exception:", err, )
 
+def index_webpage_nodes(soup: BeautifulSoup) -> dict[str, Tag]:
+    """
+    Index movie webpage nodes used by fields in a single tree walk.
+
+    :Parameters:
+        soup (BeautifulSoup): Parsed webpage.
+
+    :Returns:
+        dict[str, Tag]:
+            Keys (str): `<tag>[<data-testid>]` for nodes with `data-testid`
+                        attribute, `<tag>.<class>` for nodes with classes
+                        from `INDEXED_CLASSES`.
+            Values (Tag): The first node in document order.
+    """
+
+    nodes: dict[str, Tag] = {}
+
+    for node in soup.find_all(True, ):
+        test_id: str | None = node.get("data-testid", )
+
+        if test_id is not None:
+            nodes.setdefault(f"{node.name}[{test_id}]", node, )
+
+        for class_name in INDEXED_CLASSES.get(node.name, ()):
+            if class_name in node.get("class", (), ):
+                nodes.setdefault(f"{node.name}.{class_name}", node, )
+
+    return nodes
+
+def find_indexed_node(
+    nodes: dict[str, Tag],
+    section_test_id: str,
+    item_test_id: str
+) -> Tag:
+    """
+    Find an indexed list item inside an indexed webpage section.
+
+    Falls back to a search inside the section when the first indexed item
+    is not a descendant of it.
+
+    :Parameters:
+        nodes (dict[str, Tag]): Indexed webpage nodes.
+        section_test_id (str): `data-testid` of the section.
+        item_test_id (str): `data-testid` of the list item.
+
+    :Returns:
+        Tag: The list item node.
+
+    :Exceptions:
+        KeyError: When the section is missing.
+        AttributeError: When the list item is missing.
+    """
+
+    section: Tag = nodes[f"section[{section_test_id}]"]
+    item: Tag | None = nodes.get(f"li[{item_test_id}]", )
+
+    if item is None or all(parent is not section for parent in item.parents):
+        item = section.find("li", attrs={"data-testid": item_test_id, }, )
+
+    if item is None:
+        raise AttributeError(f"missing webpage node: {item_test_id}", )
+
+    return item
+
+def fetch_movie_webpage_indexed_field(
+    nodes: dict[str, Tag],
+    field: str
+) -> str | None:
+    """
+    Fetch movie field from indexed webpage nodes.
+
+    Returns the same values as `fetch_movie_webpage_text_field` without
+    searching the webpage from the root.
+
+    :Parameters:
+        nodes (dict[str, Tag]): Indexed webpage nodes.
+        field (str): Field name.
+
+    :Returns:
+        str: Movie webapge field value.
+        None: If error occurs or no data is loaded.
+
+    :Exceptions:
+        KeyError: When webpage node is missing.
+        AttributeError: When webpage node is missing.
+        Exception: All other errors.
+    """
+
+    try:
+        match field.lower():
+            case "gross":
+                return find_indexed_node(
+                    nodes=nodes,
+                    section_test_id="BoxOffice",
+                    item_test_id="title-boxoffice-cumulativeworldwidegross",
+                ).find(
+                    "span",
+                    class_="ipc-metadata-list-item__list-content-item ipc-btn" +
+                           "--not-interactable",
+                ).get_text(strip=True, )
+
+            case "title":
+                return nodes["h1[hero__pageTitle]"].find("span", ).get_text()
+
+            case "budget":
+                return find_indexed_node(
+                    nodes=nodes,
+                    section_test_id="BoxOffice",
+                    item_test_id="title-boxoffice-budget",
+                ).find(
+                    "span",
+                    class_="ipc-metadata-list-item__list-content-item ipc-btn" +
+                           "--not-interactable",
+                ).get_text(strip=True, ).split()[0]
+
+            case "rating":
+                return nodes[
+                    "div[hero-rating-bar__aggregate-rating__score]"
+                ].find("span", ).get_text()
+
+            case "runtime":
+                return find_indexed_node(
+                    nodes=nodes,
+                    section_test_id="TechSpecs",
+                    item_test_id="title-techspec_runtime",
+                ).find("div", ).get_text()
+
+            case "writer":
+                return nodes[
+                    "div.ipc-metadata-list-item__content-container"
+                ].get_text()
+
+            case "release":
+                return find_indexed_node(
+                    nodes=nodes,
+                    section_test_id="Details",
+                    item_test_id="title-details-releasedate",
+                ).get_text().split('(', )[0].split("Release date", )[1]
+
+            case "country":
+                return find_indexed_node(
+                    nodes=nodes,
+                    section_test_id="Details",
+                    item_test_id="title-details-origin",
+                ).find('a', ).get_text()
+
+            case "director":
+                return nodes[
+                    "a.ipc-metadata-list-item__list-content-item"
+                ].get_text(strip=True, )
+
+            case "language":
+                return find_indexed_node(
+                    nodes=nodes,
+                    section_test_id="Details",
+                    item_test_id="title-details-languages",
+                ).find('a', ).get_text().lower()
+    except KeyError as key_err:
+        print("KeyError:", key_err, )
+    except AttributeError as attr_err:
+        print("AttributeError:", attr_err, )
+    except Exception as err:
+        print("Exception:", err, )
+
+def benchmark_movie_webpage_fields_extraction(
+    movie_webpage_text: str,
+    fields: list[str] = [
+        "gross",
+        "title",
+        "budget",
+        "rating",
+        "writer",
+        "runtime",
+        "release",
+        "country",
+        "director",
+        "language",
+    ],
+    repeats: int = 10
+) -> dict[str, float]:
+    """
+    Benchmark fields extraction from a movie webpage text.
+
+    Compares the per-field search from the root of an `html.parser` tree
+    with the single walk index over a `HTML_PARSER` tree.
+
+    :Parameters:
+        movie_webpage_text (str): Movie webpage text.
+        fields (list[str]): Fields names to extract.
+                            Default: all fields.
+        repeats (int): Number of repeats of every extraction.
+                       Default: 10.
+
+    :Returns:
+        dict[str, float]:
+            Keys (str): "per_field" and "indexed".
+            Values (float): Mean extraction time of all fields in seconds,
+                            webpage parsing included.
+    """
+
+    def extract_per_field() -> list[str | None]:
+        soup: BeautifulSoup = BeautifulSoup(movie_webpage_text, "html.parser", )
+
+        return [
+            fetch_movie_webpage_text_field(soup=soup, field=field, )
+            for field in fields
+        ]
+
+    def extract_indexed() -> list[str | None]:
+        nodes: dict[str, Tag] = index_webpage_nodes(
+            soup=BeautifulSoup(movie_webpage_text, HTML_PARSER, ),
+        )
+
+        return [
+            fetch_movie_webpage_indexed_field(nodes=nodes, field=field, )
+            for field in fields
+        ]
+
+    return {
+        "per_field": timeit(extract_per_field, number=repeats, ) / repeats,
+        "indexed": timeit(extract_indexed, number=repeats, ) / repeats,
+    }
+
 def fetch_movies_webpage_text_fields(
     movies_ids : list[str],
     fields: list[Literal[
@@ -323,11 +713,20 @@ def fetch_movies_webpage_text_fields(
         "language",
     ],
     req_config_path: str = "data/",
-    req_config_file: str = "request.json"
+    req_config_file: str = "request.json",
+    max_workers: int = 8,
+    rate_limit: float | None = None,
+    retries: int = 3,
+    backoff: float = 0.5,
+    cache: MoviesDataCache | None = None
 ) -> list[list[str]] | None:
     """
     Fetch movies webpage fields.
 
+    Webpages are fetched concurrently by a pool of threads sharing one HTTP
+    session with pooled connections. With `cache` set, only movies missing
+    in the cache are fetched, every distinct movie ID is fetched once.
+
     :Parameters:
         movies_ids (list[str]): Movies IDs.
         fields (list[Literal["gross", "title", "budget", "rating", "writer",
@@ -341,6 +740,17 @@ def fetch_movies_webpage_text_fields(
                                Default: "data/".
         req_config_file (str): A requests configuration file.
                                Default: "request.json"
+        max_workers (int): Maximal number of concurrent requests.
+                           Default: 8.
+        rate_limit (float | None): Maximal number of requests per second to
+                                   a host.
+                                   Default: None (no limit).
+        retries (int): Maximal number of retries of a failed request.
+                       Default: 3.
+        backoff (float): Backoff factor in seconds between retries.
+                         Default: 0.5.
+        cache (MoviesDataCache | None): Cache of fetched movies fields.
+                                        Default: None (no cache).
 
         :Returns:
             list[list[str]]: Movies webpage fields values.
@@ -361,17 +771,62 @@ def fetch_movies_webpage_text_fields(
         ) as file:
             req_config: dict[str, str] = load(file, )
 
-        movies_data: list[list[str]] = []
-
-        for movie_id in movies_ids:
-            movies_data.append(fetch_movie_webpage_text_fields(
-                movie_id=movie_id,
-                movie_webpage_text=fetch_webpage_text(
-                    url=req_config["imdb_url"] + movie_id,
-                    headers=req_config["headers"],
-                ),
-                fields=fields,
-            ), )
+        rate_limiter: HostRateLimiter | None = None if rate_limit is None \
+            else HostRateLimiter(rate=rate_limit, )
+        cached_data: dict[str, list[str]] = {} if cache is None else \
+            cache.get_many(movies_ids=movies_ids, fields=fields, )
+        fetch_ids: list[str] = [
+            movie_id
+            for movie_id in dict.fromkeys(movies_ids, )
+            if movie_id not in cached_data
+        ]
+
+        if fetch_ids:
+            # With a rate limit, retries are made by `fetch_webpage_text`
+            # to pass every attempt through the limiter:
+            with create_session(
+                pool_size=max_workers,
+                retries=retries if rate_limiter is None else 0,
+                backoff=backoff,
+            ) as session, ThreadPoolExecutor(
+                max_workers=max_workers,
+            ) as executor:
+                fetched_data: list[list[str] | None] = list(executor.map(
+                    lambda movie_id: fetch_movie_webpage_text_fields(
+                        movie_id=movie_id,
+                        movie_webpage_text=fetch_webpage_text(
+                            url=req_config["imdb_url"] + movie_id,
+                            headers=req_config["headers"],
+                            session=session,
+                            rate_limiter=rate_limiter,
+                            retries=0 if rate_limiter is None else retries,
+                            backoff=backoff,
+                        ),
+                        fields=fields,
+                    ),
+                    fetch_ids,
+                ), )
+
+            if cache is not None:
+                # Rows without any field (e.g. captcha or consent pages)
+                # are not cached, so they are fetched again next time:
+                cache.set_many(
+                    movies_data=[
+                        movie_data
+                        for movie_data in fetched_data
+                        if movie_data is not None
+                        and any(val is not None for val in movie_data[1:])
+                    ],
+                    fields=fields,
+                )
+
+            cached_data |= dict(zip(fetch_ids, fetched_data, ), )
+
+        movies_data: list[list[str]] = [
+            None if cached_data[movie_id] is None else
+            list(cached_data[movie_id], )
+            for movie_id in movies_ids
+        ]
 
         return sorted(
             movies_data,
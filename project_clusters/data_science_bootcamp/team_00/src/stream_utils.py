@@ -0,0 +1,287 @@
+"""
+Module of streaming utils.
+
+Examples of usage:
+    >>> stats: GroupsRunningStats = GroupsRunningStats()
+
+    >>> stats.update(
+    >>>     keys=np.array([1, 2, 1, ], ),
+    >>>     vals=np.array([4.0, 3.5, 5.0, ], ),
+    >>> )
+    >>> stats.update(
+    >>>     keys=np.array([2, 3, ], ),
+    >>>     vals=np.array([2.0, 1.0, ], ),
+    >>>     offset=3,
+    >>> )
+
+    >>> print(stats.get_metric(metric="var", ), )
+"""
+
+
+import numpy as np
+
+from typing import Literal
+
+
+class GroupsRunningStats:
+    """
+    Mergeable running statistics of values grouped by non-negative integer
+    keys.
+
+    Counts, means and sums of squared deviations are merged with the
+    parallel Welford (Chan) formulas, minimums and maximums element-wise.
+    Medians are taken from per-key histograms of distinct values, so they
+    are exact and memory stays bounded for columns with few distinct values
+    (e.g. ratings). Means and variances may differ from a two-pass
+    calculation in the last floating point digits.
+
+    :Attributes:
+        cnts (np.ndarray): Values counts by key.
+        means (np.ndarray): Running means by key.
+        m2s (np.ndarray): Sums of squared deviations from the mean by key.
+        mins (np.ndarray): Minimums by key.
+        maxs (np.ndarray): Maximums by key.
+        first_idxs (np.ndarray): Row index of the first appearance by key.
+        hist_vals (np.ndarray): Sorted distinct values seen so far.
+        hists (np.ndarray): Counts of every distinct value by key.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes empty running statistics.
+        """
+
+        self.cnts: np.ndarray = np.zeros(0, dtype=np.int64, )
+        self.means: np.ndarray = np.zeros(0, dtype=np.float64, )
+        self.m2s: np.ndarray = np.zeros(0, dtype=np.float64, )
+        self.mins: np.ndarray = np.full(0, np.inf, )
+        self.maxs: np.ndarray = np.full(0, -np.inf, )
+        self.first_idxs: np.ndarray = np.full(
+            0,
+            np.iinfo(np.int64, ).max,
+            dtype=np.int64,
+        )
+        self.hist_vals: np.ndarray = np.zeros(0, dtype=np.float64, )
+        self.hists: np.ndarray = np.zeros((0, 0, ), dtype=np.int64, )
+
+    def resize(self, keys_cnt: int) -> None:
+        """
+        Grows statistics arrays to hold `keys_cnt` keys.
+
+        :Parameters:
+            keys_cnt (int): Number of keys to hold.
+        """
+
+        pad: int = keys_cnt - len(self.cnts, )
+
+        if pad <= 0:
+            return
+
+        self.cnts = np.pad(self.cnts, (0, pad, ), )
+        self.means = np.pad(self.means, (0, pad, ), )
+        self.m2s = np.pad(self.m2s, (0, pad, ), )
+        self.mins = np.pad(self.mins, (0, pad, ), constant_values=np.inf, )
+        self.maxs = np.pad(self.maxs, (0, pad, ), constant_values=-np.inf, )
+        self.first_idxs = np.pad(
+            self.first_idxs,
+            (0, pad, ),
+            constant_values=np.iinfo(np.int64, ).max,
+        )
+        self.hists = np.pad(self.hists, ((0, pad, ), (0, 0, ), ), )
+
+    def update(
+        self,
+        keys: np.ndarray,
+        vals: np.ndarray,
+        offset: int = 0
+    ) -> None:
+        """
+        Adds a chunk of grouped values to the statistics.
+
+        :Parameters:
+            keys (np.ndarray): Non-negative integer group key of every value.
+            vals (np.ndarray): Values aligned with `keys`.
+            offset (int): Row index of the first chunk value in the stream.
+                          Default: 0.
+
+        :Exceptions:
+            ValueError: When used invalid data format.
+            TypeError: When used incorrect data types.
+            Exception: All other errors.
+        """
+
+        try:
+            if not len(keys, ):
+                return
+
+            keys = np.asarray(keys, dtype=np.int64, )
+            vals = np.asarray(vals, dtype=np.float64, )
+            chunk: GroupsRunningStats = GroupsRunningStats()
+            keys_cnt: int = int(keys.max(), ) + 1
+
+            chunk.cnts = np.bincount(keys, minlength=keys_cnt, )
+            chunk.means = np.bincount(
+                keys,
+                weights=vals,
+                minlength=keys_cnt,
+            ) / np.maximum(chunk.cnts, 1, )
+            chunk.m2s = np.bincount(
+                keys,
+                weights=(vals - chunk.means[keys]) ** 2,
+                minlength=keys_cnt,
+            )
+            chunk.mins = np.full(keys_cnt, np.inf, )
+            chunk.maxs = np.full(keys_cnt, -np.inf, )
+            np.minimum.at(chunk.mins, keys, vals, )
+            np.maximum.at(chunk.maxs, keys, vals, )
+
+            uniq_keys, first_idxs = np.unique(keys, return_index=True, )
+            chunk.first_idxs = np.full(
+                keys_cnt,
+                np.iinfo(np.int64, ).max,
+                dtype=np.int64,
+            )
+            chunk.first_idxs[uniq_keys] = first_idxs + offset
+
+            chunk.hist_vals, vals_codes = np.unique(vals, return_inverse=True, )
+            chunk.hists = np.bincount(
+                keys * len(chunk.hist_vals, ) + vals_codes.ravel(),
+                minlength=keys_cnt * len(chunk.hist_vals, ),
+            ).reshape(keys_cnt, len(chunk.hist_vals, ), )
+
+            self.merge(other=chunk, )
+        except ValueError as val_err:
+            print("ValueError:", val_err, )
+        except TypeError as type_err:
+            print("TypeError:", type_err, )
+        except Exception as err:
+            print("Exception:", err, )
+
+    def merge(self, other: "GroupsRunningStats") -> None:
+        """
+        Merges other statistics into these statistics.
+
+        :Parameters:
+            other (GroupsRunningStats): Statistics to merge.
+
+        :Exceptions:
+            ValueError: When used invalid data format.
+            Exception: All other errors.
+        """
+
+        try:
+            keys_cnt: int = max(len(self.cnts, ), len(other.cnts, ), )
+
+            self.resize(keys_cnt=keys_cnt, )
+            other.resize(keys_cnt=keys_cnt, )
+
+            cnts: np.ndarray = self.cnts + other.cnts
+            safe_cnts: np.ndarray = np.maximum(cnts, 1, )
+            deltas: np.ndarray = other.means - self.means
+
+            self.m2s = self.m2s + other.m2s + \
+                deltas ** 2 * self.cnts * other.cnts / safe_cnts
+            self.means = self.means + deltas * other.cnts / safe_cnts
+            self.cnts = cnts
+            self.mins = np.minimum(self.mins, other.mins, )
+            self.maxs = np.maximum(self.maxs, other.maxs, )
+            self.first_idxs = np.minimum(self.first_idxs, other.first_idxs, )
+
+            hist_vals: np.ndarray = np.union1d(
+                self.hist_vals,
+                other.hist_vals,
+            )
+            hists: np.ndarray = np.zeros(
+                (keys_cnt, len(hist_vals, ), ),
+                dtype=np.int64,
+            )
+
+            hists[:, np.searchsorted(hist_vals, self.hist_vals, )] += self.hists
+            hists[:, np.searchsorted(hist_vals, other.hist_vals, )] += \
+                other.hists
+
+            self.hist_vals = hist_vals
+            self.hists = hists
+        except ValueError as val_err:
+            print("ValueError:", val_err, )
+        except Exception as err:
+            print("Exception:", err, )
+
+    def get_metric(
+        self,
+        metric: Literal[
+            "min",
+            "max",
+            "mean",
+            "median",
+            "var",
+            "std",
+        ] = "mean"
+    ) -> dict[int, int | float] | None:
+        """
+        Retrieves the statistical metric of every seen key.
+
+        :Parameters:
+            metric (Literal["min", "max", "mean", "median", "var", "std", ]):
+                The metric to calculate.
+                Default: "mean".
+
+        :Returns:
+            dict[int, int | float]:
+                Keys (int): Groups keys in order of first appearance.
+                Values (int | float): The calculated metrics rounded like
+                                      `calculate_metric`.
+            None: If error occurs or no data is loaded.
+
+        :Exceptions:
+            ValueError: When used invalid data format.
+            Exception: All other errors.
+        """
+
+        try:
+            keys: np.ndarray = np.flatnonzero(self.cnts, )
+            keys = keys[np.argsort(self.first_idxs[keys], kind="stable", )]
+            cnts: np.ndarray = self.cnts[keys]
+
+            match metric:
+                case "min":
+                    metric_vals: np.ndarray = self.mins[keys]
+
+                case "max":
+                    metric_vals = self.maxs[keys]
+
+                case "mean":
+                    metric_vals = self.means[keys]
+
+                case "var" | "std":
+                    metric_vals = self.m2s[keys] / cnts
+
+                case "median":
+                    cum_cnts: np.ndarray = np.cumsum(self.hists[keys], axis=1, )
+                    metric_vals = (
+                        self.hist_vals[
+                            (cum_cnts <= ((cnts - 1) // 2)[:, None]).sum(
+                                axis=1,
+                            )
+                        ] +
+                        self.hist_vals[
+                            (cum_cnts <= (cnts // 2)[:, None]).sum(axis=1, )
+                        ]
+                    ) / 2
+
+                case _:
+                    raise ValueError(f"unknown metric: {metric}", )
+
+            rnd_vals: list[float] = metric_vals.tolist()
+
+            if metric not in ("min", "max", ):
+                rnd_vals = [round(rnd_val, 2, ) for rnd_val in rnd_vals]
+
+            if metric == "std":
+                rnd_vals = [round(rnd_val ** 0.5, 2, ) for rnd_val in rnd_vals]
+
+            return dict(zip(keys.tolist(), rnd_vals, ), )
+        except ValueError as val_err:
+            print("ValueError:", val_err, )
+        except Exception as err:
+            print("Exception:", err, )
@@ -9,13 +9,31 @@ Examples of usage:
     >>> print(calculate_variance_value(vals=[1, 2, 3, 4, ], ), )
     >>> print(calculate_std_value(vals=[1, 2, 3, 4, ], ), )
     >>> print(calculate_metric(vals=[1, 2, 3, 4, ], ), )
+    >>> print(calculate_batched_metric(
+    >>>     vals=np.array([1.0, 3.0, 2.0, 4.0, 5.0, ], ),
+    >>>     cnts=np.array([2, 3, ], ),
+    >>>     metric="median",
+    >>> ), )
+    >>> print(calculate_groups_metric(
+    >>>     keys=np.array([1, 2, 1, 2, ], ),
+    >>>     vals=np.array([1.0, 2.0, 3.0, 4.0, ], ),
+    >>>     metric="median",
+    >>> ), )
+    >>> print(calculate_years_counts(
+    >>>     tss=np.array([964982703, 1445714835, 1445715340, ], ),
+    >>> ), )
     >>> print(extract_minutes_from_string(time="11 hour 4 minutes", ), )
     >>> print(extract_price_from_string(price="$11,000,000", ), )
+    >>> print(extract_currency_from_string(price="$11,000,000", ), )
+    >>> print(select_top_indices(vals=np.array([3.0, 5.0, 3.0, ], ), cnt=2, ), )
 """
 
 
+import numpy as np
+
 from re import search
-from typing import Literal
+from datetime import datetime
+from typing import Iterator, Literal
 
 
 def get_min_value(vals: list[int | float]) -> int | float | None:
@@ -265,6 +283,243 @@ def calculate_metric(
     except Exception as err:
         print("Exception:", err, )
 
+def calculate_batched_metric(
+    vals: np.ndarray,
+    cnts: np.ndarray,
+    metric: Literal[
+        "min",
+        "max",
+        "mean",
+        "median",
+        "var",
+        "std",
+    ] = "mean"
+) -> list[int | float | None] | None:
+    """
+    Calculate the statistical metric for every group of a grouped array.
+
+    All groups are reduced in one call: sums are accumulated in values
+    order like `sum`, medians are taken from one sort of values by group,
+    so memory stays linear in the number of values whatever the groups
+    sizes are. Results match `calculate_metric` called for each group
+    separately.
+
+    :Parameters:
+        vals (np.ndarray): Values of all groups, every group stored
+                           contiguously.
+        cnts (np.ndarray): Number of values in every group.
+        metric (Literal["min", "max", "mean", "median", "var", "std", ]):
+            The metric to calculate.
+            Default: "mean".
+
+    :Returns:
+        list[int | float | None]: The calculated metrics in groups order,
+                                  None for empty groups.
+        None: If error occurs or no data is loaded.
+
+    :Exceptions:
+        ValueError: When used invalid data format.
+        TypeError: When used incorrect data types.
+        Exception: All other errors.
+    """
+
+    try:
+        vals = np.asarray(vals, )
+        cnts = np.asarray(cnts, dtype=np.int64, )
+
+        if cnts.sum() != len(vals, ):
+            raise ValueError("groups counts do not match values size", )
+
+        non_empty: np.ndarray = cnts > 0
+        grp_cnts: np.ndarray = cnts[non_empty]
+        starts: np.ndarray = np.cumsum(grp_cnts, ) - grp_cnts
+        grp_idxs: np.ndarray = np.repeat(
+            np.arange(len(grp_cnts, ), ),
+            grp_cnts,
+        )
+
+        match metric:
+            case "min":
+                metric_vals: list = np.minimum.reduceat(
+                    vals,
+                    starts,
+                ).tolist() if len(vals, ) else []
+
+            case "max":
+                metric_vals = np.maximum.reduceat(
+                    vals,
+                    starts,
+                ).tolist() if len(vals, ) else []
+
+            case "mean" | "var" | "std":
+                flt_vals: np.ndarray = vals.astype(np.float64, )
+                means: np.ndarray = np.bincount(
+                    grp_idxs,
+                    weights=flt_vals,
+                    minlength=len(grp_cnts, ),
+                ) / np.maximum(grp_cnts, 1, )
+
+                if metric == "mean":
+                    metric_vals = means.tolist()
+                else:
+                    metric_vals = (np.bincount(
+                        grp_idxs,
+                        weights=(flt_vals - means[grp_idxs]) ** 2,
+                        minlength=len(grp_cnts, ),
+                    ) / np.maximum(grp_cnts, 1, )).tolist()
+
+            case "median":
+                srt_vals: np.ndarray = vals[np.lexsort((vals, grp_idxs, ), )]
+                lo_vals: list = srt_vals[starts + (grp_cnts - 1) // 2].tolist()
+                hi_vals: list = srt_vals[starts + grp_cnts // 2].tolist()
+                metric_vals = [
+                    lo_val if cnt % 2 == 1 else (lo_val + hi_val) / 2
+                    for lo_val, hi_val, cnt
+                    in zip(lo_vals, hi_vals, grp_cnts.tolist(), )
+                ]
+
+            case _:
+                raise ValueError(f"unknown metric: {metric}", )
+
+        if metric not in ("min", "max", ):
+            metric_vals = [round(metric_val, 2, ) for metric_val in metric_vals]
+
+        if metric == "std":
+            metric_vals = [
+                round(metric_val ** 0.5, 2, ) for metric_val in metric_vals
+            ]
+
+        grp_vals: Iterator = iter(metric_vals, )
+
+        return [
+            next(grp_vals, ) if is_non_empty else None
+            for is_non_empty in non_empty.tolist()
+        ]
+    except ValueError as val_err:
+        print("ValueError:", val_err, )
+    except TypeError as type_err:
+        print("TypeError:", type_err, )
+    except Exception as err:
+        print("Exception:", err, )
+
+def calculate_groups_metric(
+    keys: np.ndarray,
+    vals: np.ndarray,
+    metric: Literal[
+        "min",
+        "max",
+        "mean",
+        "median",
+        "var",
+        "std",
+    ] = "mean"
+) -> dict[int | str, int | float] | None:
+    """
+    Calculate the statistical metric for every group of values sharing a key.
+
+    Values are grouped by a stable sort of keys and all groups are reduced
+    by `calculate_batched_metric`, results match `calculate_metric` called
+    for each group separately.
+
+    :Parameters:
+        keys (np.ndarray): Group key of every value.
+        vals (np.ndarray): Values aligned with `keys`.
+        metric (Literal["min", "max", "mean", "median", "var", "std", ]):
+            The metric to calculate.
+            Default: "mean".
+
+    :Returns:
+        dict[int | str, int | float]:
+            Keys (int | str): Groups keys in order of first appearance.
+            Values (int | float): The calculated metrics.
+        None: If error occurs or no data is loaded.
+
+    :Exceptions:
+        ValueError: When used invalid data format.
+        TypeError: When used incorrect data types.
+        Exception: All other errors.
+    """
+
+    try:
+        uniq_keys, first_idxs, inv_idxs, cnts = np.unique(
+            keys,
+            return_index=True,
+            return_inverse=True,
+            return_counts=True,
+        )
+        rnd_vals: list[int | float] | None = calculate_batched_metric(
+            vals=np.asarray(vals, dtype=np.float64, )[
+                np.argsort(inv_idxs.ravel(), kind="stable", )
+            ],
+            cnts=cnts,
+            metric=metric,
+        )
+
+        if rnd_vals is None:
+            return None
+
+        first_order: np.ndarray = np.argsort(first_idxs, kind="stable", )
+
+        return dict(zip(
+            uniq_keys[first_order].tolist(),
+            [rnd_vals[idx] for idx in first_order.tolist()],
+        ), )
+    except ValueError as val_err:
+        print("ValueError:", val_err, )
+    except TypeError as type_err:
+        print("TypeError:", type_err, )
+    except Exception as err:
+        print("Exception:", err, )
+
+def calculate_years_counts(tss: np.ndarray) -> dict[int, int] | None:
+    """
+    Calculate the number of timestamps in every local calendar year.
+
+    Timestamps are bucketed with a binary search over local year boundaries,
+    so years match `datetime.fromtimestamp` without converting every value.
+
+    :Parameters:
+        tss (np.ndarray): Unix timestamps.
+
+    :Returns:
+        dict[int, int]:
+            Keys (int): Years in ascending order.
+            Values (int): Timestamps counts.
+        None: If error occurs or no data is loaded.
+
+    :Exceptions:
+        ValueError: When used invalid data format.
+        OverflowError: When timestamps are out of range.
+        Exception: All other errors.
+    """
+
+    try:
+        if not len(tss, ):
+            return {}
+
+        min_year: int = datetime.fromtimestamp(int(tss.min(), ), ).year
+        max_year: int = datetime.fromtimestamp(int(tss.max(), ), ).year
+        years_starts: np.ndarray = np.array([
+            datetime(year, 1, 1, ).timestamp()
+            for year in range(min_year + 1, max_year + 1, )
+        ], )
+        years_cnts: np.ndarray = np.bincount(
+            np.searchsorted(years_starts, tss, side="right", ),
+            minlength=max_year - min_year + 1,
+        )
+
+        return {
+            min_year + year_idx: year_cnt
+            for year_idx, year_cnt in enumerate(years_cnts.tolist(), )
+            if year_cnt
+        }
+    except ValueError as val_err:
+        print("ValueError:", val_err, )
+    except OverflowError as overflow_err:
+        print("OverflowError:", overflow_err, )
+    except Exception as err:
+        print("Exception:", err, )
+
 def extract_minutes_from_string(time: str | None) -> int | None:
     """
     Extract total minutes from a time string.
@@ -336,3 +591,52 @@ def extract_price_from_string(price: str | None) -> int | None:
         print("ValueError:", val_err, )
     except Exception as err:
         print("Exception:", err, )
+
+def extract_currency_from_string(price: str | None) -> str | None:
+    """
+    Extract currency symbol from a price string.
+
+    :Parameters:
+        price (str | None): Price string.
+
+    :Returns:
+        str: Currency symbol preceding the amount.
+        None: If price is missing or has no currency symbol.
+    """
+
+    if price is None:
+        return None
+
+    currency: str = price.strip().split(maxsplit=1, )[0].rstrip(
+        "0123456789,.",
+    ) if price.strip() else ""
+
+    return currency or None
+
+def select_top_indices(vals: np.ndarray, cnt: int) -> np.ndarray:
+    """
+    Select indices of the largest values in descending order.
+
+    Only values reaching the `cnt`-th largest value are sorted, ties keep
+    their original order like a stable sort of all values.
+
+    :Parameters:
+        vals (np.ndarray): Numeric values without NaNs.
+        cnt (int): Number of indices to select.
+
+    :Returns:
+        np.ndarray: Indices of the `cnt` largest values.
+    """
+
+    if cnt <= 0 or not len(vals, ):
+        return np.zeros(0, dtype=np.int64, )
+
+    if cnt < len(vals, ):
+        threshold: float = np.partition(vals, len(vals, ) - cnt, )[
+            len(vals, ) - cnt
+        ]
+        idxs: np.ndarray = np.flatnonzero(vals >= threshold, )
+    else:
+        idxs = np.arange(len(vals, ), )
+
+    return idxs[np.argsort(-vals[idxs], kind="stable", )][: cnt]
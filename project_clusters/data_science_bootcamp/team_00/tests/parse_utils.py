@@ -0,0 +1,350 @@
+"""
+IMDB webpages fetching test suite.
+
+Examples of usage:
+    >>> pytest parse_utils.py
+    >>> pytest parse_utils.py -v
+    >>> pytest parse_utils.py -m fetching -v
+"""
+
+
+import os
+import sys
+import json
+import time
+import pytest
+
+from threading import Lock, Thread
+from typing import Any, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(
+    os.path.dirname(
+        os.path.dirname(__file__, ),
+    ),
+)
+
+from src.cache_utils import MoviesDataCache
+from bs4 import BeautifulSoup
+from src.parse_utils import (
+    fetch_movie_webpage_text_field,
+    fetch_movie_webpage_text_fields,
+    fetch_movies_webpage_text_fields,
+    benchmark_movie_webpage_fields_extraction,
+)
+
+
+MOVIE_WEBPAGE_TEXT: str = """
+<html><body>
+<h1 data-testid="hero__pageTitle"><span>Heat</span></h1>
+<div data-testid="hero-rating-bar__aggregate-rating__score">
+<span>8.3</span><span>/10</span></div>
+<ul><li data-testid="title-pc-principal-credit">
+<a class="ipc-metadata-list-item__list-content-item">Michael Mann</a>
+<div class="ipc-metadata-list-item__content-container">Michael Mann</div>
+</li></ul>
+<section data-testid="BoxOffice"><ul>
+<li data-testid="title-boxoffice-budget"><span>Budget</span>
+<span class="ipc-metadata-list-item__list-content-item ipc-btn--not-interac\
+table">$60,000,000 (estimated)</span></li>
+<li data-testid="title-boxoffice-cumulativeworldwidegross"><span>Gross</span>
+<span class="ipc-metadata-list-item__list-content-item ipc-btn--not-interac\
+table">$187,436,818</span></li>
+</ul></section>
+<section data-testid="Details"><ul>
+<li data-testid="title-details-releasedate">Release date December 15, 1995 (
+United States)</li>
+<li data-testid="title-details-origin"><a>United States</a></li>
+<li data-testid="title-details-languages"><a>English</a><a>Spanish</a></li>
+</ul></section>
+<section data-testid="TechSpecs"><ul>
+<li data-testid="title-techspec_runtime"><span>Runtime</span>
+<div>2 hours 50 minutes</div></li>
+</ul></section>
+</body></html>
+"""
+MOVIE_FIELDS: list[str] = [
+    "gross",
+    "title",
+    "budget",
+    "rating",
+    "writer",
+    "runtime",
+    "release",
+    "country",
+    "director",
+    "language",
+]
+
+
+class StubIMDBHandler(BaseHTTPRequestHandler):
+    """
+    Handler of a local stub of IMDB movies webpages.
+
+    A movie webpage path is `/title/tt<movie_id>`. Movies listed in
+    `server.fails` respond with 503 status while their fails counter is
+    positive.
+    """
+
+    def do_GET(self) -> None:
+        """
+        Responds with a minimal movie webpage.
+        """
+
+        movie_id: str = self.path.rsplit("tt", 1, )[-1]
+
+        with self.server.lock:
+            self.server.active += 1
+            self.server.max_active = max(
+                self.server.max_active,
+                self.server.active,
+            )
+            self.server.requests.append(movie_id, )
+            fail: bool = self.server.fails.get(movie_id, 0, ) > 0
+
+            if fail:
+                self.server.fails[movie_id] -= 1
+
+        time.sleep(0.05, )
+
+        body: bytes = (
+            '<html><body><h1 data-testid="hero__pageTitle">'
+            f'<span>Movie {movie_id}</span></h1>'
+            '<div data-testid="hero-rating-bar__aggregate-rating__score">'
+            f'<span>{int(movie_id, ) % 10}.5</span></div></body></html>'
+        ).encode("utf-8", )
+
+        self.send_response(503 if fail else 200, )
+        self.send_header("Content-Type", "text/html; charset=utf-8", )
+        self.send_header("Content-Length", str(len(body, ), ), )
+        self.end_headers()
+        self.wfile.write(body, )
+
+        with self.server.lock:
+            self.server.active -= 1
+
+    def log_message(self, *args: Any) -> None:
+        """
+        Silences requests logging.
+        """
+
+
+@pytest.mark.fetching
+class TestParseUtils:
+    """
+    Tests for IMDB webpages fetching against a local stub server.
+
+    :Attributes:
+        server (ThreadingHTTPServer): The stub server.
+        req_config_path (str): Path to the requests configuration directory.
+        cache_file (str): Path to the movies data cache file.
+    """
+
+    @pytest.fixture(autouse=True)
+    def prepare_test_class(self, tmp_path: Any) -> Iterator[None]:
+        """
+        Automatically starts a stub server and writes a requests
+        configuration before each test.
+        """
+
+        self.server: ThreadingHTTPServer = ThreadingHTTPServer(
+            ("127.0.0.1", 0, ),
+            StubIMDBHandler,
+        )
+        self.server.lock = Lock()
+        self.server.active = 0
+        self.server.max_active = 0
+        self.server.requests = []
+        self.server.fails = {}
+
+        with open(
+            tmp_path / "request.json",
+            'w',
+            encoding="utf-8",
+        ) as file:
+            json.dump({
+                "imdb_url": "http://127.0.0.1:"
+                            f"{self.server.server_address[1]}/title/tt",
+                "headers": {},
+            }, file, )
+
+        self.req_config_path: str = str(tmp_path, ) + os.sep
+        self.cache_file: str = str(tmp_path / "imdb.sqlite", )
+        thread: Thread = Thread(target=self.server.serve_forever, daemon=True, )
+
+        thread.start()
+
+        yield
+
+        self.server.shutdown()
+        self.server.server_close()
+        thread.join()
+
+    @pytest.mark.returned_data_sorting
+    def test_fetch_returned_data_sorting(self) -> None:
+        """
+        Validate that fetched movies data keep the sorted result shape.
+        """
+
+        movies_ids: list[str] = ["0000003", "0000001", "0000004", "0000002", ]
+        movies_data: list[list[str]] = fetch_movies_webpage_text_fields(
+            movies_ids=movies_ids,
+            fields=["title", "rating", ],
+            req_config_path=self.req_config_path,
+            max_workers=4,
+        )
+
+        assert movies_data == [
+            [movie_id, f"Movie {movie_id}", f"{int(movie_id, ) % 10}.5", ]
+            for movie_id in sorted(movies_ids, reverse=True, )
+        ]
+
+    @pytest.mark.calculations
+    def test_fetch_concurrency_limit(self) -> None:
+        """
+        Validate that concurrent requests do not exceed `max_workers`.
+        """
+
+        movies_data: list[list[str]] = fetch_movies_webpage_text_fields(
+            movies_ids=[f"{movie_id:07d}" for movie_id in range(12, )],
+            fields=["title", ],
+            req_config_path=self.req_config_path,
+            max_workers=3,
+        )
+
+        assert len(movies_data, ) == 12
+        assert 1 < self.server.max_active <= 3
+
+    @pytest.mark.calculations
+    def test_fetch_rate_limit(self) -> None:
+        """
+        Validate that requests to a host are spaced by the rate limit.
+        """
+
+        start: float = time.monotonic()
+
+        fetch_movies_webpage_text_fields(
+            movies_ids=[f"{movie_id:07d}" for movie_id in range(5, )],
+            fields=["title", ],
+            req_config_path=self.req_config_path,
+            max_workers=5,
+            rate_limit=20.0,
+        )
+
+        assert time.monotonic() - start >= 4 / 20
+
+    @pytest.mark.calculations
+    def test_fetch_retries(self) -> None:
+        """
+        Validate that failed requests are retried with backoff.
+        """
+
+        self.server.fails = {"0000007": 2, }
+
+        movies_data: list[list[str]] = fetch_movies_webpage_text_fields(
+            movies_ids=["0000007", ],
+            fields=["title", ],
+            req_config_path=self.req_config_path,
+            retries=3,
+            backoff=0.01,
+        )
+
+        assert movies_data == [["0000007", "Movie 0000007", ], ]
+        assert self.server.requests.count("0000007", ) == 3
+
+    @pytest.mark.calculations
+    def test_fetch_cache(self) -> None:
+        """
+        Validate that cached movies are not fetched again.
+        """
+
+        cache: MoviesDataCache = MoviesDataCache(file=self.cache_file, )
+        movies_ids: list[str] = ["0000001", "0000002", "0000001", ]
+        movies_data: list[list[str]] = fetch_movies_webpage_text_fields(
+            movies_ids=movies_ids,
+            fields=["title", ],
+            req_config_path=self.req_config_path,
+            cache=cache,
+        )
+
+        assert len(self.server.requests, ) == 2
+        assert fetch_movies_webpage_text_fields(
+            movies_ids=movies_ids,
+            fields=["title", ],
+            req_config_path=self.req_config_path,
+            cache=cache,
+        ) == movies_data
+        assert len(self.server.requests, ) == 2
+
+        fetch_movies_webpage_text_fields(
+            movies_ids=movies_ids,
+            fields=["title", "rating", ],
+            req_config_path=self.req_config_path,
+            cache=cache,
+        )
+
+        assert len(self.server.requests, ) == 4
+
+        cache.close()
+
+    @pytest.mark.calculations
+    def test_cache_expiry_and_eviction(self) -> None:
+        """
+        Validate cache TTL expiry and LRU eviction.
+        """
+
+        cache: MoviesDataCache = MoviesDataCache(
+            file=self.cache_file,
+            max_size=2,
+        )
+
+        cache.set_many(movies_data=[["1", "a", ], ], fields=["title", ], )
+        cache.set_many(movies_data=[["2", "b", ], ], fields=["title", ], )
+        time.sleep(0.01, )
+        cache.get_many(movies_ids=["1", ], fields=["title", ], )
+        time.sleep(0.01, )
+        cache.set_many(movies_data=[["3", "c", ], ], fields=["title", ], )
+
+        assert cache.get_many(
+            movies_ids=["1", "2", "3", ],
+            fields=["title", ],
+        ) == {"1": ["1", "a", ], "3": ["3", "c", ], }
+
+        cache.ttl = 0.01
+        time.sleep(0.02, )
+
+        assert cache.get_many(movies_ids=["1", "3", ], fields=["title", ], ) \
+            == {}
+
+        cache.close()
+
+    @pytest.mark.calculations
+    def test_indexed_fields_extraction(self) -> None:
+        """
+        Validate that indexed extraction matches the per-field extraction.
+        """
+
+        soup: BeautifulSoup = BeautifulSoup(MOVIE_WEBPAGE_TEXT, "html.parser", )
+
+        assert fetch_movie_webpage_text_fields(
+            movie_id="0113277",
+            movie_webpage_text=MOVIE_WEBPAGE_TEXT,
+            fields=MOVIE_FIELDS,
+        ) == ["0113277", ] + [
+            fetch_movie_webpage_text_field(soup=soup, field=field, )
+            for field in MOVIE_FIELDS
+        ]
+
+    @pytest.mark.returned_data_types
+    def test_extraction_benchmark(self) -> None:
+        """
+        Validate the fields extraction benchmark result.
+        """
+
+        timings: dict[str, float] = benchmark_movie_webpage_fields_extraction(
+            movie_webpage_text=MOVIE_WEBPAGE_TEXT,
+            repeats=2,
+        )
+
+        assert list(timings, ) == ["per_field", "indexed", ]
+        assert all(timing > 0 for timing in timings.values())
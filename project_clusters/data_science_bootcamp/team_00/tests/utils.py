@@ -0,0 +1,129 @@
+"""
+Statistics utils test suite.
+
+Examples of usage:
+    >>> pytest utils.py
+    >>> pytest utils.py -v
+    >>> pytest utils.py -m calculations -v
+"""
+
+
+import os
+import sys
+import pytest
+import numpy as np
+
+sys.path.append(
+    os.path.dirname(
+        os.path.dirname(__file__, ),
+    ),
+)
+
+from src.utils import (
+    calculate_metric,
+    calculate_groups_metric,
+    calculate_batched_metric,
+)
+
+
+@pytest.mark.utils
+class TestUtils:
+    """
+    Tests for batched statistics utils.
+
+    :Attributes:
+        groups (list[list[float]]): Groups of values.
+        metrics (list[str]): Metrics to calculate.
+    """
+
+    @pytest.fixture(autouse=True)
+    def prepare_test_class(self) -> None:
+        """
+        Automatically initializes groups of values before each test.
+        """
+
+        self.groups: list[list[float]] = [
+            [4.0, 3.5, 5.0, 1.0, ],
+            [],
+            [2.5, ],
+            [0.5, 4.5, 3.0, 3.0, 2.0, ],
+            [1.25, 3.75, ],
+        ]
+        self.metrics: list[str] = ["min", "max", "mean", "median", "var",
+                                   "std",
+        ]
+
+    @pytest.mark.returned_data_types
+    def test_batched_metric_returned_data_types(self) -> None:
+        """
+        Validate returned data types for `calculate_batched_metric`.
+        """
+
+        for metric in self.metrics:
+            metric_vals: list = calculate_batched_metric(
+                vals=np.array([1, 2, 3, ], ),
+                cnts=np.array([3, ], ),
+                metric=metric,
+            )
+
+            assert isinstance(metric_vals, list, )
+            assert isinstance(metric_vals[0], int | float, )
+
+    @pytest.mark.calculations
+    def test_batched_metric_calculations(self) -> None:
+        """
+        Validate that batched metrics match `calculate_metric` per group.
+        """
+
+        for metric in self.metrics:
+            assert calculate_batched_metric(
+                vals=np.array(sum(self.groups, [], ), ),
+                cnts=np.array([len(group, ) for group in self.groups], ),
+                metric=metric,
+            ) == [
+                calculate_metric(vals=group, metric=metric, )
+                for group in self.groups
+            ]
+
+    @pytest.mark.calculations
+    def test_batched_metric_skewed_groups(self) -> None:
+        """
+        Validate batched medians of many single-value groups and one large
+        group.
+        """
+
+        rng: np.random.Generator = np.random.default_rng(21, )
+        vals: np.ndarray = rng.integers(0, 1000, 40000, )
+        cnts: np.ndarray = np.array([1, ] * 20000 + [20000, ], )
+
+        assert calculate_batched_metric(
+            vals=vals,
+            cnts=cnts,
+            metric="median",
+        ) == [
+            round(val, 2, ) for val in vals[: 20000].tolist()
+        ] + [
+            calculate_metric(vals=vals[20000:].tolist(), metric="median", ),
+        ]
+
+    @pytest.mark.calculations
+    def test_groups_metric_calculations(self) -> None:
+        """
+        Validate that grouped metrics match `calculate_metric` per key.
+        """
+
+        keys: np.ndarray = np.array([3, 1, 3, 2, 1, 3, ], )
+        vals: np.ndarray = np.array([4.0, 2.5, 1.0, 5.0, 3.5, 2.0, ], )
+
+        for metric in self.metrics:
+            assert calculate_groups_metric(
+                keys=keys,
+                vals=vals,
+                metric=metric,
+            ) == {
+                key: calculate_metric(
+                    vals=vals[keys == key].tolist(),
+                    metric=metric,
+                )
+                for key in (3, 1, 2, )
+            }
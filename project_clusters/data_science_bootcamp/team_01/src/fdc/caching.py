@@ -0,0 +1,385 @@
+"""
+FDC API standardized nutrients caching module.
+
+Examples of usage:
+    >>> python -m fdc.caching warm ../data/datasets/raw/food_recipes.csv
+    >>> python -m fdc.caching warm ../data/datasets/raw/food_recipes.csv \
+    >>>     --cache-file ../data/cache/nutrients.sqlite --ttl 2592000
+"""
+
+
+import os
+import sqlite3
+import asyncio
+import argparse
+
+from csv import reader
+from time import time
+from json import dumps, load, loads
+
+from .fetching import fetch_ingredients_data
+from .parsing import parse_ingredients_nutrients_data
+from .transformation import (
+    get_ingredients_nutrients_data,
+    standardize_ingredients_nutrients_data,
+)
+
+
+def normalize_ingredient_name(ingredient: str) -> str:
+    """
+    Normalize ingredient name for cache lookups.
+
+    :Parameters:
+        ingredient (str): Ingredient name.
+
+    :Returns:
+        str: Lowercased ingredient name with single spaces.
+    """
+
+    return ' '.join(ingredient.lower().split(), )
+
+
+class NutrientsCache:
+    """
+    A disk-backed SQLite cache of standardized ingredients nutrients.
+
+    Entries are keyed by normalized ingredient name and expire after `ttl`
+    seconds.
+
+    :Attributes:
+        file (str): Path to the SQLite database file.
+        ttl (float | None): Entries time to live in seconds.
+                            Default: None (entries never expire).
+        conn (sqlite3.Connection): Database connection.
+    """
+
+    def __init__(self, file: str, ttl: float | None = None) -> None:
+        """
+        Initializes the cache and creates the database if needed.
+
+        :Parameters:
+            file (str): Path to the SQLite database file.
+            ttl (float | None): Entries time to live in seconds.
+                                Default: None (entries never expire).
+        """
+
+        self.file: str = file
+        self.ttl: float | None = ttl
+
+        if os.path.dirname(file, ):
+            os.makedirs(os.path.dirname(file, ), exist_ok=True, )
+
+        self.conn: sqlite3.Connection = sqlite3.connect(file, )
+
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS ingredients_nutrients ("
+                "ingredient TEXT PRIMARY KEY, "
+                "nutrients TEXT NOT NULL, "
+                "created_at REAL NOT NULL)",
+            )
+
+    def get_many(
+        self,
+        ingredients: list[str]
+    ) -> dict[str, dict[str, float]]:
+        """
+        Retrieves cached nutrients of ingredients.
+
+        :Parameters:
+            ingredients (list[str]): Ingredients names.
+
+        :Returns:
+            dict[str, dict[str, float]]:
+                Keys (str): Normalized names of cached ingredients.
+                Values (dict[str, float]): Standardized nutrients.
+        """
+
+        names: list[str] = list(dict.fromkeys(
+            normalize_ingredient_name(ingredient, )
+            for ingredient in ingredients
+        ), )
+        min_created_at: float = -1.0 if self.ttl is None else \
+            time() - self.ttl
+
+        return {
+            name: loads(nutrients, )
+            for name in names
+            for (nutrients, ) in self.conn.execute(
+                "SELECT nutrients FROM ingredients_nutrients "
+                "WHERE ingredient = ? AND created_at >= ?",
+                (name, min_created_at, ),
+            )
+        }
+
+    def set_many(
+        self,
+        ingredients_nutrients: dict[str, dict[str, float]]
+    ) -> None:
+        """
+        Stores standardized nutrients of ingredients.
+
+        :Parameters:
+            ingredients_nutrients (dict[str, dict[str, float]]):
+                Keys (str): Ingredients names.
+                Values (dict[str, float]): Standardized nutrients.
+        """
+
+        now: float = time()
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO ingredients_nutrients "
+                "(ingredient, nutrients, created_at) VALUES (?, ?, ?)",
+                [
+                    (
+                        normalize_ingredient_name(ingredient, ),
+                        dumps(nutrients, ),
+                        now,
+                    )
+                    for ingredient, nutrients in ingredients_nutrients.items()
+                ],
+            )
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+
+        self.conn.close()
+
+
+async def get_cached_ingredients_nutrients_data(
+    ingredients: list[str],
+    cache: NutrientsCache,
+    nutrients_file: str = "food.json",
+    nutrients_file_path: str = "../data/json/",
+    max_concurrency: int = 8
+) -> list[dict[str, float] | None] | None:
+    """
+    Return standardized ingredients nutrients, fetching only cache misses.
+
+    :Parameters:
+        ingredients (list[str]): Ingredients names.
+        cache (NutrientsCache): Cache of standardized nutrients.
+        nutrients_file (str): File with necessary nutrients names.
+                              Default: "food.json".
+        nutrients_file_path (str): Path to file with necessary nutrients
+                                   names.
+                                   Default: "../data/json/".
+        max_concurrency (int): Maximal number of concurrent requests.
+                               Default: 8.
+
+    :Returns:
+        list[dict[str, float] | None]: Ingredients nutrients data in order of
+                                       ingredients, None for ingredients
+                                       which can not be fetched.
+        None: If error occurs or no data is loaded.
+
+    :Exceptions:
+        Exception: All other errors.
+    """
+
+    try:
+        cached_data: dict[str, dict[str, float]] = cache.get_many(
+            ingredients,
+        )
+        fetch_names: list[str] = [
+            name
+            for name in dict.fromkeys(
+                normalize_ingredient_name(ingredient, )
+                for ingredient in ingredients
+            )
+            if name not in cached_data
+        ]
+
+        if fetch_names:
+            fetched_data: list[dict[str, float] | None] = \
+                get_ingredients_nutrients_data(
+                    nutrients_file,
+                    nutrients_file_path,
+                    standardize_ingredients_nutrients_data(
+                        parse_ingredients_nutrients_data(
+                            await fetch_ingredients_data(
+                                fetch_names,
+                                max_concurrency,
+                            ),
+                        ),
+                    ),
+                )
+            new_data: dict[str, dict[str, float]] = {
+                name: nutrients
+                for name, nutrients in zip(fetch_names, fetched_data, )
+                if nutrients is not None
+            }
+
+            cache.set_many(new_data, )
+            cached_data |= new_data
+
+        return [
+            cached_data.get(normalize_ingredient_name(ingredient, ), )
+            for ingredient in ingredients
+        ]
+    except Exception as err:
+        print("Exception:", err, )
+
+def get_recipes_ingredients(
+    recipes_file: str,
+    food_file: str = "food.json",
+    food_file_path: str = "../data/json/"
+) -> list[str] | None:
+    """
+    Return ingredients columns of a recipes `.csv` file.
+
+    :Parameters:
+        recipes_file (str): Path to the recipes `.csv` file.
+        food_file (str): File with ingredients and not ingredients names.
+                         Default: "food.json".
+        food_file_path (str): Path to the file with ingredients names.
+                              Default: "../data/json/".
+
+    :Returns:
+        list[str]: Ingredients names from the recipes header.
+        None: If error occurs or no data is loaded.
+
+    :Exceptions:
+        FileNotFoundError: When file was not found.
+        Exception: All other errors.
+    """
+
+    try:
+        with open(
+            mode="r",
+            encoding="utf-8",
+            file=food_file_path + food_file,
+        ) as file:
+            food_data: dict[str, list[str]] = load(file, )
+
+        with open(
+            mode="r",
+            newline='',
+            encoding="utf-8",
+            file=recipes_file,
+        ) as file:
+            cols: list[str] = next(reader(file, ), )
+
+        not_ingredients: set[str] = set(
+            food_data.get("not_ingredients", [], ),
+        )
+        ingredients: set[str] = set(food_data.get("ingredients", cols, ), )
+
+        return [
+            col
+            for col in cols
+            if col in ingredients and col not in not_ingredients
+        ]
+    except FileNotFoundError as file_not_found_err:
+        print("FileNotFoundError:", file_not_found_err, )
+    except Exception as err:
+        print("Exception:", err, )
+
+async def warm_nutrients_cache(
+    recipes_file: str,
+    cache: NutrientsCache,
+    food_file: str = "food.json",
+    food_file_path: str = "../data/json/",
+    max_concurrency: int = 8
+) -> int | None:
+    """
+    Pre-populate the cache with nutrients of all recipes ingredients.
+
+    :Parameters:
+        recipes_file (str): Path to the recipes `.csv` file.
+        cache (NutrientsCache): Cache of standardized nutrients.
+        food_file (str): File with ingredients and nutrients names.
+                         Default: "food.json".
+        food_file_path (str): Path to the file with ingredients and
+                              nutrients names.
+                              Default: "../data/json/".
+        max_concurrency (int): Maximal number of concurrent requests.
+                               Default: 8.
+
+    :Returns:
+        int: Number of ingredients present in the cache after warming.
+        None: If error occurs or no data is loaded.
+
+    :Exceptions:
+        Exception: All other errors.
+    """
+
+    try:
+        ingredients: list[str] = get_recipes_ingredients(
+            recipes_file,
+            food_file,
+            food_file_path,
+        )
+        ingredients_data: list[dict[str, float] | None] = \
+            await get_cached_ingredients_nutrients_data(
+                ingredients,
+                cache,
+                food_file,
+                food_file_path,
+                max_concurrency,
+            )
+
+        return sum(
+            ingredient_data is not None
+            for ingredient_data in ingredients_data
+        )
+    except Exception as err:
+        print("Exception:", err, )
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Manage the FDC standardized nutrients cache.",
+    )
+    subparsers: argparse._SubParsersAction = parser.add_subparsers(
+        dest="command",
+        required=True,
+    )
+    warm_parser: argparse.ArgumentParser = subparsers.add_parser(
+        "warm",
+        help="pre-populate the cache from a recipes `.csv` file",
+    )
+
+    warm_parser.add_argument("recipes_file", help="recipes `.csv` file", )
+    warm_parser.add_argument(
+        "--cache-file",
+        default="../data/cache/nutrients.sqlite",
+        help="SQLite cache file",
+    )
+    warm_parser.add_argument(
+        "--ttl",
+        type=float,
+        default=None,
+        help="entries time to live in seconds",
+    )
+    warm_parser.add_argument(
+        "--food-file-path",
+        default="../data/json/",
+        help="path to `food.json` file",
+    )
+    warm_parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=8,
+        help="maximal number of concurrent requests",
+    )
+
+    args: argparse.Namespace = parser.parse_args()
+    nutrients_cache: NutrientsCache = NutrientsCache(
+        args.cache_file,
+        args.ttl,
+    )
+
+    print(
+        "Cached ingredients:",
+        asyncio.run(warm_nutrients_cache(
+            args.recipes_file,
+            nutrients_cache,
+            food_file_path=args.food_file_path,
+            max_concurrency=args.max_concurrency,
+        ), ),
+    )
+    nutrients_cache.close()
@@ -3,8 +3,12 @@ FDC API data fetching module.
 """
 
 
+import asyncio
+
 from typing import Any
+from random import uniform
 from httpx import (
+    Limits,
     AsyncClient,
     ConnectError,
     ConnectTimeout,
@@ -12,19 +16,63 @@ from httpx import (
 
 from .configuration import get_fdc_config
 
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE: bool = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+RETRY_STATUS_CODES: tuple[int, ...] = (429, 500, 502, 503, 504, )
+
+
+def get_retry_delay(
+    attempt: int,
+    backoff: float,
+    retry_after: str | None = None
+) -> float:
+    """
+    Return delay before retrying a request.
+
+    Uses exponential backoff with full jitter, `Retry-After` header value in
+    seconds takes precedence when present.
+
+    :Parameters:
+        attempt (int): Number of the failed attempt starting from 0.
+        backoff (float): Backoff factor in seconds.
+        retry_after (str | None): `Retry-After` response header value.
+                                  Default: None.
+
+    :Returns:
+        float: Delay in seconds.
+    """
+
+    if retry_after is not None and retry_after.isdigit():
+        return float(retry_after, )
+
+    return uniform(0, backoff * 2 ** attempt, )
 
 async def fetch_ingredient_data(
     ingredient: str,
     async_client: AsyncClient,
-    fdc_config: dict[str, Any]
+    fdc_config: dict[str, Any],
+    retries: int = 3,
+    backoff: float = 0.5
 ) -> dict[str, Any] | None:
     """
     Fetch ingredient data from FDC API.
 
+    Requests failed with connection errors or 429/5xx statuses are retried
+    with jittered exponential backoff.
+
     :Parameters:
         ingredient (str): Ingredient name to fetch from FDC database.
         async_client (AsyncClient): Asynchronous client for requests.
         fdc_config (dict[str, Any]): FDC API configuration for requests.
+        retries (int): Maximal number of retries of a failed request.
+                       Default: 3.
+        backoff (float): Backoff factor in seconds between retries.
+                         Default: 0.5.
 
     :Returns:
         dict[str, Any]: Raw ingredient data.
@@ -39,20 +87,39 @@ async def fetch_ingredient_data(
     """
 
     try:
-        resp: Any = await async_client.get(
-            fdc_config["URL"],
-            params={
-                "pageSize": 1,
-                "query": ingredient,
-                "requireExactMatch": True,
-                "api_key": fdc_config["API_KEY"],
-            },
-        )
-
-        if resp.status_code == 200:
-            ingredient_data: dict[str, Any] = resp.json()
-
-            return ingredient_data
+        for attempt in range(retries + 1, ):
+            try:
+                resp: Any = await async_client.get(
+                    fdc_config["URL"],
+                    params={
+                        "pageSize": 1,
+                        "query": ingredient,
+                        "requireExactMatch": True,
+                        "api_key": fdc_config["API_KEY"],
+                    },
+                )
+            except (ConnectTimeout, ConnectError, ):
+                if attempt == retries:
+                    raise
+
+                await asyncio.sleep(get_retry_delay(attempt, backoff, ), )
+
+                continue
+
+            if resp.status_code == 200:
+                ingredient_data: dict[str, Any] = resp.json()
+
+                return ingredient_data
+
+            if resp.status_code not in RETRY_STATUS_CODES or \
+               attempt == retries:
+                break
+
+            await asyncio.sleep(get_retry_delay(
+                attempt,
+                backoff,
+                resp.headers.get("Retry-After", ),
+            ), )
 
         print(
             "ERROR!\n" +
@@ -71,14 +138,30 @@ async def fetch_ingredient_data(
         print("Exception:", err, )
 
 async def fetch_ingredients_data(
-    ingredients: list[str]
+    ingredients: list[str],
+    max_concurrency: int = 8,
+    http2: bool = True,
+    retries: int = 3,
+    backoff: float = 0.5
 ) -> list[dict[str, Any] | None] | None:
     """
     Fetch ingredients data from FDC API.
 
+    Requests run concurrently over one client reusing its connections
+    (HTTP/2 when `h2` package is installed), results keep the order of
+    ingredients.
+
     :Parameters:
         ingredients (list[str]): List of ingredients names to fetch from FDC
                                  database.
+        max_concurrency (int): Maximal number of concurrent requests.
+                               Default: 8.
+        http2 (bool): Use HTTP/2 when available.
+                      Default: True.
+        retries (int): Maximal number of retries of a failed request.
+                       Default: 3.
+        backoff (float): Backoff factor in seconds between retries.
+                         Default: 0.5.
 
     :Returns:
         list[dict[str, Any] | None]: Raw ingredients data.
@@ -88,18 +171,33 @@ async def fetch_ingredients_data(
         Exception: All other errors.
     """
 
-    ingredients_data: list = []
-
     try:
         fdc_config: dict[str, Any] | None = get_fdc_config()
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency, )
 
-        async with AsyncClient() as async_client:
-            for ingredient in ingredients:
-                ingredients_data.append(await fetch_ingredient_data(
+        async def fetch_limited_ingredient_data(
+            ingredient: str
+        ) -> dict[str, Any] | None:
+            async with semaphore:
+                return await fetch_ingredient_data(
                     ingredient,
                     async_client,
                     fdc_config,
-                ), )
+                    retries,
+                    backoff,
+                )
+
+        async with AsyncClient(
+            http2=http2 and HTTP2_AVAILABLE,
+            limits=Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+        ) as async_client:
+            ingredients_data: list = await asyncio.gather(*(
+                fetch_limited_ingredient_data(ingredient, )
+                for ingredient in ingredients
+            ), )
 
         return ingredients_data
     except Exception as err:
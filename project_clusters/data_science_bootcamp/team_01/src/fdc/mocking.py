@@ -0,0 +1,168 @@
+"""
+Local mock of FDC API for testing data fetching without network.
+
+Examples of usage:
+    >>> with MockFDCServer(fails={"milk": 2, }, ) as server:
+    >>>     os.environ["FDC_URL"] = server.url
+    >>>     print(asyncio.run(fetch_ingredients_data(["milk", "honey", ], ), ), )
+    >>>     print(server.max_active, server.requests, )
+"""
+
+
+import time
+
+from json import dumps
+from threading import Lock, Thread
+from urllib.parse import parse_qs, urlsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class MockFDCHandler(BaseHTTPRequestHandler):
+    """
+    Handler of the FDC API foods search requests.
+
+    Responds with one food per query whose nutrients are derived from the
+    query text. Queries listed in `server.fails` respond with 503 status
+    while their fails counter is positive.
+    """
+
+    protocol_version: str = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        """
+        Responds with a foods search result.
+        """
+
+        query: str = parse_qs(urlsplit(self.path, ).query, ).get(
+            "query",
+            [""],
+        )[0]
+
+        with self.server.lock:
+            self.server.active += 1
+            self.server.max_active = max(
+                self.server.max_active,
+                self.server.active,
+            )
+            self.server.requests.append(query, )
+            fail: bool = self.server.fails.get(query, 0, ) > 0
+
+            if fail:
+                self.server.fails[query] -= 1
+
+        time.sleep(self.server.delay, )
+
+        body: bytes = dumps({} if fail else {
+            "foods": [{
+                "description": query,
+                "foodNutrients": [
+                    {
+                        "nutrientName": "Protein",
+                        "value": float(len(query, ), ),
+                        "unitName": "G",
+                    },
+                    {
+                        "nutrientName": "Calcium, Ca",
+                        "value": 10.0 * len(query, ),
+                        "unitName": "MG",
+                    },
+                ],
+            }, ],
+        }, ).encode("utf-8", )
+
+        self.send_response(503 if fail else 200, )
+        self.send_header("Content-Type", "application/json", )
+        self.send_header("Content-Length", str(len(body, ), ), )
+
+        if fail:
+            self.send_header("Retry-After", "0", )
+
+        self.end_headers()
+        self.wfile.write(body, )
+
+        with self.server.lock:
+            self.server.active -= 1
+
+    def log_message(self, *args: object) -> None:
+        """
+        Silences requests logging.
+        """
+
+
+class MockFDCServer:
+    """
+    A local mock FDC API server running in a background thread.
+
+    :Attributes:
+        server (ThreadingHTTPServer): The HTTP server.
+        url (str): URL of the foods search endpoint.
+        requests (list[str]): Queries in order of arrival.
+        max_active (int): Maximal number of concurrently served requests.
+    """
+
+    def __init__(
+        self,
+        fails: dict[str, int] | None = None,
+        delay: float = 0.05
+    ) -> None:
+        """
+        Initializes the mock server on a free local port.
+
+        :Parameters:
+            fails (dict[str, int] | None): Number of failed responses by
+                                           query.
+                                           Default: None (no fails).
+            delay (float): Response delay in seconds.
+                           Default: 0.05.
+        """
+
+        self.server: ThreadingHTTPServer = ThreadingHTTPServer(
+            ("127.0.0.1", 0, ),
+            MockFDCHandler,
+        )
+        self.server.lock = Lock()
+        self.server.active = 0
+        self.server.max_active = 0
+        self.server.requests = []
+        self.server.fails = dict(fails or {}, )
+        self.server.delay = delay
+        self.url: str = "http://127.0.0.1:" + \
+            f"{self.server.server_address[1]}/fdc/v1/foods/search"
+        self.thread: Thread = Thread(
+            target=self.server.serve_forever,
+            daemon=True,
+        )
+
+    @property
+    def requests(self) -> list[str]:
+        """
+        Queries in order of arrival.
+        """
+
+        return self.server.requests
+
+    @property
+    def max_active(self) -> int:
+        """
+        Maximal number of concurrently served requests.
+        """
+
+        return self.server.max_active
+
+    def __enter__(self) -> "MockFDCServer":
+        """
+        Starts the server.
+        """
+
+        self.thread.start()
+
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """
+        Stops the server.
+        """
+
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
@@ -0,0 +1,244 @@
+"""
+FDC API batch processing pipeline module.
+
+Examples of usage:
+    >>> python -m fdc.pipeline ../data/datasets/raw/food_recipes.csv \
+    >>>     ../data/datasets/processed/ingredients_nutrients.csv
+    >>> python -m fdc.pipeline ../data/datasets/raw/food_recipes.csv \
+    >>>     ../data/datasets/processed/ingredients_nutrients.csv \
+    >>>     --batch-size 100 --max-concurrency 16
+"""
+
+
+import os
+import asyncio
+import argparse
+
+from typing import Any
+from pandas import DataFrame
+from json import JSONDecodeError, dump, load
+
+from .fetching import fetch_ingredients_data
+from .parsing import parse_ingredients_nutrients_data
+from .transformation import standardize_ingredients_nutrients_dataframe
+from .caching import get_recipes_ingredients, normalize_ingredient_name
+
+
+def load_pipeline_checkpoint(output_file: str) -> dict[str, Any]:
+    """
+    Load the checkpoint of an output file and drop its unconfirmed tail.
+
+    The checkpoint stores processed ingredients, failed attempts of
+    ingredients without data and the output file size after the last
+    completed batch, bytes written after it are truncated.
+
+    :Parameters:
+        output_file (str): Path to the processed `.csv` file.
+
+    :Returns:
+        dict[str, Any]: Checkpoint with "done" (list[str]), "missing"
+                        (dict[str, int]) and "size" (int) keys, empty one
+                        when processing starts from scratch.
+    """
+
+    try:
+        with open(
+            mode="r",
+            encoding="utf-8",
+            file=output_file + ".checkpoint.json",
+        ) as file:
+            checkpoint: dict[str, Any] = load(file, )
+
+        with open(output_file, "r+b", ) as file:
+            file.truncate(checkpoint["size"], )
+
+        checkpoint.setdefault("missing", {}, )
+
+        return checkpoint
+    except (FileNotFoundError, JSONDecodeError, KeyError, ):
+        if os.path.exists(output_file, ):
+            os.remove(output_file, )
+
+        return {"done": [], "missing": {}, "size": 0, }
+
+def save_pipeline_checkpoint(
+    output_file: str,
+    checkpoint: dict[str, Any]
+) -> None:
+    """
+    Atomically save the checkpoint of an output file.
+
+    :Parameters:
+        output_file (str): Path to the processed `.csv` file.
+        checkpoint (dict[str, Any]): Checkpoint with "done", "missing" and
+                                     "size" keys.
+    """
+
+    with open(
+        mode="w",
+        encoding="utf-8",
+        file=output_file + ".checkpoint.json.tmp",
+    ) as file:
+        dump(checkpoint, file, )
+
+    os.replace(
+        output_file + ".checkpoint.json.tmp",
+        output_file + ".checkpoint.json",
+    )
+
+async def run_nutrients_pipeline(
+    ingredients: list[str],
+    output_file: str,
+    batch_size: int = 50,
+    max_concurrency: int = 8,
+    max_attempts: int = 3,
+    nutrients_file: str = "food.json",
+    nutrients_file_path: str = "../data/json/"
+) -> int | None:
+    """
+    Fetch, parse and standardize nutrients of a whole ingredients vocabulary.
+
+    Ingredients are deduplicated by normalized name and processed in
+    batches: every batch is fetched concurrently, standardized in bulk and
+    appended to the output `.csv` file, then the checkpoint is saved. A
+    rerun resumes after the last completed batch, ingredients which could
+    not be fetched or have no data are retried until `max_attempts` runs
+    missed them. Nutrients are always written as floats, so
+    the output does not depend on how ingredients are split into batches.
+
+    :Parameters:
+        ingredients (list[str]): Ingredients vocabulary.
+        output_file (str): Path to the processed `.csv` file.
+        batch_size (int): Number of ingredients in a batch.
+                          Default: 50.
+        max_concurrency (int): Maximal number of concurrent requests.
+                               Default: 8.
+        max_attempts (int): Number of runs an ingredient without data is
+                            fetched in before it is skipped.
+                            Default: 3.
+        nutrients_file (str): File with necessary nutrients names.
+                              Default: "food.json".
+        nutrients_file_path (str): Path to file with necessary nutrients
+                                   names.
+                                   Default: "../data/json/".
+
+    :Returns:
+        int: Number of ingredients in the output file.
+        None: If error occurs or no data is loaded.
+
+    :Exceptions:
+        OSError: When output files can not be written.
+        Exception: All other errors.
+    """
+
+    try:
+        checkpoint: dict[str, Any] = load_pipeline_checkpoint(output_file, )
+        done: set[str] = set(checkpoint["done"], )
+        missing: dict[str, int] = checkpoint["missing"]
+        todo: list[str] = [
+            name
+            for name in dict.fromkeys(
+                normalize_ingredient_name(ingredient, )
+                for ingredient in ingredients
+            )
+            if name not in done and missing.get(name, 0, ) < max_attempts
+        ]
+
+        for start in range(0, len(todo, ), batch_size, ):
+            batch: list[str] = todo[start: start + batch_size]
+            batch_df: DataFrame = standardize_ingredients_nutrients_dataframe(
+                batch,
+                parse_ingredients_nutrients_data(
+                    await fetch_ingredients_data(batch, max_concurrency, ),
+                ),
+                nutrients_file,
+                nutrients_file_path,
+            ).dropna()
+            nutrients_cols: list[str] = [
+                col for col in batch_df.columns if col != "name"
+            ]
+            batch_df[nutrients_cols] = batch_df[nutrients_cols].astype(
+                float,
+            )
+
+            with open(
+                mode="a",
+                newline='',
+                encoding="utf-8",
+                file=output_file,
+            ) as file:
+                batch_df.to_csv(
+                    file,
+                    header=not checkpoint["size"],
+                    index=False,
+                )
+                file.flush()
+                os.fsync(file.fileno(), )
+                checkpoint["size"] = file.tell()
+
+            batch_done: set[str] = set(batch_df["name"], )
+
+            checkpoint["done"].extend(batch_df["name"].tolist(), )
+
+            for name in batch:
+                if name in batch_done:
+                    missing.pop(name, None, )
+                else:
+                    missing[name] = missing.get(name, 0, ) + 1
+
+            save_pipeline_checkpoint(output_file, checkpoint, )
+
+        return len(checkpoint["done"], )
+    except OSError as os_err:
+        print("OSError:", os_err, )
+    except Exception as err:
+        print("Exception:", err, )
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Compute nutrients of all recipes ingredients.",
+    )
+
+    parser.add_argument("recipes_file", help="recipes `.csv` file", )
+    parser.add_argument("output_file", help="processed `.csv` file", )
+    parser.add_argument(
+        "--food-file-path",
+        default="../data/json/",
+        help="path to `food.json` file",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=50,
+        help="number of ingredients in a batch",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=8,
+        help="maximal number of concurrent requests",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=3,
+        help="number of runs an ingredient without data is fetched in",
+    )
+
+    args: argparse.Namespace = parser.parse_args()
+
+    print(
+        "Processed ingredients:",
+        asyncio.run(run_nutrients_pipeline(
+            get_recipes_ingredients(
+                args.recipes_file,
+                food_file_path=args.food_file_path,
+            ),
+            args.output_file,
+            args.batch_size,
+            args.max_concurrency,
+            args.max_attempts,
+            nutrients_file_path=args.food_file_path,
+        ), ),
+    )
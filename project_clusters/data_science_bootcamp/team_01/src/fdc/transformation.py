@@ -15,17 +15,89 @@ sys.path.append(
 )
 
 from json import load
+from functools import lru_cache
 from pandas import DataFrame
 
 from utils import get_conversion_multiplier_to_g
 
 
+NUTRIENTS_NAMES: dict[str, str] = {
+    "protein": "protein",
+    "total lipid (fat)": "fat",
+    "carbohydrate, by difference": "carbohydrate",
+    "total sugars": "sugars",
+    "fiber, total dietary": "fiber",
+    "calcium, ca": "calcium",
+    "iron, fe": "iron",
+    "sodium, na": "sodium",
+    "vitamin a, iu": "vitamin a",
+    "vitamin a, rae": "vitamin a",
+    "vitamin c, total ascorbic acid": "vitamin c",
+    "cholesterol": "cholesterol",
+    "fatty acids, total saturated": "saturated fat",
+    "potassium, k": "potassium",
+    "vitamin d (d2 + d3), international units": "vitamin d",
+    "vitamin d (d2 + d3)": "vitamin d",
+    "magnesium, mg": "magnesium",
+    "phosphorus, p": "phosphorus",
+    "zinc, zn": "zinc",
+    "copper, cu": "copper",
+    "selenium, se": "selenium",
+    "vitamin e (alpha-tocopherol)": "vitamin e",
+    "thiamin": "thiamin",
+    "riboflavin": "riboflavin",
+    "niacin": "niacin",
+    "vitamin b-6": "vitamin b 6",
+    "folate, total": "folate",
+    "vitamin b-12": "vitamin b 12",
+    "choline, total": "choline",
+    "vitamin k (phylloquinone)": "vitamin k",
+    "manganese, mn": "manganese",
+    "pantothenic acid": "pantothenic acid",
+    "biotin": "biotin",
+}
+UNITS_MULTIPLIERS: dict[str, float] = {
+    unit: get_conversion_multiplier_to_g(unit, )
+    for unit in ('g', "mg", "mcg", "ug", "iu", )
+}
+
+
+@lru_cache
+def load_necessary_nutrients(
+    nutrients_file: str,
+    nutrients_file_path: str
+) -> tuple[str, ...]:
+    """
+    Load necessary nutrients names once per file.
+
+    :Parameters:
+        nutrients_file (str): File with necessary nutrients names.
+        nutrients_file_path (str): Path to file with necessary nutrients names.
+
+    :Returns:
+        tuple[str, ...]: Necessary nutrients names.
+
+    :Exceptions:
+        FileNotFoundError: When file was not found.
+        KeyError: When file do not contain expected values.
+    """
+
+    with open(
+        mode="r",
+        encoding="utf-8",
+        file=nutrients_file_path + nutrients_file,
+    ) as file:
+        return tuple(load(file, )["nutrients"], )
+
 def standardize_ingredient_nutrient_data(
     ingredient_nutrient_data: list[str | None, float, str]
 ) -> list[str, float] | None:
     """
     Standardize ingredient nutrient data.
 
+    Nutrient names are mapped through `NUTRIENTS_NAMES` lookup table,
+    values are converted to grams.
+
     :Parameters:
         ingredient_nutrient_data (list[str | None, float, str]): Ingredient
                                                                  nutrient data.
@@ -46,226 +118,15 @@ def standardize_ingredient_nutrient_data(
         nutrient_name: str | None = ingredient_nutrient_data[0]
         nutrient_num: float = ingredient_nutrient_data[1]
         nutrient_unit: str = ingredient_nutrient_data[2]
-
-        match nutrient_name.lower():
-            case "protein":
-                return [
-                    "protein",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "total lipid (fat)":
-                return [
-                    "fat",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "carbohydrate, by difference":
-                return [
-                    "carbohydrate",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "total sugars":
-                return [
-                    "sugars",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "fiber, total dietary":
-                return [
-                    "fiber",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "calcium, ca":
-                return [
-                    "calcium",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "iron, fe":
-                return [
-                    "iron",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "sodium, na":
-                return [
-                    "sodium",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "vitamin a, iu" | "vitamin a, rae":
-                return [
-                    "vitamin a",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "vitamin c, total ascorbic acid":
-                return [
-                    "vitamin c",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "cholesterol":
-                return [
-                    "cholesterol",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "fatty acids, total saturated":
-                return [
-                    "saturated fat",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "potassium, k":
-                return [
-                    "potassium",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "vitamin d (d2 + d3), international units" |\
-                 "vitamin d (d2 + d3)":
-                return [
-                    "vitamin d",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "magnesium, mg":
-                return [
-                    "magnesium",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "phosphorus, p":
-                return [
-                    "phosphorus",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "zinc, zn":
-                return [
-                    "zinc",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "copper, cu":
-                return [
-                    "copper",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "selenium, se":
-                return [
-                    "selenium",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "vitamin e (alpha-tocopherol)":
-                return [
-                    "vitamin e",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "thiamin":
-                return [
-                    "thiamin",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "riboflavin":
-                return [
-                    "riboflavin",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "niacin":
-                return [
-                    "niacin",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "vitamin b-6":
-                return [
-                    "vitamin b 6",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "folate, total":
-                return [
-                    "folate",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "vitamin b-12":
-                return [
-                    "vitamin b 12",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "choline, total":
-                return [
-                    "choline",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "vitamin k (phylloquinone)":
-                return [
-                    "vitamin k",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "manganese, mn":
-                return [
-                    "manganese",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "pantothenic acid":
-                return [
-                    "pantothenic acid",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
-            case "biotin":
-                return [
-                    "biotin",
-                    nutrient_num * get_conversion_multiplier_to_g(
-                        nutrient_unit,
-                    ),
-                ]
+        std_nutrient_name: str | None = NUTRIENTS_NAMES.get(
+            nutrient_name.lower(),
+        )
+
+        if std_nutrient_name is not None:
+            return [
+                std_nutrient_name,
+                nutrient_num * get_conversion_multiplier_to_g(nutrient_unit, ),
+            ]
     except AttributeError as attr_err:
         print("AttributeError:", attr_err, )
     except IndexError as idx_err:
@@ -412,13 +273,10 @@ def get_ingredients_nutrients_data(
     """
 
     try:
-        with open(
-            mode="r",
-            encoding="utf-8",
-            file=nutrients_file_path + nutrients_file,
-        ) as file:
-            food_data: dict[str, list[str]] = load(file, )
-            nutrients: list[str] = food_data["nutrients"]
+        nutrients: tuple[str, ...] = load_necessary_nutrients(
+            nutrients_file,
+            nutrients_file_path,
+        )
 
         prep_ingredients_nutrients_data: list = []
 
@@ -483,3 +341,153 @@ def get_ingredients_nutrients_dataframe(
         print("TypeError:", type_err, )
     except Exception as err:
         print("Exception:", err, )
+
+def get_ingredients_nutrients_long_dataframe(
+    ingredients: list[str],
+    ingredients_nutrients_data: list[list[list[str | None, float, str]] | None]
+) -> DataFrame | None:
+    """
+    Return raw ingredients nutrients records in one long-format DataFrame.
+
+    :Parameters:
+        ingredients (list[str]): Ingredients names.
+        ingredients_nutrients_data (list[list[list[str | None, float, str]] |
+                                   None]): Raw ingredients nutrients data
+                                           aligned with `ingredients`.
+
+    :Returns:
+        DataFrame: Records with "position" (ingredient index), "name",
+                   "nutrient", "value" and "unit" columns in order of
+                   ingredients and their nutrients.
+        None: If error occurs or no data is loaded.
+
+    :Exceptions:
+        ValueError: When used invalid data format.
+        TypeError: When used incorrect data types.
+        Exception: All other errors.
+    """
+
+    try:
+        records: list[list[int | str | float | None]] = [
+            [position, ingredient, *ingredient_nutrient_data, ]
+            for position, (ingredient, ingredient_nutrients_data) in enumerate(
+                zip(ingredients, ingredients_nutrients_data, ),
+            )
+            for ingredient_nutrient_data in ingredient_nutrients_data or []
+        ]
+
+        return DataFrame(
+            records,
+            columns=["position", "name", "nutrient", "value", "unit", ],
+        )
+    except ValueError as val_err:
+        print("ValueError:", val_err, )
+    except TypeError as type_err:
+        print("TypeError:", type_err, )
+    except Exception as err:
+        print("Exception:", err, )
+
+def standardize_ingredients_nutrients_dataframe(
+    ingredients: list[str],
+    ingredients_nutrients_data: list[list[list[str | None, float, str]] | None],
+    nutrients_file: str = "food.json",
+    nutrients_file_path: str = "../data/json/"
+) -> DataFrame | None:
+    """
+    Standardize raw ingredients nutrients data to a wide DataFrame.
+
+    Records are collected into a long-format DataFrame, nutrients names and
+    units are mapped by joins with `NUTRIENTS_NAMES` and `UNITS_MULTIPLIERS`
+    lookup tables and the result is pivoted to one row per ingredient. The
+    frame matches `get_ingredients_nutrients_dataframe` output: necessary
+    nutrients columns (0 when missing) followed by "name" column, the last
+    record wins for nutrients reported twice. Ingredients without data get
+    NaN nutrients.
+
+    :Parameters:
+        ingredients (list[str]): Ingredients names.
+        ingredients_nutrients_data (list[list[list[str | None, float, str]] |
+                                   None]): Raw ingredients nutrients data
+                                           aligned with `ingredients`.
+        nutrients_file (str): File with necessary nutrients names.
+                              Default: "food.json".
+        nutrients_file_path (str): Path to file with necessary nutrients
+                                   names.
+                                   Default: "../data/json/".
+
+    :Returns:
+        DataFrame: Ingredients nutrients data in Pandas DataFrame.
+        None: If error occurs or no data is loaded.
+
+    :Exceptions:
+        FileNotFoundError: When file was not found.
+        KeyError: When nutrients file do not contain expected values.
+        ValueError: When used invalid data format.
+        Exception: All other errors.
+    """
+
+    try:
+        nutrients: list[str] = list(load_necessary_nutrients(
+            nutrients_file,
+            nutrients_file_path,
+        ), )
+
+        long_df: DataFrame = get_ingredients_nutrients_long_dataframe(
+            ingredients,
+            ingredients_nutrients_data,
+        )
+        long_df["nutrient"] = long_df["nutrient"].str.lower()
+        long_df["unit"] = long_df["unit"].str.lower()
+        long_df = long_df.reset_index(names="record", ).merge(
+            DataFrame(
+                NUTRIENTS_NAMES.items(),
+                columns=["nutrient", "std_nutrient", ],
+            ),
+            on="nutrient",
+        ).merge(
+            DataFrame(
+                UNITS_MULTIPLIERS.items(),
+                columns=["unit", "multiplier", ],
+            ),
+            on="unit",
+        ).sort_values("record", )
+        long_df["value"] = long_df["value"] * long_df["multiplier"]
+
+        wide_df: DataFrame = long_df.drop_duplicates(
+            subset=["position", "std_nutrient", ],
+            keep="last",
+        ).pivot(
+            index="position",
+            columns="std_nutrient",
+            values="value",
+        ).reindex(
+            index=range(len(ingredients, ), ),
+            columns=nutrients,
+        )
+        has_data: list[bool] = [
+            ingredient_nutrients_data is not None
+            for ingredient_nutrients_data in ingredients_nutrients_data
+        ]
+        empty_nutrients: list[str] = [
+            nutrient
+            for nutrient in nutrients
+            if nutrient not in set(long_df["std_nutrient"], )
+        ]
+
+        wide_df.loc[has_data] = wide_df.loc[has_data].fillna(0, )
+
+        if all(has_data, ):
+            wide_df[empty_nutrients] = wide_df[empty_nutrients].astype(int, )
+
+        wide_df["name"] = ingredients
+        wide_df.columns.name = None
+
+        return wide_df.reset_index(drop=True, )
+    except FileNotFoundError as file_not_found_err:
+        print("FileNotFoundError:", file_not_found_err, )
+    except KeyError as key_err:
+        print("KeyError:", key_err, )
+    except ValueError as val_err:
+        print("ValueError:", val_err, )
+    except Exception as err:
+        print("Exception:", err, )
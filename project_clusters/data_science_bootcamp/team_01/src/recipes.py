@@ -0,0 +1,264 @@
+"""
+Recipes similarity search module.
+
+Examples of usage:
+    >>> index: RecipesSimilarityIndex = RecipesSimilarityIndex.from_dataframe(
+    >>>     read_csv("../data/datasets/processed/features.csv", index_col=0, ),
+    >>>     titles=recipes_df["title"].tolist(),
+    >>>     ratings=recipes_df["rating"].tolist(),
+    >>> )
+    >>> index.save("../data/models/recipes_index.npz", )
+
+    >>> index = RecipesSimilarityIndex.load(
+    >>>     "../data/models/recipes_index.npz",
+    >>> )
+    >>> print(index.get_similar_recipes(["milk", "honey", "jam", ], ), )
+"""
+
+
+import numpy as np
+
+from typing import Any
+from json import dumps, loads
+from pandas import DataFrame
+
+
+class RecipesSimilarityIndex:
+    """
+    An index of recipes by ingredients for similar recipes search.
+
+    Recipes are stored as sparse binary vectors in CSR arrays together with
+    an inverted index from every ingredient to the recipes containing it.
+    A query only scores recipes sharing at least one ingredient with it by
+    the Jaccard similarity of ingredients sets.
+
+    :Attributes:
+        ingredients (list[str]): Ingredients names (matrix columns).
+        ingredients_idxs (dict[str, int]): Column index by ingredient name.
+        recipes_indptr (np.ndarray): CSR rows pointers of recipes.
+        recipes_indices (np.ndarray): CSR ingredients indices of recipes.
+        postings_indptr (np.ndarray): Inverted index pointers of ingredients.
+        postings_indices (np.ndarray): Inverted index recipes indices.
+        recipes_sizes (np.ndarray): Number of ingredients in every recipe.
+        recipes_data (list[dict[str, Any]]): Recipes metadata (titles,
+                                             ratings, URLs) by row.
+    """
+
+    def __init__(
+        self,
+        ingredients: list[str],
+        recipes_indptr: np.ndarray,
+        recipes_indices: np.ndarray,
+        recipes_data: list[dict[str, Any]] | None = None
+    ) -> None:
+        """
+        Initializes the index from CSR arrays of recipes.
+
+        :Parameters:
+            ingredients (list[str]): Ingredients names (matrix columns).
+            recipes_indptr (np.ndarray): CSR rows pointers of recipes.
+            recipes_indices (np.ndarray): CSR ingredients indices of recipes.
+            recipes_data (list[dict[str, Any]] | None): Recipes metadata by
+                                                        row.
+                                                        Default: None.
+        """
+
+        self.ingredients: list[str] = list(ingredients, )
+        self.ingredients_idxs: dict[str, int] = {
+            ingredient.lower(): idx
+            for idx, ingredient in enumerate(self.ingredients, )
+        }
+        self.recipes_indptr: np.ndarray = np.asarray(
+            recipes_indptr,
+            dtype=np.int64,
+        )
+        self.recipes_indices: np.ndarray = np.asarray(
+            recipes_indices,
+            dtype=np.int32,
+        )
+        self.recipes_sizes: np.ndarray = np.diff(self.recipes_indptr, )
+        self.recipes_data: list[dict[str, Any]] = recipes_data or [
+            {} for _ in range(len(self.recipes_sizes, ), )
+        ]
+
+        recipes_rows: np.ndarray = np.repeat(
+            np.arange(len(self.recipes_sizes, ), dtype=np.int32, ),
+            self.recipes_sizes,
+        )
+        order: np.ndarray = np.argsort(self.recipes_indices, kind="stable", )
+
+        self.postings_indices: np.ndarray = recipes_rows[order]
+        self.postings_indptr: np.ndarray = np.concatenate((
+            [0],
+            np.cumsum(np.bincount(
+                self.recipes_indices,
+                minlength=len(self.ingredients, ),
+            ), ),
+        ), )
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        ingredients_df: DataFrame,
+        titles: list[str] | None = None,
+        ratings: list[float] | None = None,
+        urls: list[str] | None = None
+    ) -> "RecipesSimilarityIndex":
+        """
+        Builds the index from a binary recipes by ingredients DataFrame.
+
+        :Parameters:
+            ingredients_df (DataFrame): Binary matrix with recipes rows and
+                                        ingredients columns.
+            titles (list[str] | None): Recipes titles.
+                                       Default: None.
+            ratings (list[float] | None): Recipes ratings.
+                                          Default: None.
+            urls (list[str] | None): Recipes URLs.
+                                     Default: None.
+
+        :Returns:
+            RecipesSimilarityIndex: The built index.
+        """
+
+        rows, cols = np.nonzero(ingredients_df.to_numpy() > 0, )
+        meta: dict[str, list[Any] | None] = {
+            "title": titles,
+            "rating": ratings,
+            "url": urls,
+        }
+
+        return cls(
+            ingredients=[str(col, ) for col in ingredients_df.columns],
+            recipes_indptr=np.concatenate((
+                [0],
+                np.cumsum(np.bincount(
+                    rows,
+                    minlength=len(ingredients_df, ),
+                ), ),
+            ), ),
+            recipes_indices=cols,
+            recipes_data=[
+                {
+                    key: vals[row]
+                    for key, vals in meta.items()
+                    if vals is not None
+                }
+                for row in range(len(ingredients_df, ), )
+            ],
+        )
+
+    def save(self, file: str) -> None:
+        """
+        Saves the index to a `.npz` file.
+
+        :Parameters:
+            file (str): Path to the `.npz` file.
+        """
+
+        np.savez_compressed(
+            file,
+            recipes_indptr=self.recipes_indptr,
+            recipes_indices=self.recipes_indices,
+            meta=np.array(dumps({
+                "ingredients": self.ingredients,
+                "recipes_data": self.recipes_data,
+            }, ), ),
+        )
+
+    @classmethod
+    def load(cls, file: str) -> "RecipesSimilarityIndex":
+        """
+        Loads the index from a `.npz` file.
+
+        :Parameters:
+            file (str): Path to the `.npz` file.
+
+        :Returns:
+            RecipesSimilarityIndex: The loaded index.
+        """
+
+        with np.load(file, ) as arrays:
+            meta: dict[str, Any] = loads(str(arrays["meta"], ), )
+
+            return cls(
+                ingredients=meta["ingredients"],
+                recipes_indptr=arrays["recipes_indptr"],
+                recipes_indices=arrays["recipes_indices"],
+                recipes_data=meta["recipes_data"],
+            )
+
+    def get_similar_recipes(
+        self,
+        ingredients: list[str],
+        cnt: int = 3
+    ) -> list[dict[str, Any]] | None:
+        """
+        Retrieves the most similar recipes to a list of ingredients.
+
+        :Parameters:
+            ingredients (list[str]): Ingredients names, unknown ones are
+                                     ignored.
+            cnt (int): Number of recipes to return.
+                       Default: 3.
+
+        :Returns:
+            list[dict[str, Any]]: Recipes metadata with "index" and
+                                  "similarity" keys sorted by similarity,
+                                  ties in recipes order.
+            None: If error occurs or no data is loaded.
+
+        :Exceptions:
+            ValueError: When used invalid data format.
+            TypeError: When used incorrect data types.
+            Exception: All other errors.
+        """
+
+        try:
+            query_idxs: list[int] = sorted({
+                self.ingredients_idxs[ingredient.strip().lower()]
+                for ingredient in ingredients
+                if ingredient.strip().lower() in self.ingredients_idxs
+            }, )
+
+            if not query_idxs or cnt <= 0:
+                return []
+
+            candidates, overlaps = np.unique(
+                np.concatenate([
+                    self.postings_indices[
+                        self.postings_indptr[idx]: self.postings_indptr[idx + 1]
+                    ]
+                    for idx in query_idxs
+                ], ),
+                return_counts=True,
+            )
+            scores: np.ndarray = overlaps / (
+                len(query_idxs, ) + self.recipes_sizes[candidates] - overlaps
+            )
+
+            if cnt < len(scores, ):
+                threshold: float = np.partition(scores, len(scores, ) - cnt, )[
+                    len(scores, ) - cnt
+                ]
+                top_mask: np.ndarray = scores >= threshold
+                candidates, scores = candidates[top_mask], scores[top_mask]
+
+            top_order: np.ndarray = np.lexsort((candidates, -scores, ), )[: cnt]
+
+            return [
+                self.recipes_data[recipe] | {
+                    "index": recipe,
+                    "similarity": round(score, 4, ),
+                }
+                for recipe, score in zip(
+                    candidates[top_order].tolist(),
+                    scores[top_order].tolist(),
+                )
+            ]
+        except ValueError as val_err:
+            print("ValueError:", val_err, )
+        except TypeError as type_err:
+            print("TypeError:", type_err, )
+        except Exception as err:
+            print("Exception:", err, )
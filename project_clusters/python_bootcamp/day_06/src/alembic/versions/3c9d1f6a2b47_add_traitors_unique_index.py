@@ -0,0 +1,37 @@
+"""add traitors unique index
+
+Revision ID: 3c9d1f6a2b47
+Revises: ea99e7e19ecd
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+from typing import Sequence, Union
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9d1f6a2b47'
+down_revision: Union[str, None] = 'ea99e7e19ecd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Remove duplicated traitors before creating the unique index:
+    op.execute(sa.text(
+        "DELETE FROM traitors WHERE id NOT IN "
+        "(SELECT min_id FROM (SELECT min(id) AS min_id FROM traitors GROUP BY first_name, last_name, rank) AS kept)"
+    ))
+    op.create_index(
+        "ix_traitors_first_name_last_name_rank",
+        "traitors",
+        ["first_name", "last_name", "rank"],
+        unique=True,
+        if_not_exists=True  # The client creates it on existing tables too
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_traitors_first_name_last_name_rank", table_name="traitors")
@@ -0,0 +1,78 @@
+"""add officers spaceship foreign key
+
+Revision ID: 8e2b5d0c7a13
+Revises: 3c9d1f6a2b47
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op, context
+from typing import Sequence, Union
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e2b5d0c7a13'
+down_revision: Union[str, None] = '3c9d1f6a2b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Officers columns of the model missing in the base migration:
+officers_added_columns = {"spaceship_id": sa.Integer(), "status": sa.String()}
+
+
+# Function for getting officers columns, indexes and foreign keys names (offline the base migration state is assumed):
+def get_officers_schema():
+    if context.is_offline_mode():
+        return set(), set(), set()
+
+    inspector = sa.inspect(op.get_bind())
+
+    return ({column["name"] for column in inspector.get_columns("officers")},
+            {index["name"] for index in inspector.get_indexes("officers")},
+            {foreign_key["name"] for foreign_key in inspector.get_foreign_keys("officers")})
+
+
+def upgrade() -> None:
+    columns, indexes, foreign_keys = get_officers_schema()
+    added_columns = [name for name in officers_added_columns if name not in columns]
+
+    # Columns are added nullable, filled and then made required, so existing rows do not break them:
+    with op.batch_alter_table("officers") as batch_op:
+        for name in added_columns:
+            batch_op.add_column(sa.Column(name, officers_added_columns[name], nullable=True))
+
+    # Remove officers without spaceship before creating the foreign key:
+    op.execute(sa.text("DELETE FROM officers WHERE spaceship_id IS NULL OR "
+                       "spaceship_id NOT IN (SELECT id FROM spaceships)"))
+
+    if "status" in added_columns:
+        op.execute(sa.text("UPDATE officers SET status = "
+                           "(SELECT alignment FROM spaceships WHERE spaceships.id = officers.spaceship_id)"))
+
+    with op.batch_alter_table("officers") as batch_op:
+        for name in added_columns:
+            batch_op.alter_column(name, existing_type=officers_added_columns[name], nullable=False)
+
+        # Tables created by models already have them:
+        if "ix_officers_spaceship_id" not in indexes:
+            batch_op.create_index("ix_officers_spaceship_id", ["spaceship_id"])
+
+        if "fk_officers_spaceship_id_spaceships" not in foreign_keys:
+            batch_op.create_foreign_key("fk_officers_spaceship_id_spaceships", "spaceships", ["spaceship_id"], ["id"])
+
+
+def downgrade() -> None:
+    # Drop columns added by upgrade (with their index and foreign key), the base migration has not them:
+    if context.is_offline_mode():
+        dropped_columns = list(officers_added_columns)
+    else:
+        dropped_columns = [name for name in officers_added_columns if name in get_officers_schema()[0]]
+
+    with op.batch_alter_table("officers") as batch_op:
+        batch_op.drop_constraint("fk_officers_spaceship_id_spaceships", type_="foreignkey")
+        batch_op.drop_index("ix_officers_spaceship_id")
+
+        for name in dropped_columns:
+            batch_op.drop_column(name)
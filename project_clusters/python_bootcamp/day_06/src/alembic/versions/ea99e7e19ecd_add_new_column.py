@@ -19,9 +19,8 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    new_column = Column("speed", Integer())
-    spaceships.append_column(new_column)
+    op.add_column("spaceships", sa.Column("speed", sa.Integer()))
 
 
 def downgrade() -> None:
-    pass
+    op.drop_column("spaceships", "speed")
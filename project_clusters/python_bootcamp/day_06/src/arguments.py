@@ -1,3 +1,31 @@
+import os
+
 USER_NAME = "postgres"
 USER_PASSWORD = "1969"
 DATABASE_NAME = "spaceships"
+
+# Database URL, can be overridden by environment variable (e.g. "sqlite:///spaceships.sqlite"):
+DATABASE_URL = os.environ.get(
+    "DATABASE_URL",
+    "postgresql+psycopg2://" + USER_NAME + ":" + USER_PASSWORD + "@localhost/" + DATABASE_NAME
+)
+
+# Connection pool settings:
+POOL_SIZE = int(os.environ.get("DATABASE_POOL_SIZE", 5))
+MAX_OVERFLOW = int(os.environ.get("DATABASE_MAX_OVERFLOW", 10))
+POOL_TIMEOUT = float(os.environ.get("DATABASE_POOL_TIMEOUT", 30))
+POOL_RECYCLE = int(os.environ.get("DATABASE_POOL_RECYCLE", 1800))
+POOL_PRE_PING = os.environ.get("DATABASE_POOL_PRE_PING", "1") == "1"
+QUERY_CACHE_SIZE = int(os.environ.get("DATABASE_QUERY_CACHE_SIZE", 500))
+
+# Write streamed ships with async engine (requires asyncpg or aiosqlite):
+USE_ASYNC_ENGINE = os.environ.get("DATABASE_USE_ASYNC", "0") == "1"
+
+# Async ships server settings:
+SERVER_PORT = int(os.environ.get("SERVER_PORT", 55555))
+SERVER_SEED = int(os.environ["SERVER_SEED"]) if "SERVER_SEED" in os.environ else None
+SERVER_BATCH_SIZE = int(os.environ.get("SERVER_BATCH_SIZE", 4096))
+SERVER_MAX_CONCURRENT_STREAMS = int(os.environ.get("SERVER_MAX_CONCURRENT_STREAMS", 100))
+SERVER_MAX_CONCURRENT_RPCS = int(os.environ["SERVER_MAX_CONCURRENT_RPCS"]) if "SERVER_MAX_CONCURRENT_RPCS" in os.environ \
+    else None
+SERVER_COMPRESSION = os.environ.get("SERVER_COMPRESSION", "none")  # "none", "deflate" or "gzip"
@@ -0,0 +1,50 @@
+# Necessary modules:
+import sys
+import time
+import random
+import ex00_pb2
+import database
+import reporting_server
+import reporting_client_v3
+
+
+# Function for generating streams of spaceships:
+def generate_streams(streams_count):
+    servicer = reporting_server.Ex00Servicer()
+    coordinates = ex00_pb2.Coordinate(height=45, azimuth=45)
+
+    return [list(servicer.GetShips(coordinates, None)) for _ in range(streams_count)]
+
+
+# Function for measuring ingestion of streams:
+def measure(engine, add_function, streams):
+    reporting_client_v3.delete_tables(engine)
+    reporting_client_v3.create_tables(engine)
+
+    start = time.perf_counter()
+    ships_count = sum(add_function(engine, stream) for stream in streams)
+
+    return ships_count, time.perf_counter() - start
+
+
+# Main process function:
+def run():
+    streams_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    database_url = sys.argv[2] if len(sys.argv) > 2 else "sqlite:///benchmark.sqlite"
+
+    random.seed(21)
+
+    streams = generate_streams(streams_count)
+    engine = database.create_engine(database_url)
+
+    for name, add_function in (("by row", reporting_client_v3.add_spaceships_by_row),
+                               ("bulk", reporting_client_v3.add_spaceships_bulk)):
+        ships_count, elapsed = measure(engine, add_function, streams)
+
+        print(f"{name}: {ships_count} ships in {elapsed:.3f} s ({ships_count / elapsed:.1f} ships/s)")
+
+    reporting_client_v3.delete_tables(engine)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,79 @@
+# Necessary modules:
+import sys
+import time
+import grpc
+import asyncio
+import ex00_pb2
+import arguments
+import ex00_pb2_grpc
+import numpy as np
+import reporting_server_v2
+
+
+# Async function for reading one stream, returns count of ships and latency of stream:
+async def read_stream(stub, coordinates):
+    start = time.perf_counter()
+    ships_count = 0
+
+    async for _ in stub.GetShips(coordinates):
+        ships_count += 1
+
+    return ships_count, time.perf_counter() - start
+
+
+# Async function for reading streams with limited concurrency:
+async def load(address, streams_count, concurrency, compression):
+    semaphore = asyncio.Semaphore(concurrency)
+    coordinates = ex00_pb2.Coordinate(height=45, azimuth=45)
+
+    async with grpc.aio.insecure_channel(address, compression=reporting_server_v2.compressions[compression]) as channel:
+        stub = ex00_pb2_grpc.Ex00Stub(channel)
+
+        async def limited_read_stream():
+            async with semaphore:
+                return await read_stream(stub, coordinates)
+
+        await read_stream(stub, coordinates)  # Warm up connection
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(limited_read_stream() for _ in range(streams_count)))
+
+        return results, time.perf_counter() - start
+
+
+# Async function for load test of local server, started in this process if port is not given:
+async def measure(streams_count, concurrency, port=None):
+    server = None
+
+    if port is None:
+        server, port = reporting_server_v2.create_server(port=0)
+
+        await server.start()
+
+    try:
+        results, elapsed = await load("localhost:" + str(port), streams_count, concurrency,
+                                      arguments.SERVER_COMPRESSION)
+    finally:
+        if server is not None:
+            await server.stop(None)
+
+    ships_count = sum(count for count, _ in results)
+    latencies = np.array([latency for _, latency in results]) * 1000
+
+    print(f"{streams_count} streams, {ships_count} ships in {elapsed:.3f} s ({ships_count / elapsed:.1f} ships/s, "
+          f"{streams_count / elapsed:.1f} streams/s)")
+    print(f"stream latency: p50 {np.percentile(latencies, 50):.2f} ms, p95 {np.percentile(latencies, 95):.2f} ms, "
+          f"p99 {np.percentile(latencies, 99):.2f} ms")
+
+
+# Main process function:
+def run():
+    streams_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    port = int(sys.argv[3]) if len(sys.argv) > 3 else None
+
+    asyncio.run(measure(streams_count, concurrency, port))
+
+
+if __name__ == "__main__":
+    run()
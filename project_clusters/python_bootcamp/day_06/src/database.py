@@ -0,0 +1,138 @@
+# Necessary modules:
+import weakref
+import arguments
+import sqlalchemy
+
+from sqlalchemy.orm import sessionmaker
+from contextlib import asynccontextmanager, contextmanager
+
+# Async drivers of dialects:
+async_drivers = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+# Shared engines of process by URL and sessions factories by engine:
+engines = {}
+sessionmakers = weakref.WeakKeyDictionary()
+async_engines = {}
+async_sessionmakers = weakref.WeakKeyDictionary()
+
+
+# Function for getting engine parameters with tunable pool:
+def get_engine_params(url=None, pool_size=None, max_overflow=None, pool_timeout=None, pool_recycle=None,
+                      pool_pre_ping=None, query_cache_size=None, **kwargs):
+    url = sqlalchemy.make_url(url or arguments.DATABASE_URL)
+    params = {
+        "pool_pre_ping": arguments.POOL_PRE_PING if pool_pre_ping is None else pool_pre_ping,
+        "query_cache_size": arguments.QUERY_CACHE_SIZE if query_cache_size is None else query_cache_size,
+    }
+
+    # Pool size parameters are only supported by queue pools (SQLite uses its own pools):
+    if url.get_backend_name() != "sqlite" and "poolclass" not in kwargs:
+        params.update(
+            pool_size=arguments.POOL_SIZE if pool_size is None else pool_size,
+            max_overflow=arguments.MAX_OVERFLOW if max_overflow is None else max_overflow,
+            pool_timeout=arguments.POOL_TIMEOUT if pool_timeout is None else pool_timeout,
+            pool_recycle=arguments.POOL_RECYCLE if pool_recycle is None else pool_recycle,
+        )
+
+    return url, {**params, **kwargs}
+
+
+# Function for creating engine:
+def create_engine(url=None, **kwargs):
+    url, params = get_engine_params(url, **kwargs)
+
+    return sqlalchemy.create_engine(url, **params)
+
+
+# Function for creating async engine (asyncpg or aiosqlite driver is required):
+def create_async_engine(url=None, **kwargs):
+    from sqlalchemy.ext.asyncio import create_async_engine as create_async_engine_
+
+    url, params = get_engine_params(url, **kwargs)
+    url = url.set(drivername=url.get_backend_name() + "+" + async_drivers[url.get_backend_name()])
+
+    return create_async_engine_(url, **params)
+
+
+# Function for getting shared engine:
+def get_engine(url=None):
+    url = url or arguments.DATABASE_URL
+
+    if url not in engines:
+        engines[url] = create_engine(url)
+
+    return engines[url]
+
+
+# Function for getting shared sessions factory of engine:
+def get_engine_sessionmaker(engine):
+    if engine not in sessionmakers:
+        sessionmakers[engine] = sessionmaker(engine, expire_on_commit=False)
+
+    return sessionmakers[engine]
+
+
+# Function for getting shared sessions factory:
+def get_sessionmaker(url=None):
+    return get_engine_sessionmaker(get_engine(url))
+
+
+# Function for getting shared async engine:
+def get_async_engine(url=None):
+    url = url or arguments.DATABASE_URL
+
+    if url not in async_engines:
+        async_engines[url] = create_async_engine(url)
+
+    return async_engines[url]
+
+
+# Function for getting shared async sessions factory of async engine:
+def get_async_engine_sessionmaker(engine):
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    if engine not in async_sessionmakers:
+        async_sessionmakers[engine] = async_sessionmaker(engine, expire_on_commit=False)
+
+    return async_sessionmakers[engine]
+
+
+# Function for getting shared async sessions factory:
+def get_async_sessionmaker(url=None):
+    return get_async_engine_sessionmaker(get_async_engine(url))
+
+
+# Session scope of one request, committed on success and rolled back on error:
+@contextmanager
+def session_scope(engine=None):
+    factory = get_sessionmaker() if engine is None else get_engine_sessionmaker(engine)
+
+    with factory() as session, session.begin():
+        yield session
+
+
+# Async session scope of one request, committed on success and rolled back on error:
+@asynccontextmanager
+async def async_session_scope(engine=None):
+    factory = get_async_sessionmaker() if engine is None else get_async_engine_sessionmaker(engine)
+
+    async with factory() as session, session.begin():
+        yield session
+
+
+# Function for disposing shared engines:
+def dispose_engines():
+    for engine in engines.values():
+        engine.dispose()
+
+    engines.clear()
+    sessionmakers.clear()
+
+
+# Async function for disposing shared async engines (inside event loop they were used in):
+async def dispose_async_engines():
+    for engine in async_engines.values():
+        await engine.dispose()
+
+    async_engines.clear()
+    async_sessionmakers.clear()
@@ -1,4 +1,6 @@
-from sqlalchemy.orm import Mapped, mapped_column, DeclarativeBase
+from typing import List
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship, DeclarativeBase
 
 
 # Base class for all entities:
@@ -17,6 +19,8 @@ class Spaceship(Base):
     crew_size: Mapped[int]
     armed: Mapped[str]
 
+    officers: Mapped[List["Officer"]] = relationship(back_populates="spaceship", order_by="Officer.id")
+
 
 # Class for officers:
 class Officer(Base):
@@ -25,13 +29,19 @@ class Officer(Base):
     first_name: Mapped[str]
     last_name: Mapped[str]
     rank: Mapped[str]
-    spaceship_id: Mapped[int]
+    spaceship_id: Mapped[int] = mapped_column(
+        ForeignKey("spaceships.id", name="fk_officers_spaceship_id_spaceships"),
+        index=True
+    )
     status: Mapped[str]
 
+    spaceship: Mapped["Spaceship"] = relationship(back_populates="officers")
+
 
 # Class of traitors:
 class Traitors(Base):
     __tablename__ = 'traitors'
+    __table_args__ = (Index("ix_traitors_first_name_last_name_rank", "first_name", "last_name", "rank", unique=True),)
 
     first_name: Mapped[str]
     last_name: Mapped[str]
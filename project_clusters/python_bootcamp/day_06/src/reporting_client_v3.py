@@ -1,11 +1,15 @@
 from __future__ import print_function
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import selectinload
+from sqlalchemy import Boolean, and_, cast, func, insert, not_, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
 
 # Necessary modules:
 import sys
 import grpc
+import asyncio
 import models
 import ex00_pb2
+import database
 import arguments
 import sqlalchemy
 import ex00_pb2_grpc
@@ -15,57 +19,35 @@ import reporting_client_v3
 alignment_list = ["Ally", "Enemy"]
 class_list = ["Corvette", "Frigate", "Cruiser", "Destroyer", "Carrier", "Dreadnought"]
 
+# Checker rules: class, length range, crew size range, armed, alignment:
+checker_rules = [
+    ("Corvette", 80, 250, 4, 10, True, "Enemy"),
+    ("Frigate", 300, 600, 10, 15, True, "Ally"),
+    ("Cruiser", 500, 1000, 15, 30, True, "Enemy"),
+    ("Destroyer", 800, 1000, 50, 80, True, "Ally"),
+    ("Carrier", 1000, 4000, 120, 250, False, "Enemy"),
+    ("Dreadnought", 5000, 20000, 300, 500, True, "Enemy"),
+]
 
-# Add traitor:
-def add_traitor(engine, first_name, last_name, rank):
-    with Session(engine) as session:
-        new_traitor = models.Traitors(
-            first_name=first_name,
-            last_name=last_name,
-            rank=rank
-        )
-
-        session.add(new_traitor)
-        session.commit()
-        session.close()
-
-
-# Check that traitor exists:
-def is_exist_traitor(engine, first_name, last_name, rank):
-    session = Session(engine)
+# Inserts of dialects supporting "INSERT ... ON CONFLICT DO NOTHING":
+insert_dialects = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
 
-    for traitor in session.query(models.Traitors):
-        if (traitor.first_name == first_name) and (traitor.last_name == last_name) and (traitor.rank == rank):
-            session.close()
-            return True
 
-    session.close()
-
-    return False
-
-
-# Function for finding traitors:
+# Function for finding traitors (officers with the same name and rank, but different statuses):
 def find_traitors(engine):
-    session = Session(engine)
-
-    for officer in session.query(models.Officer):
-        for second_officer in session.query(models.Officer):
-            if ((officer.last_name == second_officer.last_name) and
-                    (officer.first_name == second_officer.first_name) and (officer.rank == second_officer.rank) and
-                    (officer.status != second_officer.status) and not
-                    is_exist_traitor(engine, second_officer.first_name, second_officer.last_name,
-                                     second_officer.rank)):
-                add_traitor(engine, officer.first_name, officer.last_name, officer.rank)
-                session.close()
+    traitors = (
+        select(models.Officer.first_name, models.Officer.last_name, models.Officer.rank)
+        .group_by(models.Officer.first_name, models.Officer.last_name, models.Officer.rank)
+        .having(func.count(models.Officer.status.distinct()) > 1)
+    )
+    statement = (
+        insert_dialects[engine.dialect.name](models.Traitors)
+        .from_select(["first_name", "last_name", "rank"], traitors)
+        .on_conflict_do_nothing(index_elements=["first_name", "last_name", "rank"])
+    )
 
-
-# Function for connection:
-def create_connection(USER_NAME: str, USER_PASSWORD: str, DATABASE_NAME: str):
-    engine = sqlalchemy.create_engine(f"postgresql+psycopg2://" + USER_NAME + ":" + USER_PASSWORD + "@localhost/" +
-                                      DATABASE_NAME)
-    engine.connect()
-
-    return engine
+    with database.session_scope(engine) as session:
+        return session.execute(statement).rowcount
 
 
 # Functions working with tables:
@@ -73,32 +55,37 @@ def create_tables(engine):
     models.Base.metadata.create_all(engine)
 
 
-def delete_tables(engine):
-    models.Base.metadata.drop_all(engine)
+# Function for creating unique index of traitors needed by "ON CONFLICT" on existing table (create_all skips it):
+def create_traitors_index(engine):
+    try:
+        for index in models.Traitors.__table__.indexes:
+            index.create(engine, checkfirst=True)
+    except sqlalchemy.exc.SQLAlchemyError:  # Duplicated traitors are removed by migration
+        print("ERROR! TRAITORS TABLE HAS NO UNIQUE INDEX, RUN MIGRATIONS: alembic upgrade head")
 
+        return False
 
-# Function for finding and returning list of officers of spaceship:
-def find_officers(engine, spaceship_index):
-    session = Session(engine)
-    answer = '['
+    return True
 
-    for officer in session.query(models.Officer):
-        if officer.spaceship_id == spaceship_index:
-            answer = answer + '{ first_name: ' + str(officer.first_name) + ', '
-            answer = answer + 'last_name: ' + str(officer.last_name) + ', '
-            answer = answer + 'rank: ' + str(officer.rank) + ' }, '
 
-    session.close()
+def delete_tables(engine):
+    models.Base.metadata.drop_all(engine)
 
-    if answer == "{":
-        return ""
-    else:
-        return answer[:-2] + ']'
+
+# Function for formatting list of officers of spaceship:
+def format_officers(officers):
+    return "[" + ", ".join(
+        "{ first_name: " + str(officer.first_name) +
+        ", last_name: " + str(officer.last_name) +
+        ", rank: " + str(officer.rank) +
+        " }"
+        for officer in officers
+    ) + "]"
 
 
 # Functions for add new spaceship:
 def add_spaceship(engine, spaceship):
-    with Session(engine) as session:
+    with database.session_scope(engine) as session:
         new_spaceship = models.Spaceship(
             alignment=reporting_client_v3.bytes_to_alignment(spaceship.alignment),
             name=spaceship.name,
@@ -109,13 +96,11 @@ def add_spaceship(engine, spaceship):
         )
 
         session.add(new_spaceship)
-        session.commit()
-        session.close()
 
 
 # Functions for add a new officer:
 def add_officer(engine, officer, spaceship_id, status):
-    with Session(engine) as session:
+    with database.session_scope(engine) as session:
         new_officer = models.Officer(
             first_name=officer.first_name,
             last_name=officer.last_name,
@@ -125,19 +110,127 @@ def add_officer(engine, officer, spaceship_id, status):
         )
 
         session.add(new_officer)
-        session.commit()
-        session.close()
 
 
-# Function to find status of last spaceship:
-def find_last_status(engine):
-    status = []
-    session = Session(engine)
+# Function for converting streamed spaceship to table row:
+def spaceship_to_row(spaceship):
+    return {
+        "alignment": reporting_client_v3.bytes_to_alignment(spaceship.alignment),
+        "name": spaceship.name,
+        "type": reporting_client_v3.bytes_to_class(spaceship.type),
+        "length": round(spaceship.length, 1),
+        "crew_size": spaceship.size,
+        "armed": spaceship.armed,
+    }
+
+
+# Function for converting officers of streamed spaceships to table rows:
+def officers_to_rows(spaceships, spaceships_rows, spaceships_ids):
+    return [
+        {
+            "first_name": officer.first_name,
+            "last_name": officer.last_name,
+            "rank": officer.rank,
+            "spaceship_id": spaceship_id,
+            "status": spaceship_row["alignment"],
+        }
+        for spaceship, spaceship_row, spaceship_id in zip(spaceships, spaceships_rows, spaceships_ids)
+        for officer in spaceship.officers
+    ]
+
+
+# Statement for inserting spaceships returning generated primary keys in order of rows:
+def insert_spaceships_statement():
+    return insert(models.Spaceship).returning(models.Spaceship.id, sort_by_parameter_order=True)
+
+
+# Function for bulk adding of streamed spaceships with their officers in one transaction:
+def add_spaceships_bulk(engine, spaceships):
+    spaceships = list(spaceships)
+
+    if not spaceships:
+        return 0
+
+    spaceships_rows = [spaceship_to_row(spaceship) for spaceship in spaceships]
+
+    with database.session_scope(engine) as session:
+        spaceships_ids = session.scalars(insert_spaceships_statement(), spaceships_rows).all()
+        officers_rows = officers_to_rows(spaceships, spaceships_rows, spaceships_ids)
+
+        if officers_rows:
+            session.execute(insert(models.Officer), officers_rows)
+
+    return len(spaceships_ids)
+
+
+# Async function for bulk adding of spaceships with their officers in one transaction:
+async def add_spaceships_bulk_async(spaceships, engine=None):
+    if not spaceships:
+        return 0
+
+    spaceships_rows = [spaceship_to_row(spaceship) for spaceship in spaceships]
 
-    for spaceship in session.query(models.Spaceship):
-        status.append(spaceship.alignment)
+    async with database.async_session_scope(engine) as session:
+        spaceships_ids = (await session.scalars(insert_spaceships_statement(), spaceships_rows)).all()
+        officers_rows = officers_to_rows(spaceships, spaceships_rows, spaceships_ids)
 
-    session.close()
+        if officers_rows:
+            await session.execute(insert(models.Officer), officers_rows)
+
+    return len(spaceships_ids)
+
+
+# Async consumer of ships stream, batches are written while next ships are received:
+async def ingest_stream_async(coordinates, engine=None, batch_size=100):
+    tasks = []
+    batch = []
+
+    async with grpc.aio.insecure_channel("localhost:55555") as channel:
+        stub = ex00_pb2_grpc.Ex00Stub(channel)
+
+        async for spaceship in stub.GetShips(coordinates):
+            batch.append(spaceship)
+
+            if len(batch) == batch_size:
+                tasks.append(asyncio.create_task(add_spaceships_bulk_async(batch, engine)))
+                batch = []
+
+    if batch:
+        tasks.append(asyncio.create_task(add_spaceships_bulk_async(batch, engine)))
+
+    return sum(await asyncio.gather(*tasks))
+
+
+# Async function for writing stream of ships with shared async engine disposed after:
+async def run_async_ingestion(coordinates):
+    try:
+        return await ingest_stream_async(coordinates)
+    finally:
+        await database.dispose_async_engines()
+
+
+# Function for adding spaceships one by one (previous ingestion path):
+def add_spaceships_by_row(engine, spaceships):
+    count = 0
+
+    for ship in spaceships:
+        add_spaceship(engine, ship)
+
+        # Add officers:
+        for officer in ship.officers:
+            index = find_last_index(engine)
+            status = find_last_status(engine)
+            add_officer(engine, officer, index, status)
+
+        count += 1
+
+    return count
+
+
+# Function to find status of last spaceship:
+def find_last_status(engine):
+    with database.session_scope(engine) as session:
+        status = session.scalars(select(models.Spaceship.alignment).order_by(models.Spaceship.id)).all()
 
     if len(status) > 0:
         return status[-1]
@@ -147,13 +240,8 @@ def find_last_status(engine):
 
 # Function to find max id of spaceship:
 def find_last_index(engine):
-    index = []
-    session = Session(engine)
-
-    for spaceship in session.query(models.Spaceship):
-        index.append(spaceship.id)
-
-    session.close()
+    with database.session_scope(engine) as session:
+        index = session.scalars(select(models.Spaceship.id).order_by(models.Spaceship.id)).all()
 
     if len(index) > 0:
         return index[-1]
@@ -163,36 +251,36 @@ def find_last_index(engine):
 
 # Function for argument list_traitors:
 def print_traitors(engine):
-    session = Session(engine)
-
-    for traitor in session.query(models.Traitors):
-        print("{ first_name: " + traitor.first_name +
-              ", last_name: " + traitor.last_name +
-              ", rank: " + traitor.rank +
-              " }"
-              )
-
-    session.close()
+    with database.session_scope(engine) as session:
+        for traitor in session.scalars(select(models.Traitors)):
+            print("{ first_name: " + traitor.first_name +
+                  ", last_name: " + traitor.last_name +
+                  ", rank: " + traitor.rank +
+                  " }"
+                  )
 
 
-# Print all spaceships:
+# Print all spaceships passing checker with their officers:
 def print_spaceships(engine):
-    session = Session(engine)
+    with database.session_scope(engine) as session:
+        spaceships = session.scalars(
+            select(models.Spaceship)
+            .options(selectinload(models.Spaceship.officers))
+            .where(checker_clause())
+            .order_by(models.Spaceship.id)
+        )
 
-    for spaceship in session.query(models.Spaceship):
-        if checker(spaceship):
+        for spaceship in spaceships:
             print("{ alignment: " + spaceship.alignment +
                   ", name: " + spaceship.name +
                   ", class: " + spaceship.type +
                   ", length: " + str(spaceship.length) +
                   ", crew_size: " + str(spaceship.crew_size) +
                   ", armed: " + spaceship.armed +
-                  ", officers: " + find_officers(engine, spaceship.id) +
+                  ", officers: " + format_officers(spaceship.officers) +
                   " }"
                   )
 
-    session.close()
-
 
 # Functions for deserialization:
 def bytes_to_alignment(alignment):
@@ -203,34 +291,26 @@ def bytes_to_class(class_):
     return class_list[class_]
 
 
-# Functions for checking ship:
-def checker(spaceship):
-    if ((spaceship.type == "Corvette") and (80 <= spaceship.length <= 250) and (4 <= spaceship.crew_size <= 10) and
-            spaceship.armed and (spaceship.alignment == "Enemy")):
-        return True
-    elif ((spaceship.type == "Frigate") and (300 <= spaceship.length <= 600) and (10 <= spaceship.crew_size <= 15) and
-          spaceship.armed and (spaceship.alignment == "Ally")):
-        return True
-    elif ((spaceship.type == "Cruiser") and (500 <= spaceship.length <= 1000) and (15 <= spaceship.crew_size <= 30) and
-          spaceship.armed and (spaceship.alignment == "Enemy")):
-        return True
-    elif ((spaceship.type == "Destroyer") and (800 <= spaceship.length <= 1000) and (50 <= spaceship.crew_size <= 80)
-          and spaceship.armed and (spaceship.alignment == "Ally")):
-        return True
-    elif ((spaceship.type == "Carrier") and (1000 <= spaceship.length <= 4000) and (120 <= spaceship.crew_size <= 250)
-          and (not spaceship.armed) and (spaceship.alignment == "Enemy")):
-        return True
-    elif ((spaceship.type == "Dreadnought") and (5000 <= spaceship.length <= 20000)
-          and (300 <= spaceship.crew_size <= 500) and spaceship.armed and (spaceship.alignment == "Enemy")):
-        return True
-
-    return False
+# Function for checking ships in SQL (armed is stored as text, "true"/"false" or "1"/"0"):
+def checker_clause():
+    armed = cast(models.Spaceship.armed, Boolean)
+
+    return or_(*(
+        and_(
+            models.Spaceship.type == type_,
+            models.Spaceship.length.between(min_length, max_length),
+            models.Spaceship.crew_size.between(min_crew_size, max_crew_size),
+            armed if is_armed else not_(armed),
+            models.Spaceship.alignment == alignment
+        )
+        for type_, min_length, max_length, min_crew_size, max_crew_size, is_armed, alignment in checker_rules
+    ))
 
 
 # Main process function:
 def run():
     if (len(sys.argv) == 2) and (sys.argv[-1] == "list_traitors"):  # list traitors case
-        engine = create_connection(arguments.USER_NAME, arguments.USER_PASSWORD, arguments.DATABASE_NAME)
+        engine = database.get_engine()
 
         create_tables(engine)
         print_traitors(engine)
@@ -238,10 +318,12 @@ def run():
         try:
             if (int(sys.argv[2]) >= -90) and (int(sys.argv[2]) <= 90) and (int(sys.argv[3]) >= 0) and (
                     int(sys.argv[3]) <= 360):
-                engine = create_connection(arguments.USER_NAME, arguments.USER_PASSWORD, arguments.DATABASE_NAME)
+                engine = database.get_engine()
 
                 create_tables(engine)
-                find_traitors(engine)
+
+                if create_traitors_index(engine):
+                    find_traitors(engine)
             else:
                 print("ERROR! INCORRECT ARGUMENTS VALUE.")
 
@@ -261,22 +343,17 @@ def run():
                         int(sys.argv[2]) <= 360):
 
                     try:
-                        engine = create_connection(arguments.USER_NAME, arguments.USER_PASSWORD,
-                                                   arguments.DATABASE_NAME)
+                        engine = database.get_engine()
                         # delete_tables(engine)  # If you want to clear database
                         create_tables(engine)
 
                     except Exception:
                         exit()
 
-                    for ship in stub.GetShips(coordinates):  # Check all ships
-                        add_spaceship(engine, ship)
-
-                        # Add officers:
-                        for officer in ship.officers:
-                            index = find_last_index(engine)
-                            status = find_last_status(engine)
-                            add_officer(engine, officer, index, status)
+                    if arguments.USE_ASYNC_ENGINE:  # Write batches of the stream without blocking on each ship
+                        asyncio.run(run_async_ingestion(coordinates))
+                    else:
+                        add_spaceships_bulk(engine, stub.GetShips(coordinates))  # Add all ships of the stream
 
                     print_spaceships(engine)
 
@@ -0,0 +1,105 @@
+# Necessary modules:
+import grpc
+import asyncio
+import ex00_pb2
+import arguments
+import ex00_pb2_grpc
+import numpy as np
+
+from reporting_server import ship_list, name_list, surname_list, rank_list
+
+# Compression algorithms of messages:
+compressions = {"none": grpc.Compression.NoCompression, "deflate": grpc.Compression.Deflate,
+                "gzip": grpc.Compression.Gzip}
+
+
+class ShipGenerator:
+    # Generator of ships pre-built in batches with seeded vectorized RNG:
+    def __init__(self, seed=None, batch_size=4096):
+        self.rng = np.random.default_rng(seed)
+        self.batch_size = batch_size
+        self.ships = []
+        self.position = 0
+
+    # Function for building batch of ships with one RNG call per field:
+    def build_ships(self, count):
+        alignments = self.rng.integers(0, 2, count)
+        names = self.rng.integers(0, np.where(alignments == 1, len(ship_list), len(ship_list) - 1))  # "Unknown" enemies
+        types = self.rng.integers(0, 6, count)
+        lengths = self.rng.integers(0, 20001, count) + np.round(self.rng.random(count), 1)
+        sizes = self.rng.integers(1, 651, count)
+        armed = self.rng.integers(0, 2, count).astype(bool)
+        officers_counts = self.rng.integers(0, 11, count)
+        officers_ends = np.cumsum(officers_counts)
+        officers = self.rng.integers(0, [len(name_list), len(surname_list), len(rank_list)],
+                                     (officers_ends[-1] if count else 0, 3))  # Each column with its list length
+        ships = []
+
+        for i in range(count):
+            ship = ex00_pb2.Spaceship(
+                alignment=int(alignments[i]),
+                name=ship_list[names[i]],
+                type=int(types[i]),
+                length=float(lengths[i]),
+                size=int(sizes[i]),
+                armed=bool(armed[i]),
+            )
+
+            for first_name, last_name, rank in officers[officers_ends[i] - officers_counts[i]:officers_ends[i]]:
+                ship.officers.add(first_name=name_list[first_name], last_name=surname_list[last_name],
+                                  rank=rank_list[rank])
+
+            ships.append(ship)
+
+        return ships
+
+    # Function for getting ships of one stream (from 0 to 10 ships, as in the first server):
+    def get_stream(self):
+        count = int(self.rng.integers(0, 11))
+
+        if self.position + count > len(self.ships):
+            self.ships = self.ships[self.position:] + self.build_ships(max(self.batch_size, count))
+            self.position = 0
+
+        stream = self.ships[self.position:self.position + count]
+        self.position += count
+
+        return stream
+
+
+class AsyncEx00Servicer(ex00_pb2_grpc.Ex00Servicer):
+    def __init__(self, generator=None):
+        self.generator = generator or ShipGenerator()
+
+    async def GetShips(self, request, context):
+        # Check coordinate data:
+        if (request.height >= -90) and (request.height <= 90) and (request.azimuth >= 0) and (request.azimuth <= 360):
+            for ship in self.generator.get_stream():
+                yield ship
+
+
+# Function for creating async server:
+def create_server(port=arguments.SERVER_PORT, seed=arguments.SERVER_SEED, batch_size=arguments.SERVER_BATCH_SIZE,
+                  max_concurrent_streams=arguments.SERVER_MAX_CONCURRENT_STREAMS,
+                  max_concurrent_rpcs=arguments.SERVER_MAX_CONCURRENT_RPCS, compression=arguments.SERVER_COMPRESSION):
+    server = grpc.aio.server(
+        options=[("grpc.max_concurrent_streams", max_concurrent_streams)],  # Streams of one connection
+        maximum_concurrent_rpcs=max_concurrent_rpcs,  # Streams of server, others are rejected
+        compression=compressions[compression],
+    )
+    ex00_pb2_grpc.add_Ex00Servicer_to_server(AsyncEx00Servicer(ShipGenerator(seed, batch_size)), server)
+    port = server.add_insecure_port("[::]:" + str(port))
+
+    return server, port
+
+
+async def serve():  # Function for working the server:
+    server, _ = create_server()
+
+    await server.start()
+    await server.wait_for_termination()
+
+
+# Test case:
+if __name__ == "__main__":
+    asyncio.run(serve())
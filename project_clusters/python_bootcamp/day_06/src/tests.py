@@ -1,4 +1,12 @@
+from sqlalchemy import delete
+
+# Necessary modules:
+import models
+import ex00_pb2
+import database
 import subprocess
+import reporting_server
+import reporting_client_v3
 
 
 # Function for checking output of commands:
@@ -15,7 +23,50 @@ def check_command(command, expected_output, test_number):
         print("*********Тест - не пройден!*********\n")
 
 
+# Function for checking result of function working with database:
+def check_value(value, expected_value, test_number):
+    print("************Тест № ", test_number, ':************', sep='')
+    print("Ожидаемое значение:\n", expected_value, sep='')
+    print("Наше значение:\n", value, sep='')
+
+    if value == expected_value:  # Check are they equal
+        print("*********Тест - пройден!*********\n")
+    else:
+        print("*********Тест - не пройден!*********\n")
+
+
+# Function for checking database functions on in-memory database of shared engine module:
+def check_database(test_number):
+    engine = database.create_engine("sqlite://")
+    servicer = reporting_server.Ex00Servicer()
+    coordinates = ex00_pb2.Coordinate(height=45, azimuth=45)
+    streams = [list(servicer.GetShips(coordinates, None)) for _ in range(10)]
+
+    reporting_client_v3.create_tables(engine)
+
+    # All streamed ships are added:
+    check_value(sum(reporting_client_v3.add_spaceships_bulk(engine, stream) for stream in streams),
+                sum(len(stream) for stream in streams), test_number)
+
+    # Second search of traitors adds nothing:
+    reporting_client_v3.find_traitors(engine)
+    check_value(reporting_client_v3.find_traitors(engine), 0, test_number + 1)
+
+    # Session scope rolls back on error:
+    try:
+        with database.session_scope(engine) as session:
+            session.execute(delete(models.Spaceship))
+            raise ValueError
+    except ValueError:
+        pass
+
+    check_value(reporting_client_v3.find_last_index(engine), sum(len(stream) for stream in streams), test_number + 2)
+
+    engine.dispose()
+
+
 if __name__ == "__main__":
+
     # Test cases:
     number = 1
     ex00_command_one = "python reporting_client.py"
@@ -55,6 +106,10 @@ if __name__ == "__main__":
 
     check_command(ex00_command_seven, ex00_expected_output_five, number)
 
+    number = 8
+
+    check_database(number)
+
     for i in range(25):
         ex01_command_one = "python reporting_client_v2.py 45 45"
 